@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""여러 (디자인, 설계서) 쌍을 프로세스 풀에서 일괄 검수"""
+import glob
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from design_checker import DesignChecker
+
+SUMMARY_FILE = "batch_summary.json"
+
+
+def load_manifest(manifest_file: str) -> List[Tuple[str, str]]:
+    """매니페스트 JSON에서 (디자인, 설계서) 쌍 목록 로드
+
+    형식: {"pairs": [{"design": "a.json", "spec": "spec.json"}, ...]} 또는 쌍 목록 자체.
+    상대 경로는 매니페스트 파일 위치를 기준으로 합니다.
+    """
+    with open(manifest_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_file))
+    entries = data.get('pairs', []) if isinstance(data, dict) else data
+    pairs = []
+    for entry in entries:
+        if isinstance(entry, dict):
+            design_file, spec_file = entry['design'], entry['spec']
+        else:
+            design_file, spec_file = entry
+        pairs.append((os.path.join(base_dir, design_file), os.path.join(base_dir, spec_file)))
+    return pairs
+
+
+def pairs_from_glob(pattern: str, spec_file: str) -> List[Tuple[str, str]]:
+    """패턴에 맞는 모든 디자인 파일을 같은 설계서와 짝지음"""
+    return [(design_file, spec_file) for design_file in sorted(glob.glob(pattern, recursive=True))]
+
+
+def _report_name(index: int, design_file: str, spec_file: str) -> str:
+    design_stem = os.path.splitext(os.path.basename(design_file))[0]
+    spec_stem = os.path.splitext(os.path.basename(spec_file))[0]
+    return f"{index + 1:03d}_{design_stem}__{spec_stem}.html"
+
+
+def _snapshot_name(design_file: str, spec_file: str) -> str:
+    """쌍별 스냅샷 파일 이름 (매니페스트 순서가 바뀌어도 같은 쌍은 같은 이름)"""
+    design_stem = os.path.splitext(os.path.basename(design_file))[0]
+    spec_stem = os.path.splitext(os.path.basename(spec_file))[0]
+    digest = hashlib.sha256(f"{os.path.abspath(design_file)}\0{os.path.abspath(spec_file)}".encode('utf-8'))
+    return f"{design_stem}__{spec_stem}_{digest.hexdigest()[:8]}.json"
+
+
+def _check_pair(job: Tuple[int, str, str, str, str, Dict[str, Any], Optional[str], bool]) -> Dict[str, Any]:
+    """워커 프로세스에서 쌍 하나를 검수하고 요약 반환"""
+    index, design_file, spec_file, output_dir, report_format, checker_options, snapshot_dir, find_orphans = job
+    report_file = os.path.join(output_dir, _report_name(index, design_file, spec_file))
+    snapshot_file = os.path.join(snapshot_dir, _snapshot_name(design_file, spec_file)) if snapshot_dir else None
+    summary = {'design': design_file, 'spec': spec_file, 'report': report_file}
+    if snapshot_file:
+        summary['snapshot'] = snapshot_file
+    start = time.perf_counter()
+    try:
+        # run_check는 설계서 파일이 없으면 빈 설계서로 검수하므로 여기서 실패로 처리
+        if not os.path.isfile(spec_file):
+            raise FileNotFoundError(f"설계서 파일 {spec_file}을 찾을 수 없습니다.")
+        checker = DesignChecker(**checker_options)
+        checker.run_check(design_file, spec_file, report_file=report_file, verbose=False,
+                          snapshot_file=snapshot_file, report_format=report_format, find_orphans=find_orphans)
+        specs = checker.matches + checker.issues
+        summary.update({
+            'status': 'ok',
+            'text_elements': len(checker.design_elements),
+            'spec_items': len(specs),
+            'complete': sum(1 for m in checker.matches if m['status'] == 'complete'),
+            'partial': sum(1 for m in checker.matches if m['status'] == 'partial'),
+            'missing': len(checker.issues),
+            'implementation_rate': (sum(s['implementation_rate'] for s in specs) / len(specs)) if specs else 0,
+            'metrics': checker.metrics.to_dict(),
+        })
+        if checker.orphans is not None:
+            summary['orphan_texts'] = sum(group['count'] for group in checker.orphans)
+    except Exception as e:
+        summary.update({'status': 'error', 'error': f"{type(e).__name__}: {e}"})
+    summary['elapsed'] = round(time.perf_counter() - start, 3)
+    return summary
+
+
+def run_batch(pairs: List[Tuple[str, str]], output_dir: str = "reports",
+              workers: int = None, chunksize: int = 1, report_format: str = "html",
+              checker_options: Optional[Dict[str, Any]] = None, snapshot_dir: Optional[str] = None,
+              find_orphans: bool = False) -> Dict[str, Any]:
+    """모든 쌍을 검수하고 쌍별 보고서와 전체 요약(batch_summary.json)을 저장
+
+    checker_options는 DesignChecker 생성 인자 (matcher, top_k, spec_cache_dir)입니다.
+    spec_cache_dir를 주면 같은 설계서를 워커마다 다시 컴파일하지 않습니다.
+    snapshot_dir를 주면 쌍마다 그 안의 스냅샷 파일로 증분 검수하고 스냅샷을 갱신하며,
+    find_orphans=True이면 쌍마다 설계서에 없는 디자인 텍스트도 찾습니다 (run_check 인자와 같음).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if snapshot_dir:
+        os.makedirs(snapshot_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    jobs = [(index, design_file, spec_file, output_dir, report_format, checker_options or {},
+             snapshot_dir, find_orphans)
+            for index, (design_file, spec_file) in enumerate(pairs)]
+
+    print(f"🔍 {len(jobs)}개 디자인을 {workers}개 프로세스로 일괄 검수합니다...")
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for result in executor.map(_check_pair, jobs, chunksize=max(1, chunksize)):
+            if result['status'] == 'ok':
+                print(f"   ✅ {result['design']}: 완전 {result['complete']} / 부분 {result['partial']} / "
+                      f"미구현 {result['missing']} ({result['elapsed']:.2f}s)")
+            else:
+                print(f"   ❌ {result['design']}: {result['error']}")
+            results.append(result)
+
+    succeeded = [r for r in results if r['status'] == 'ok']
+    summary = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'workers': workers,
+        'elapsed': round(time.perf_counter() - start, 3),
+        'total': len(results),
+        'succeeded': len(succeeded),
+        'failed': len(results) - len(succeeded),
+        'spec_items': sum(r['spec_items'] for r in succeeded),
+        'complete': sum(r['complete'] for r in succeeded),
+        'partial': sum(r['partial'] for r in succeeded),
+        'missing': sum(r['missing'] for r in succeeded),
+        'results': results,
+    }
+    summary_file = os.path.join(output_dir, SUMMARY_FILE)
+    with open(summary_file, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    print(f"📊 요약: 성공 {summary['succeeded']}개, 실패 {summary['failed']}개 ({summary['elapsed']:.2f}s)")
+    print(f"✅ 일괄 검수 완료! 요약이 {summary_file}에 저장되었습니다.")
+    return summary
@@ -0,0 +1,844 @@
+#!/usr/bin/env python3
+"""디자인 검수 성능 측정 스크립트"""
+import argparse
+import asyncio
+import gc
+import json
+import multiprocessing
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows: 최대 RSS 측정 생략
+    resource = None
+
+import json_backend
+from design_checker import (DEFAULT_DESCEND_KEYS, PROPERTY_DEFAULTS, DesignChecker, SpecificationElement,
+                            _build_text_element, _element_column, _extract_text_content, _walk_text_nodes,
+                            extract_pages_parallel)
+from node_hierarchy import HierarchyIndex
+from text_matcher import MATCHER_PRESETS, get_matcher
+from report_writer import (ISSUE_TABLE_HEAD, MATCH_TABLE_HEAD, REPORT_HEAD, REPORT_TAIL, write_html_report,
+                           write_report_data)
+from synthetic_figma import (FakeFigmaServer, add_document_arguments, add_generator_arguments, count_nodes,
+                             document_from_args, generate_document, generate_from_args, make_text)
+from figma_async import FigmaRequest, fetch_and_extract, node_requests
+from spec_index import CompiledSpec
+
+def legacy_traverse_nodes(node, path=""):
+    """비교 기준: 모든 dict/list 값을 재귀로 내려가며 단계마다 경로 문자열을 만드는 이전 구현"""
+    elements = []
+
+    def traverse_nodes(node, path=""):
+        if isinstance(node, dict):
+            if node.get('type') == 'TEXT':
+                element = _build_text_element(node, path)
+                if element is not None:
+                    elements.append(element)
+            for key, value in node.items():
+                if isinstance(value, (dict, list)):
+                    traverse_nodes(value, f"{path}.{key}" if path else key)
+        elif isinstance(node, list):
+            for i, item in enumerate(node):
+                traverse_nodes(item, f"{path}[{i}]")
+
+    traverse_nodes(node, path)
+    return elements
+
+
+@dataclass
+class LegacyDesignElement:
+    """비교 기준: 속성 dict를 요소마다 복사해 두던 이전 DesignElement"""
+    id: str
+    name: str
+    type: str
+    text_content: str
+    description: str
+    path: str
+    properties: Dict[str, Any]
+
+
+def legacy_build_text_element(node, path):
+    text_content = _extract_text_content(node)
+    if not text_content.strip():
+        return None
+    return LegacyDesignElement(
+        id=node.get('id', ''),
+        name=node.get('name', ''),
+        type=node.get('type', ''),
+        text_content=text_content.strip(),
+        description=node.get('description', ''),
+        path=path,
+        properties={key: node.get(key, default()) for key, default in PROPERTY_DEFAULTS},
+    )
+
+
+def make_synthetic_results(spec_count: int, texts_per_spec: int = 5, seed: int = 0):
+    """보고서 측정용 (matches, issues) 합성 검수 결과"""
+    rng = random.Random(seed)
+    matches, issues = [], []
+    for spec_id in range(spec_count):
+        required = [make_text(rng) for _ in range(texts_per_spec)]
+        found_count = rng.randint(0, texts_per_spec)
+        rate = found_count / texts_per_spec
+        result = {
+            'spec_id': str(spec_id),
+            'spec_name': f'설계서 항목 {spec_id}',
+            'required_texts': required,
+            'found_texts': [{'required': text, 'found': text, 'match_type': 'exact'} for text in required[:found_count]],
+            'missing_texts': required[found_count:],
+            'implementation_rate': rate,
+            'status': 'complete' if rate == 1.0 else 'partial' if rate > 0 else 'missing',
+        }
+        (matches if found_count else issues).append(result)
+    return matches, issues
+
+
+def legacy_compare_scoped(checker, spec_elements):
+    """이전 범위 검색: 범위마다 그 서브트리 요소만으로 색인을 새로 만들어 비교"""
+    design_elements = checker.design_elements
+    hierarchy = HierarchyIndex(_element_column(design_elements, 'parent'))
+    indexes = {}
+    results = []
+    for spec in spec_elements:
+        scope = (spec.page, spec.frame)
+        scoped = indexes.get(scope)
+        if scoped is None:
+            elements = [design_elements[index] for index in hierarchy.scope_indices(*scope)]
+            scoped = indexes[scope] = (elements, checker.build_text_index(elements))
+        results.append(checker.check_text_implementation(spec, *scoped))
+    return results
+
+
+def legacy_generate_html_report(matches, issues):
+    """비교 기준: 문자열 하나에 += 로 이어 붙이던 이전 보고서 생성 방식"""
+    html_content = REPORT_HEAD + "<body>" + MATCH_TABLE_HEAD
+    for match in matches:
+        html_content += f"""
+                        <tr>
+                            <td><span class="spec-id">{match['spec_id']}</span></td>
+                            <td><strong>{match['spec_name']}</strong></td>
+                            <td class="text-list">
+            """
+        for text in match['required_texts']:
+            html_content += f'<div class="text-detail">{text}</div>'
+        html_content += """
+                            </td>
+                            <td class="text-list">
+            """
+        for found in match['found_texts']:
+            html_content += f'<div class="text-detail found-text">✓ {found["found"]}</div>'
+        for missing in match['missing_texts']:
+            html_content += f'<div class="text-detail missing-text">✗ {missing}</div>'
+        html_content += f"""
+                            </td>
+                            <td class="rate">{match['implementation_rate']:.1%}</td>
+                            <td><span class="status-{match['status']}">{'완전 구현' if match['status'] == 'complete' else '부분 구현'}</span></td>
+                        </tr>
+            """
+    html_content += ISSUE_TABLE_HEAD
+    for issue in issues:
+        html_content += f"""
+                        <tr>
+                            <td><span class="spec-id">{issue['spec_id']}</span></td>
+                            <td><strong>{issue['spec_name']}</strong></td>
+                            <td class="text-list">
+            """
+        for text in issue['required_texts']:
+            html_content += f'<div class="text-detail missing-text">✗ {text}</div>'
+        html_content += """
+                            </td>
+                            <td><span class="status-missing">모든 필요한 텍스트가 구현되지 않았습니다.</span></td>
+                        </tr>
+            """
+    html_content += REPORT_TAIL
+    return html_content
+
+
+def _measure_peak(func):
+    """tracemalloc 최대 메모리 측정 (추적 비용 때문에 시간은 따로 잼)"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _timed(func, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def make_document(args) -> dict:
+    """생성 옵션(시드 포함)대로 synthetic_figma 합성 문서를 만들고 크기를 출력"""
+    print(f"🧪 합성 문서 생성 중... (시드 {args.seed}, 페이지 {args.pages}개 × 화면 {args.screens}개, "
+          f"깊이 {args.depth}, 노드 최대 {args.max_nodes:,}개)")
+    document = document_from_args(args)
+    print(f"   - 노드 {count_nodes(document):,}개")
+    return document
+
+
+def bench_walker(args):
+    document = make_document(args)
+
+    try:
+        legacy_time, legacy = _timed(lambda: legacy_traverse_nodes(document), args.repeat)
+        print(f"   - 이전 재귀 순회:          {legacy_time:8.3f}s  ({len(legacy):,}개 텍스트)")
+    except RecursionError:
+        legacy = None
+        print("   - 이전 재귀 순회:          RecursionError")
+
+    full_time, full = _timed(lambda: list(_walk_text_nodes(document, None)), args.repeat)
+    print(f"   - 반복 순회 (전체 키):      {full_time:8.3f}s  ({len(full):,}개 텍스트)")
+
+    children_time, children = _timed(lambda: list(_walk_text_nodes(document, DEFAULT_DESCEND_KEYS)), args.repeat)
+    print(f"   - 반복 순회 (children만):   {children_time:8.3f}s  ({len(children):,}개 텍스트)")
+
+    if legacy is not None:
+        if legacy != full or legacy != children:
+            print("❌ 순회 결과가 이전 구현과 다릅니다.")
+            return 1
+        print(f"✅ 결과 일치, children 순회가 {legacy_time / children_time:.1f}배 빠릅니다.")
+    return 0
+
+
+def make_synthetic_texts(count: int, seed: int = 0):
+    """synthetic_figma의 UI 문구에 띄어쓰기/전각/접미어 변형을 섞은 디자인 텍스트"""
+    rng = random.Random(seed)
+    texts = []
+    for i in range(count):
+        text = make_text(rng)
+        roll = rng.random()
+        if roll < 0.2:
+            text = text.replace(' ', '')
+        elif roll < 0.3:
+            text = text.translate({code: code + 0xFEE0 for code in range(0x21, 0x7F)})  # 전각 문자
+        elif roll < 0.6:
+            text = f"{text} {i}"
+        texts.append(text)
+    return texts
+
+
+def bench_match(args):
+    print(f"🧪 합성 텍스트 생성 중... (디자인 텍스트 {args.texts:,}개, 조회 {args.queries:,}개)")
+    texts = make_synthetic_texts(args.texts, args.seed)
+    rng = random.Random(args.seed + 1)
+    queries = []
+    for _ in range(args.queries):
+        query = make_text(rng)
+        if rng.random() < 0.5:
+            # 오타: 글자 하나를 다른 글자로 바꿈
+            position = rng.randrange(len(query))
+            query = query[:position] + '룰' + query[position + 1:]
+        queries.append(query)
+
+    for name in MATCHER_PRESETS:
+        start = time.perf_counter()
+        index = get_matcher(name, args.fuzzy_threshold).index(texts)
+        build_time = time.perf_counter() - start
+        start = time.perf_counter()
+        counts = {}
+        for query in queries:
+            match = index.find_first(query)
+            match_type = match[1] if match is not None else 'missing'
+            counts[match_type] = counts.get(match_type, 0) + 1
+        query_time = time.perf_counter() - start
+        detail = ', '.join(f"{key} {value:,}" for key, value in sorted(counts.items()))
+        print(f"   - {name:<15} 색인 {build_time:6.3f}s  조회 {query_time:6.3f}s  ({detail})")
+    return 0
+
+
+def _retained(build):
+    """build()가 만든 객체가 유지하는 메모리 (tracemalloc 기준)"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        return tracemalloc.get_traced_memory()[0] - before, result
+    finally:
+        tracemalloc.stop()
+
+
+def _retained_without_source(load, build):
+    """load()로 읽은 문서를 버린 뒤에도 build(문서)의 결과가 유지하는 메모리 (tracemalloc 기준)"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        source = load()
+        result = build(source)
+        del source
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0] - before, result
+    finally:
+        tracemalloc.stop()
+
+
+def _text_nodes(document):
+    nodes = []
+    stack = [(document['document'], 'document')]
+    while stack:
+        node, path = stack.pop()
+        if node.get('type') == 'TEXT':
+            nodes.append((node, path))
+        for i, child in enumerate(node.get('children', ())):
+            stack.append((child, f"{path}.children[{i}]"))
+    return nodes
+
+
+def bench_elements(args):
+    document = make_document(args)
+    # 파싱된 JSON처럼 노드마다 객체가 따로 있도록 측정할 때마다 직렬화한 문서를 다시 읽고,
+    # 요소를 만든 뒤 문서를 버려 요소가 문서 값을 붙잡고 있는 만큼도 함께 잼
+    serialized = json.dumps(document, ensure_ascii=False)
+    del document
+
+    def load():
+        return json.loads(serialized)
+
+    legacy_size, legacy = _retained_without_source(
+        load, lambda document: [legacy_build_text_element(node, path) for node, path in _text_nodes(document)])
+    print(f"   - 이전 dataclass + 속성 dict: {legacy_size / 1024 / 1024:8.1f}MB  ({len(legacy):,}개 요소)")
+    del legacy
+    slotted_size, slotted = _retained_without_source(
+        load, lambda document: [_build_text_element(node, path) for node, path in _text_nodes(document)])
+    print(f"   - __slots__ + 지연 속성:      {slotted_size / 1024 / 1024:8.1f}MB  ({len(slotted):,}개 요소)")
+    print(f"✅ 요소 메모리 {legacy_size / max(slotted_size, 1):.1f}배 절감 (문서를 버린 뒤, 경로 문자열 포함)")
+    return 0
+
+
+def bench_report(args):
+    print(f"🧪 합성 검수 결과 생성 중... (설계서 항목 {args.specs:,}개)")
+    matches, issues = make_synthetic_results(args.specs, args.texts_per_spec, args.seed)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        legacy_path = os.path.join(temp_dir, 'legacy.html')
+        streaming_path = os.path.join(temp_dir, 'streaming.html')
+        data_path = os.path.join(temp_dir, 'report.ndjson')
+
+        def legacy():
+            html_content = legacy_generate_html_report(matches, issues)
+            with open(legacy_path, 'w', encoding='utf-8') as f:
+                f.write(html_content)
+
+        def streaming():
+            with open(streaming_path, 'w', encoding='utf-8') as f:
+                write_html_report(f, matches, issues)
+
+        def data():
+            with open(data_path, 'w', encoding='utf-8') as f:
+                write_report_data(f, matches, issues)
+
+        legacy_time, _ = _timed(legacy, args.repeat)
+        legacy_peak = _measure_peak(legacy)
+        print(f"   - 이전 문자열 연결:   {legacy_time:7.3f}s  최대 메모리 {legacy_peak / 1024 / 1024:8.1f}MB  "
+              f"({os.path.getsize(legacy_path) / 1024 / 1024:.1f}MB)")
+        streaming_time, _ = _timed(streaming, args.repeat)
+        streaming_peak = _measure_peak(streaming)
+        print(f"   - 스트리밍 렌더러:    {streaming_time:7.3f}s  최대 메모리 {streaming_peak / 1024 / 1024:8.1f}MB  "
+              f"({os.path.getsize(streaming_path) / 1024 / 1024:.1f}MB)")
+        data_time, _ = _timed(data, args.repeat)
+        data_peak = _measure_peak(data)
+        print(f"   - NDJSON 데이터:      {data_time:7.3f}s  최대 메모리 {data_peak / 1024 / 1024:8.1f}MB  "
+              f"({os.path.getsize(data_path) / 1024 / 1024:.1f}MB)")
+    return 0
+
+
+def make_scoped_specs(document: dict, spec_count: int, texts_per_spec: int = 3, seed: int = 0):
+    """최상위 프레임마다 그 안의 텍스트를 필요 텍스트로 가지는 설계서 항목 (범위 지정/미지정 쌍)"""
+    rng = random.Random(seed)
+    frames = []
+    for page in document['document']['children']:
+        for frame in page.get('children', []):
+            texts = [element.text_content for element in _walk_text_nodes(frame)]
+            if texts:
+                frames.append((frame['id'], texts))
+    scoped, unscoped = [], []
+    for i in range(spec_count):
+        frame_id, texts = rng.choice(frames)
+        # 다른 프레임의 텍스트도 섞어서 범위 밖의 같은 텍스트로 통과하지 않는지 확인
+        design_texts = [rng.choice(texts) if rng.random() < 0.7 else rng.choice(rng.choice(frames)[1])
+                        for _ in range(texts_per_spec)]
+        fields = dict(id=f'SPEC-{i:05d}', name=f'항목 {i}', text_content='', description='', category='',
+                      priority='', design_texts=design_texts)
+        scoped.append(SpecificationElement(frame=frame_id, **fields))
+        unscoped.append(SpecificationElement(**fields))
+    return scoped, unscoped
+
+
+def bench_scope(args):
+    document = make_document(args)
+    print(f"   - 설계서 항목 {args.specs:,}개")
+    scoped, unscoped = make_scoped_specs(document, args.specs, args.texts_per_spec, args.seed)
+    checker = DesignChecker(get_matcher(args.matcher, args.fuzzy_threshold))
+    checker.design_elements = checker.extract_design_elements(document)
+
+    results = []
+    for label, specs in (('전체 검색:      ', unscoped), ('프레임 범위:    ', scoped)):
+        checker.spec_elements = specs
+        elapsed, (matches, issues) = _timed(checker.compare_elements, args.repeat)
+        results.append({result['spec_id']: result for result in matches + issues})
+        print(f"   - {label} {elapsed:7.3f}s  ({len(matches):,}개 구현됨, {len(issues):,}개 미구현)")
+    legacy_time, legacy = _timed(lambda: legacy_compare_scoped(checker, scoped), args.repeat)
+    print(f"   - 이전 범위별 색인:  {legacy_time:7.3f}s  (범위마다 색인을 새로 만듦)")
+    unscoped_results, scoped_results = results
+    if {result['spec_id']: result for result in legacy} != scoped_results:
+        print("❌ 파일 전체 색인을 범위로 거른 결과가 범위별 색인과 다릅니다.")
+        return 1
+    changed = sum(1 for spec_id, result in unscoped_results.items()
+                  if scoped_results[spec_id]['status'] != result['status'])
+    print(f"✅ 범위를 지정하면 {changed:,}개 항목의 결과가 달라집니다 (다른 프레임의 같은 텍스트로 통과하지 않음).")
+    return 0
+
+
+def bench_spec(args):
+    document, specification = generate_from_args(args)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        spec_file = os.path.join(temp_dir, 'specification.json')
+        with open(spec_file, 'w', encoding='utf-8') as f:
+            json.dump(specification, f, ensure_ascii=False)
+        checker = DesignChecker(get_matcher(args.matcher), spec_cache_dir=os.path.join(temp_dir, 'specs'))
+        specs = checker.load_specification_from_file(spec_file)
+        required = sum(len(spec.design_texts) for spec in specs)
+        compiled = CompiledSpec(specs)
+        print(f"🧪 설계서 항목 {len(specs):,}개, 필요 텍스트 {required:,}개 (고유 {len(compiled.texts):,}개)")
+
+        uncached = DesignChecker(checker.matcher)
+        load_time, _ = _timed(lambda: checker.load_specification_from_file(spec_file), args.repeat)
+        compile_time, _ = _timed(lambda: uncached.load_compiled_specification(spec_file), args.repeat)
+        checker.load_compiled_specification(spec_file)
+        reload_time, reloaded = _timed(lambda: checker.load_compiled_specification(spec_file), args.repeat)
+        print(f"   - JSON 로드:              {load_time:8.3f}s")
+        print(f"   - JSON 로드 + 컴파일:     {compile_time:8.3f}s")
+        print(f"   - 컴파일 결과 다시 읽기:  {reload_time:8.3f}s  ({compile_time / reload_time:.1f}배)")
+
+    checker.design_elements = checker.extract_design_elements(document)
+
+    def per_spec():
+        # 항목마다 필요 텍스트를 따로 조회 (이전 방식)
+        checker._reset_indexes()
+        return [checker.check_text_implementation(spec, *checker.spec_search_space(spec)) for spec in specs]
+
+    def by_text():
+        checker._reset_indexes()
+        return checker._evaluate_specs(reloaded)
+
+    per_spec_time, expected = _timed(per_spec, args.repeat)
+    by_text_time, (matches, issues) = _timed(by_text, args.repeat)
+    print(f"   - 항목별 조회:            {per_spec_time:8.3f}s")
+    print(f"   - 고유 텍스트별 조회:     {by_text_time:8.3f}s  ({per_spec_time / by_text_time:.2f}배, 색인 생성 포함)")
+    if sorted(matches + issues, key=lambda result: result['spec_id']) != sorted(
+            expected, key=lambda result: result['spec_id']):
+        print("❌ 컴파일된 설계서의 검수 결과가 항목별 조회와 다릅니다.")
+        return 1
+    print("✅ 결과 일치")
+    return 0
+
+
+def _node_chain(element):
+    node = element.parent
+    chain = []
+    while node is not None:
+        chain.append((node.id, node.name, node.type))
+        node = node.parent
+    return chain
+
+
+def bench_pages(args):
+    print(f"🧪 합성 문서 생성 중... (페이지 {args.pages}개 × 화면 {args.screens}개, 깊이 {args.depth})")
+    document = generate_document(args.seed, args.pages, args.screens, args.depth, args.fanout)
+    print(f"   - 노드 {count_nodes(document):,}개, CPU 코어 {os.cpu_count()}개")
+
+    serial_time, serial = _timed(lambda: list(_walk_text_nodes(document)), args.repeat)
+    print(f"   - 직렬 순회:          {serial_time:8.3f}s  ({len(serial):,}개 텍스트)")
+    serial_chains = [_node_chain(element) for element in serial]
+    for workers in args.workers:
+        elapsed, parallel = _timed(lambda: extract_pages_parallel(document, workers=workers), args.repeat)
+        print(f"   - 페이지 병렬 ({workers:>2}개): {elapsed:8.3f}s  ({serial_time / elapsed:.2f}배)")
+        if parallel != serial or [_node_chain(element) for element in parallel] != serial_chains:
+            print("❌ 페이지 병렬 추출 결과(경로/ID/상위 노드)가 직렬 순회와 다릅니다.")
+            return 1
+    print("✅ 결과 일치 (경로, ID, 상위 노드 순서 포함)")
+    return 0
+
+
+def bench_parse(args):
+    if args.design:
+        with open(args.design, 'rb') as f:
+            data = f.read()
+    else:
+        document, _ = generate_from_args(args)
+        data = json.dumps(document, ensure_ascii=False).encode('utf-8')
+        del document
+    size_mb = len(data) / 1024 / 1024
+    print(f"🧪 JSON {size_mb:.1f}MB 파싱, 사용 가능한 백엔드: {', '.join(json_backend.BACKENDS)} "
+          f"(기본 {json_backend.BACKEND})")
+
+    def timed_parse(parse):
+        # 이전 결과를 먼저 해제해 해제 비용이 다음 측정에 섞이지 않도록 함
+        best = None
+        for _ in range(args.repeat):
+            parsed = None
+            start = time.perf_counter()
+            parsed = parse()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best, parsed
+
+    # 이전 방식: 텍스트로 디코딩한 뒤 표준 json으로 파싱 (GC 켜짐)
+    baseline_time, expected = timed_parse(lambda: json.loads(data.decode('utf-8')))
+    print(f"   - json (str 디코딩 후):  {baseline_time:8.3f}s  ({size_mb / baseline_time:7.1f} MB/s)")
+    for name in json_backend.BACKENDS:
+        elapsed, parsed = timed_parse(lambda: json_backend.loads(data, name))
+        print(f"   - {name + ' (bytes)':<20} {elapsed:8.3f}s  ({size_mb / elapsed:7.1f} MB/s, "
+              f"{baseline_time / elapsed:.2f}배)")
+        if parsed != expected:
+            print(f"❌ {name} 파싱 결과가 표준 json과 다릅니다.")
+            return 1
+    print("✅ 모든 백엔드의 파싱 결과가 같습니다.")
+    return 0
+
+
+def _fetch_extract(requests, server, concurrency):
+    """(전체 시간, 첫 추출 결과까지 시간, 요청별 요소 수)"""
+    async def run():
+        start = time.perf_counter()
+        first = None
+        counts = {}
+        async for request, elements in fetch_and_extract(requests, 'token', base_url=server.base_url,
+                                                          concurrency=concurrency, backoff=0.05):
+            first = first or time.perf_counter() - start
+            counts[request] = len(elements)
+        return time.perf_counter() - start, first, counts
+    return asyncio.run(run())
+
+
+def bench_fetch(args):
+    documents = {f"FILE{index:03d}": generate_document(args.seed + index, args.pages, args.screens, args.depth,
+                                                        args.fanout)
+                 for index in range(args.files)}
+    # 첫 파일은 화면 프레임 단위 /nodes 요청으로도 받음
+    first_key = next(iter(documents))
+    screen_ids = [screen['id'] for page in documents[first_key]['document']['children'] for screen in page['children']]
+    cases = (('파일', [FigmaRequest(key) for key in documents]),
+             ('노드 묶음', node_requests(first_key, screen_ids, args.batch_size)))
+    print(f"🧪 가짜 피그마 서버: 파일 {args.files}개, 응답 지연 {args.latency}s, "
+          f"{args.rate_limit_every or '-'}번째 요청마다 429 (Retry-After {args.retry_after}s)")
+
+    for label, requests in cases:
+        results = {}
+        for concurrency in (1, args.concurrency):
+            with FakeFigmaServer(documents, latency=args.latency, rate_limit_every=args.rate_limit_every,
+                                 retry_after=args.retry_after) as server:
+                elapsed, first, counts = _fetch_extract(requests, server, concurrency)
+            results[concurrency] = counts
+            print(f"   - {label} {len(requests)}개, 동시 {concurrency:>2}: {elapsed:7.3f}s  "
+                  f"(첫 추출 {first:.3f}s, 요청 {server.request_count}회, 최대 동시 {server.max_inflight})")
+        if results[1] != results[args.concurrency]:
+            print(f"❌ {label}: 동시 조회 결과가 순차 조회와 다릅니다.")
+            return 1
+    print("✅ 동시 조회 결과가 순차 조회와 같습니다.")
+    return 0
+
+
+# 단계별 측정 (단계마다 새 프로세스에서 실행해 최대 RSS를 따로 잼)
+SUITE_STAGES = ('parse', 'extract', 'extract_stream', 'compare', 'report_html', 'report_data')
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """현재 프로세스의 최대 RSS (MB)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def _percentile(sorted_samples: List[float], q: float) -> float:
+    """정렬된 표본의 q 분위수 (선형 보간)"""
+    if len(sorted_samples) == 1:
+        return sorted_samples[0]
+    position = (len(sorted_samples) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_samples) - 1)
+    return sorted_samples[lower] + (sorted_samples[upper] - sorted_samples[lower]) * (position - lower)
+
+
+def _run_suite_stage(stage: str, design_file: str, spec_file: str, repeat: int, matcher: str,
+                     work_dir: str) -> Dict[str, Any]:
+    """워커 프로세스에서 단계 하나를 repeat번 실행하고 (실행 시간, 지연 표본, RSS) 반환
+
+    compare의 지연 표본은 설계서 항목 하나의 평가 시간, 나머지는 실행 한 번의 시간입니다.
+    """
+    checker = DesignChecker(get_matcher(matcher))
+    output_bytes = 0
+    if stage == 'parse':
+        with open(design_file, 'rb') as f:
+            data = f.read()
+        run = lambda: json_backend.loads(data)
+    elif stage in ('extract', 'extract_stream'):
+        run = lambda: checker.extract_design_elements(design_file, stream=stage == 'extract_stream')
+    else:
+        checker.design_elements = checker.extract_design_elements(design_file)
+        checker.spec_elements = checker.load_specification_from_file(spec_file)
+        if stage == 'compare':
+            latencies = []
+
+            def run():
+                # compare_elements와 같은 순서로 평가하면서 항목별 시간 기록
+                checker._reset_indexes()
+                for spec_elem in checker.spec_elements:
+                    start = time.perf_counter()
+                    checker.check_text_implementation(spec_elem, *checker.spec_search_space(spec_elem))
+                    latencies.append(time.perf_counter() - start)
+        else:
+            matches, issues = checker.compare_elements()
+            write = write_html_report if stage == 'report_html' else write_report_data
+            output_file = os.path.join(work_dir, f'{stage}.out')
+
+            def run():
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    write(f, matches, issues)
+
+    setup_rss = _peak_rss_mb()
+    walls = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        walls.append(time.perf_counter() - start)
+    if stage == 'compare':
+        samples = latencies
+    else:
+        samples = walls
+        if stage.startswith('report'):
+            output_bytes = os.path.getsize(output_file)
+    return {'walls': walls, 'samples': samples, 'setup_rss_mb': setup_rss, 'peak_rss_mb': _peak_rss_mb(),
+            'output_bytes': output_bytes}
+
+
+def _stage_summary(raw: Dict[str, Any], units: float, unit: str) -> Dict[str, Any]:
+    walls = sorted(raw['walls'])
+    samples = sorted(raw['samples'])
+    median = _percentile(walls, 0.5)
+    summary = {
+        'runs': len(walls),
+        'wall_s': {'min': walls[0], 'median': median, 'max': walls[-1]},
+        'unit': unit,
+        'units': units,
+        'throughput': units / median if median else None,
+        'latency_ms': {name: _percentile(samples, q) * 1000
+                       for name, q in (('p50', 0.5), ('p90', 0.9), ('p99', 0.99), ('max', 1.0))},
+        'latency_samples': len(samples),
+        'setup_rss_mb': raw['setup_rss_mb'],
+        'peak_rss_mb': raw['peak_rss_mb'],
+    }
+    if raw['output_bytes']:
+        summary['output_bytes'] = raw['output_bytes']
+    return summary
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _compare_with_baseline(results: Dict[str, Any], baseline_file: str, tolerance: float) -> int:
+    """기준 결과와 단계별 중앙값 실행 시간을 비교 (tolerance보다 느려진 단계가 있으면 1)"""
+    with open(baseline_file, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('params') != results['params']:
+        print("⚠️ 기준 결과와 측정 조건(params)이 다릅니다. 비교 결과를 참고만 하세요.")
+    print(f"📈 기준 결과 비교 ({baseline.get('commit') or baseline_file} → {results.get('commit') or '현재'})")
+    regressions = 0
+    for stage, current in results['stages'].items():
+        previous = baseline.get('stages', {}).get(stage)
+        if previous is None:
+            continue
+        ratio = current['wall_s']['median'] / previous['wall_s']['median']
+        mark = '🔺' if ratio > 1 + tolerance else '✅'
+        regressions += ratio > 1 + tolerance
+        print(f"   {mark} {stage:<15} {previous['wall_s']['median']:8.3f}s → {current['wall_s']['median']:8.3f}s "
+              f"({ratio:.2f}배)")
+    if regressions:
+        print(f"❌ {regressions}개 단계가 {tolerance:.0%} 넘게 느려졌습니다.")
+        return 1
+    return 0
+
+
+def bench_suite(args):
+    stages = args.stages or list(SUITE_STAGES)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if args.design:
+            design_file, spec_file = args.design, args.spec
+            with open(design_file, 'r', encoding='utf-8') as f:
+                node_count = count_nodes(json.load(f))
+            params = {'design': os.path.basename(design_file), 'spec': os.path.basename(spec_file)}
+        else:
+            document, specification = generate_from_args(args)
+            node_count = count_nodes(document)
+            design_file = os.path.join(temp_dir, 'design.json')
+            spec_file = os.path.join(temp_dir, 'specification.json')
+            with open(design_file, 'w', encoding='utf-8') as f:
+                json.dump(document, f, ensure_ascii=False)
+            with open(spec_file, 'w', encoding='utf-8') as f:
+                json.dump(specification, f, ensure_ascii=False)
+            del document, specification
+            params = {key: getattr(args, key.replace('-', '_')) for key in (
+                'seed', 'pages', 'screens', 'depth', 'fanout', 'text-ratio', 'korean-ratio', 'max-nodes',
+                'specs', 'texts-per-spec', 'missing-ratio', 'scoped-ratio')}
+        params.update({'matcher': args.matcher, 'repeat': args.repeat})
+        with open(spec_file, 'r', encoding='utf-8') as f:
+            spec_count = len(json.load(f).get('specifications', []))
+        design_bytes = os.path.getsize(design_file)
+        print(f"🧪 노드 {node_count:,}개 ({design_bytes / 1024 / 1024:.1f}MB), 설계서 항목 {spec_count:,}개, "
+              f"{args.repeat}회 반복")
+
+        units = {'parse': (design_bytes / 1024 / 1024, 'MB'), 'extract': (node_count, 'nodes'),
+                 'extract_stream': (node_count, 'nodes'), 'compare': (spec_count, 'specs'),
+                 'report_html': (spec_count, 'specs'), 'report_data': (spec_count, 'specs')}
+        results = {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'json_backend': json_backend.BACKEND,
+            'params': params,
+            'nodes': node_count,
+            'stages': {},
+        }
+        # 단계마다 새 인터프리터에서 실행 (앞 단계의 메모리/캐시가 섞이지 않도록)
+        context = multiprocessing.get_context('spawn')
+        for stage in stages:
+            with context.Pool(1) as pool:
+                raw = pool.apply(_run_suite_stage, (stage, design_file, spec_file, args.repeat, args.matcher,
+                                                          temp_dir))
+            summary = results['stages'][stage] = _stage_summary(raw, *units[stage])
+            latency = summary['latency_ms']
+            rss = f"{summary['peak_rss_mb']:8.1f}MB" if summary['peak_rss_mb'] is not None else '       -'
+            print(f"   - {stage:<15} {summary['wall_s']['median']:8.3f}s  "
+                  f"{summary['throughput']:12,.1f} {summary['unit']}/s  "
+                  f"p50 {latency['p50']:9.3f}ms  p90 {latency['p90']:9.3f}ms  p99 {latency['p99']:9.3f}ms  "
+                  f"최대 RSS {rss}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"💾 측정 결과를 {args.output}에 저장했습니다.")
+    if args.baseline:
+        return _compare_with_baseline(results, args.baseline, args.tolerance)
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='디자인 검수 성능 측정')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    walker = subparsers.add_parser('walker', help='노드 순회 비교 (이전 재귀 순회 vs 반복 순회)')
+    add_document_arguments(walker)
+    walker.set_defaults(pages=10, screens=200, depth=6, max_nodes=500_000)
+    walker.add_argument('--repeat', type=int, default=3)
+    walker.set_defaults(func=bench_walker)
+
+    elements = subparsers.add_parser('elements', help='DesignElement 메모리 비교 (dataclass vs __slots__)')
+    add_document_arguments(elements)
+    elements.set_defaults(pages=10, screens=200, depth=6, max_nodes=300_000)
+    elements.set_defaults(func=bench_elements)
+
+    match = subparsers.add_parser('match', help='텍스트 매칭 방식별 색인/조회 시간 비교')
+    match.add_argument('--texts', type=int, default=100_000)
+    match.add_argument('--queries', type=int, default=10_000)
+    match.add_argument('--fuzzy-threshold', type=float, default=0.7)
+    match.add_argument('--seed', type=int, default=0)
+    match.set_defaults(func=bench_match)
+
+    report = subparsers.add_parser('report', help='보고서 생성 비교 (문자열 연결 vs 스트리밍 HTML vs NDJSON)')
+    report.add_argument('--specs', type=int, default=50_000)
+    report.add_argument('--texts-per-spec', type=int, default=5)
+    report.add_argument('--seed', type=int, default=0)
+    report.add_argument('--repeat', type=int, default=3)
+    report.set_defaults(func=bench_report)
+
+    scope = subparsers.add_parser('scope', help='설계서 항목 매칭 비교 (파일 전체 검색 vs 프레임 범위 검색 vs 이전 범위별 색인)')
+    add_document_arguments(scope)
+    scope.set_defaults(pages=10, screens=40, depth=6, max_nodes=50_000)
+    scope.add_argument('--specs', type=int, default=5_000)
+    scope.add_argument('--texts-per-spec', type=int, default=3)
+    scope.add_argument('--matcher', choices=list(MATCHER_PRESETS), default='fuzzy')
+    scope.add_argument('--fuzzy-threshold', type=float, default=0.7)
+    scope.add_argument('--repeat', type=int, default=3)
+    scope.set_defaults(func=bench_scope)
+
+    spec = subparsers.add_parser('spec', help='설계서 비교 (JSON 로드 vs 컴파일 결과 재사용, 항목별 vs 고유 텍스트별 조회)')
+    add_generator_arguments(spec)
+    spec.add_argument('--matcher', choices=list(MATCHER_PRESETS), default='normalized')
+    spec.add_argument('--repeat', type=int, default=3)
+    spec.set_defaults(func=bench_spec)
+
+    pages = subparsers.add_parser('pages', help='큰 파일 추출 비교 (직렬 순회 vs 페이지별 프로세스 병렬)')
+    pages.add_argument('--pages', type=int, default=8)
+    pages.add_argument('--screens', type=int, default=60, help='페이지당 화면 프레임 수')
+    pages.add_argument('--depth', type=int, default=5)
+    pages.add_argument('--fanout', type=int, default=4)
+    pages.add_argument('--workers', type=int, nargs='+', default=sorted({2, 4, os.cpu_count() or 1}))
+    pages.add_argument('--repeat', type=int, default=3)
+    pages.add_argument('--seed', type=int, default=0)
+    pages.set_defaults(func=bench_pages)
+
+    parse = subparsers.add_parser('parse', help='JSON 파싱 비교 (표준 json vs 설치된 빠른 백엔드)')
+    add_generator_arguments(parse)
+    parse.add_argument('--design', help='합성 문서 대신 파싱할 피그마 JSON')
+    parse.add_argument('--repeat', type=int, default=3)
+    parse.set_defaults(func=bench_parse)
+
+    fetch = subparsers.add_parser('fetch', help='피그마 조회 비교 (순차 vs 동시, 로컬 가짜 서버)')
+    fetch.add_argument('--files', type=int, default=16)
+    fetch.add_argument('--pages', type=int, default=2)
+    fetch.add_argument('--screens', type=int, default=8, help='페이지당 화면 프레임 수')
+    fetch.add_argument('--depth', type=int, default=4)
+    fetch.add_argument('--fanout', type=int, default=4)
+    fetch.add_argument('--batch-size', type=int, default=2, help='/nodes 요청 하나의 화면 프레임 수')
+    fetch.add_argument('--concurrency', type=int, default=8)
+    fetch.add_argument('--latency', type=float, default=0.2, help='가짜 서버 응답 지연 (초)')
+    fetch.add_argument('--rate-limit-every', type=int, default=7, help='N번째 요청마다 429 (0이면 없음)')
+    fetch.add_argument('--retry-after', type=float, default=0.5)
+    fetch.add_argument('--seed', type=int, default=0)
+    fetch.set_defaults(func=bench_fetch)
+
+    suite = subparsers.add_parser('suite', help='단계별 처리량/지연 분위수/최대 RSS 측정 (합성 문서 또는 주어진 파일)')
+    add_generator_arguments(suite)
+    suite.add_argument('--design', help='합성 문서 대신 측정할 피그마 JSON')
+    suite.add_argument('--spec', help='--design과 함께 쓸 설계서 JSON')
+    suite.add_argument('--stages', nargs='+', choices=SUITE_STAGES)
+    suite.add_argument('--matcher', choices=list(MATCHER_PRESETS), default='normalized')
+    suite.add_argument('--repeat', type=int, default=5)
+    suite.add_argument('--output', help='측정 결과 JSON 저장 경로')
+    suite.add_argument('--baseline', help='비교할 이전 측정 결과 JSON')
+    suite.add_argument('--tolerance', type=float, default=0.1, help='회귀로 볼 실행 시간 증가 비율')
+    suite.set_defaults(func=bench_suite)
+
+    args = parser.parse_args(argv)
+    if args.command == 'suite' and args.design and not args.spec:
+        parser.error('--design에는 --spec이 필요합니다.')
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""검수 단계별 측정값 (실행 시간, CPU 시간, 최대 메모리 할당, 처리한 노드/바이트 수)
+
+run_check와 웹 분석 파이프라인이 단계마다 CheckMetrics.stage()로 감싸 측정하고,
+MetricsRegistry는 여러 번의 검수를 누적해 Prometheus 텍스트 형식으로 내보냅니다.
+웹 앱에서는 여러 분석이 스레드에서 동시에 실행되므로 CPU 시간은 단계를 실행한 스레드의 것만 잽니다.
+"""
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+
+@dataclass
+class StageMetrics:
+    """단계 하나의 측정값
+
+    cpu_seconds는 단계를 실행한 스레드의 CPU 시간입니다 (단계가 쓴 다른 스레드/프로세스는 제외).
+    peak_allocated_bytes는 메모리 추적(trace_memory)을 켰을 때만 기록되는 단계 중 최대 할당량으로,
+    프로세스 전체 기준이므로 검수를 하나씩 실행하는 명령행(--profile)에서만 켭니다.
+    """
+    name: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_allocated_bytes: Optional[int] = None
+    nodes: Optional[int] = None
+    items: Optional[int] = None
+    bytes_read: Optional[int] = None
+    bytes_written: Optional[int] = None
+
+
+@dataclass
+class CheckMetrics:
+    """검수 한 번의 단계별 측정 결과"""
+    stages: List[StageMetrics] = field(default_factory=list)
+    trace_memory: bool = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageMetrics]:
+        """with 블록 하나를 단계로 측정 (블록 안에서 nodes/items/bytes 값을 채움)"""
+        metrics = StageMetrics(name)
+        tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        elif self.trace_memory:
+            tracemalloc.reset_peak()
+        cpu_start = time.thread_time()
+        wall_start = time.perf_counter()
+        try:
+            yield metrics
+        finally:
+            metrics.wall_seconds = time.perf_counter() - wall_start
+            metrics.cpu_seconds = time.thread_time() - cpu_start
+            if self.trace_memory:
+                metrics.peak_allocated_bytes = tracemalloc.get_traced_memory()[1]
+                if tracing:
+                    tracemalloc.stop()
+            self.stages.append(metrics)
+
+    def get(self, name: str) -> Optional[StageMetrics]:
+        for metrics in self.stages:
+            if metrics.name == name:
+                return metrics
+        return None
+
+    @property
+    def wall_seconds(self) -> float:
+        return sum(metrics.wall_seconds for metrics in self.stages)
+
+    @property
+    def cpu_seconds(self) -> float:
+        return sum(metrics.cpu_seconds for metrics in self.stages)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'wall_seconds': self.wall_seconds,
+            'cpu_seconds': self.cpu_seconds,
+            'stages': [asdict(metrics) for metrics in self.stages],
+        }
+
+    def format_table(self) -> str:
+        """단계별 측정값 표 (--profile 출력용)"""
+        lines = [f"{'단계':<10} {'실행(s)':>9} {'CPU(s)':>9} {'최대 할당(MB)':>13} "
+                 f"{'노드':>10} {'항목':>8} {'읽음(MB)':>9} {'씀(MB)':>8}"]
+
+        def number(value, scale=1, digits=0):
+            if value is None:
+                return '-'
+            return f"{value / scale:,.{digits}f}"
+
+        for metrics in self.stages:
+            lines.append(
+                f"{metrics.name:<10} {metrics.wall_seconds:>9.3f} {metrics.cpu_seconds:>9.3f} "
+                f"{number(metrics.peak_allocated_bytes, 1024 * 1024, 1):>13} "
+                f"{number(metrics.nodes):>10} {number(metrics.items):>8} "
+                f"{number(metrics.bytes_read, 1024 * 1024, 2):>9} {number(metrics.bytes_written, 1024 * 1024, 2):>8}")
+        lines.append(f"{'합계':<10} {self.wall_seconds:>9.3f} {self.cpu_seconds:>9.3f}")
+        return '\n'.join(lines)
+
+
+# 단계 실행 시간 히스토그램 구간 (초)
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# (측정값 이름, StageMetrics 필드, 설명)
+_STAGE_COUNTERS = (
+    ('cpu_seconds_total', 'cpu_seconds', '단계별 CPU 시간 합계 (단계를 실행한 스레드 기준)'),
+    ('nodes_total', 'nodes', '단계별 방문한 피그마 노드 수 합계'),
+    ('items_total', 'items', '단계별 처리한 항목(요소/설계서 항목) 수 합계'),
+    ('read_bytes_total', 'bytes_read', '단계별 읽은 바이트 수 합계'),
+    ('written_bytes_total', 'bytes_written', '단계별 쓴 바이트 수 합계'),
+)
+
+
+class MetricsRegistry:
+    """검수 측정값 누적 (프로세스 단위, 스레드 안전)"""
+
+    def __init__(self, prefix: str = 'design_check'):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._runs = 0
+        self._failures = 0
+        # 단계 → [구간별 누적 개수..., 합계, 개수]
+        self._durations: Dict[str, List[float]] = {}
+        self._counters: Dict[str, Dict[str, float]] = {name: {} for name, _, _ in _STAGE_COUNTERS}
+        self._last: Dict[str, float] = {}
+
+    def observe(self, metrics: CheckMetrics, failed: bool = False) -> None:
+        with self._lock:
+            self._runs += 1
+            self._failures += failed
+            for stage in metrics.stages:
+                histogram = self._durations.setdefault(stage.name, [0] * (len(DURATION_BUCKETS) + 2))
+                for index, bound in enumerate(DURATION_BUCKETS):
+                    if stage.wall_seconds <= bound:
+                        histogram[index] += 1
+                histogram[-2] += stage.wall_seconds
+                histogram[-1] += 1
+                self._last[stage.name] = stage.wall_seconds
+                for name, attribute, _ in _STAGE_COUNTERS:
+                    value = getattr(stage, attribute)
+                    if value is not None:
+                        counter = self._counters[name]
+                        counter[stage.name] = counter.get(stage.name, 0) + value
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        prefix = self.prefix
+        lines = []
+
+        def header(name, kind, description):
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        with self._lock:
+            header('runs_total', 'counter', '실행한 검수 수')
+            lines.append(f"{prefix}_runs_total {self._runs}")
+            header('failures_total', 'counter', '실패한 검수 수')
+            lines.append(f"{prefix}_failures_total {self._failures}")
+
+            header('stage_duration_seconds', 'histogram', '단계별 실행 시간')
+            for stage, histogram in sorted(self._durations.items()):
+                for bound, count in zip(DURATION_BUCKETS, histogram):
+                    lines.append(f'{prefix}_stage_duration_seconds_bucket{{stage="{stage}",le="{bound}"}} {count}')
+                lines.append(f'{prefix}_stage_duration_seconds_bucket{{stage="{stage}",le="+Inf"}} {histogram[-1]}')
+                lines.append(f'{prefix}_stage_duration_seconds_sum{{stage="{stage}"}} {histogram[-2]}')
+                lines.append(f'{prefix}_stage_duration_seconds_count{{stage="{stage}"}} {histogram[-1]}')
+
+            header('stage_last_duration_seconds', 'gauge', '단계별 마지막 실행 시간')
+            for stage, seconds in sorted(self._last.items()):
+                lines.append(f'{prefix}_stage_last_duration_seconds{{stage="{stage}"}} {seconds}')
+
+            for name, _, description in _STAGE_COUNTERS:
+                header(f"stage_{name}", 'counter', description)
+                for stage, value in sorted(self._counters[name].items()):
+                    lines.append(f'{prefix}_stage_{name}{{stage="{stage}"}} {value}')
+        return '\n'.join(lines) + '\n'
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import os
 import json
+import shutil
 import subprocess
 import webbrowser
 from datetime import datetime
@@ -31,6 +32,11 @@ class GitHubDeployer:
             
             print("✅ index.html 파일이 생성되었습니다.")
         
+        # --format data로 만든 보고서면 뷰어가 읽는 데이터 파일도 함께 복사
+        if os.path.exists("design_text_check_report.ndjson"):
+            shutil.copyfile("design_text_check_report.ndjson", gh_pages_dir / "design_text_check_report.ndjson")
+            print("✅ 보고서 데이터 파일이 복사되었습니다.")
+        
         # README.md 생성
         readme_content = f"""# 피그마 디자인 검수 보고서
 
@@ -163,7 +169,10 @@ jobs:
     
     - name: Run design check
       run: |
-        python3 design_checker.py
+        python3 design_checker.py --format data
+        mkdir -p gh-pages
+        cp design_text_check_report.html gh-pages/index.html
+        cp design_text_check_report.ndjson gh-pages/
     
     - name: Deploy to GitHub Pages
       uses: peaceiris/actions-gh-pages@v3
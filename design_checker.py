@@ -1,21 +1,127 @@
 #!/usr/bin/env python3
+import argparse
+import io
 import json
-import re
-from typing import Dict, List, Any, Tuple
+import multiprocessing
+from typing import IO, Dict, List, Any, Iterator, Optional, Sequence, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 import webbrowser
 import os
+import sys
+
+import json_backend
+from json_stream import iter_json_events
+from report_writer import data_file_for, iter_html_report, render_report_viewer, write_html_report, write_report_data
+from incremental import NodeDiff, affected_spec_ids, build_snapshot, load_snapshot, merge_results, save_snapshot
+from text_matcher import DEFAULT_FUZZY_THRESHOLD, MATCHER_PRESETS, MatchIndex, TextMatcher, get_matcher
+from node_hierarchy import DesignNode, HierarchyIndex
+from text_index import Ranges
+from check_metrics import CheckMetrics
+from reverse_coverage import uncovered_indices
+from spec_index import CompiledSpec, load_compiled_spec, source_digest
+
+# 텍스트 검수에는 쓰이지 않는 스타일/레이아웃 속성 (키, 값이 없을 때 기본값 생성 함수)
+PROPERTY_DEFAULTS: Tuple[Tuple[str, Any], ...] = (
+    ('fills', list),
+    ('strokes', list),
+    ('effects', list),
+    ('constraints', dict),
+    ('layoutMode', str),
+    ('itemSpacing', str),
+    ('paddingLeft', str),
+    ('paddingRight', str),
+    ('paddingTop', str),
+    ('paddingBottom', str),
+)
+PROPERTY_KEYS: Tuple[str, ...] = tuple(key for key, _ in PROPERTY_DEFAULTS)
+
+def _frame_path(path: str) -> str:
+    """노드 경로에서 최상위 프레임 경로 (두 번째 인덱스까지)"""
+    end = -1
+    for _ in range(2):
+        found = path.find(']', end + 1)
+        if found < 0:
+            break
+        end = found
+    return path[:end + 1]
+
+def _element_column(design_elements, field: str) -> List[Any]:
+    """모든 요소의 필드 하나 (ElementStore처럼 column()이 있으면 요소 객체를 만들지 않고 읽음)"""
+    column = getattr(design_elements, 'column', None)
+    if column is not None:
+        return column(field)
+    return [getattr(element, field) for element in design_elements]
 
-@dataclass
 class DesignElement:
-    id: str
-    name: str
-    type: str
-    text_content: str
-    description: str
-    path: str
-    properties: Dict[str, Any]
+    """디자인 텍스트 요소
+
+    요소 수가 수십만 개여도 메모리를 적게 쓰도록 __slots__를 사용하고, properties는 노드 값을
+    참조하지 않고 압축한 JSON 문자열로 들고 있다가 처음 접근할 때 dict로 만듭니다
+    (파싱한 문서를 버리면 fills 등 무거운 값도 함께 해제됨).
+    parent는 가장 가까운 상위 노드(DesignNode)로, 페이지/프레임 범위 매칭에 사용합니다.
+    """
+    __slots__ = ('id', 'name', 'type', 'text_content', 'description', 'path', '_properties', 'parent')
+
+    def __init__(self, id: str, name: str, type: str, text_content: str, description: str, path: str,
+                 properties: Union[Dict[str, Any], str, Tuple[Any, ...], List[Any], None] = None,
+                 parent: DesignNode = None):
+        self.id = id
+        self.name = name
+        self.type = type
+        self.text_content = text_content
+        self.description = description
+        self.path = path
+        # dict (그대로 사용), PROPERTY_KEYS 순서의 값 목록 (없는 값은 None) 또는 그 JSON 문자열,
+        # None (모두 기본값)
+        self._properties = tuple(properties) if isinstance(properties, list) else properties
+        self.parent = parent
+
+    @property
+    def properties(self) -> Dict[str, Any]:
+        properties = self._properties
+        if not isinstance(properties, dict):
+            if isinstance(properties, str):
+                properties = json_backend.loads(properties)
+            values = properties or (None,) * len(PROPERTY_DEFAULTS)
+            properties = {key: default() if value is None else value
+                          for (key, default), value in zip(PROPERTY_DEFAULTS, values)}
+            self._properties = properties
+        return properties
+
+    @properties.setter
+    def properties(self, properties: Dict[str, Any]) -> None:
+        self._properties = properties
+
+    def property_values(self) -> Union[Dict[str, Any], Tuple[Any, ...], None]:
+        """직렬화용 속성 값 (아직 dict로 만들지 않았으면 압축된 JSON 문자열 그대로)"""
+        return self._properties
+
+    @property
+    def frame(self) -> str:
+        """텍스트가 속한 최상위 프레임 경로 (페이지 바로 아래 노드, 더 얕으면 페이지)"""
+        return _frame_path(self.path)
+
+    def _key(self):
+        return (self.id, self.name, self.type, self.text_content, self.description, self.path)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() == other._key() and self.properties == other.properties
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"DesignElement(id={self.id!r}, name={self.name!r}, type={self.type!r}, "
+                f"text_content={self.text_content!r}, description={self.description!r}, path={self.path!r})")
+
+    def __getstate__(self):
+        return self._key() + (self._properties, self.parent)
+
+    def __setstate__(self, state):
+        self.__init__(*state)
 
 @dataclass
 class SpecificationElement:
@@ -26,121 +132,628 @@ class SpecificationElement:
     category: str
     priority: str
     design_texts: List[str]
+    # 검색 범위 (페이지/프레임 ID 또는 이름, 비어 있으면 파일 전체)
+    page: str = ''
+    frame: str = ''
+
+    @property
+    def scoped(self) -> bool:
+        return bool(self.page or self.frame)
+
+# 추출 대상: 파일 경로, 파싱된 JSON, JSON bytes, 파일 객체
+DesignSource = Union[str, os.PathLike, Dict[str, Any], List[Any], bytes, IO]
+
+# 텍스트 요소 생성에 필요한 노드 필드 (스트리밍 추출 시 이 값들만 메모리에 보관)
+_NODE_FIELDS = frozenset((
+    'id', 'name', 'type', 'characters', 'description',
+    'fills', 'strokes', 'effects', 'constraints', 'layoutMode', 'itemSpacing',
+    'paddingLeft', 'paddingRight', 'paddingTop', 'paddingBottom',
+))
+
+# 계층 색인(DesignNode)에 기록하는 노드 필드
+_HIERARCHY_FIELDS = frozenset(('id', 'name', 'type'))
+
+def _node_label(value) -> str:
+    """계층 색인에 기록할 id/name (문자열이 아니면 빈 문자열)"""
+    return _intern(value) if type(value) is str else ''
+
+def _extract_text_content(node) -> str:
+    """노드에서 텍스트 내용 추출"""
+    text_content = ""
+    if isinstance(node, dict):
+        if node.get('type') == 'TEXT':
+            text_content = node.get('characters', '')
+        elif 'characters' in node:
+            text_content = node.get('characters', '')
+        elif 'name' in node:
+            text_content = node.get('name', '')
+    return text_content
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+def _encode_properties(node: Dict[str, Any]) -> Optional[str]:
+    """PROPERTY_KEYS 순서의 노드 값을 JSON 문자열로 (모두 없으면 None)
+
+    요소가 노드의 fills/strokes 등 객체를 참조하지 않도록 복사해 두며, 같은 스타일은 intern해서 공유합니다.
+    """
+    values = tuple(map(node.get, PROPERTY_KEYS))
+    if values.count(None) == len(values):
+        return None
+    return sys.intern(json_backend.dumps(values))
+
+def _build_text_element(node: Dict[str, Any], path: str, parent: DesignNode = None):
+    """TEXT 노드를 DesignElement로 변환 (빈 텍스트면 None)"""
+    text_content = _extract_text_content(node)
+    if not text_content.strip():  # 빈 텍스트가 아닌 경우만
+        return None
+    # 반복되는 이름/타입 문자열은 intern해서 요소끼리 공유
+    return DesignElement(
+        id=node.get('id', ''),
+        name=_intern(node.get('name', '')),
+        type=_intern(node.get('type', '')),
+        text_content=text_content.strip(),
+        description=node.get('description', ''),
+        path=path,
+        properties=_encode_properties(node),
+        parent=parent,
+    )
+
+# 타입이 있는 피그마 노드에서 자식 노드를 찾기 위해 내려가는 기본 키
+DEFAULT_DESCEND_KEYS: Tuple[str, ...] = ('children',)
+
+def _join_path(segments: List[Any], path: str = "") -> str:
+    """경로 조각(키 또는 인덱스)을 traverse 경로 문자열로 변환"""
+    for segment in segments:
+        if isinstance(segment, int):
+            path = f"{path}[{segment}]"
+        else:
+            path = f"{path}.{segment}" if path else segment
+    return path
+
+def _link_path(link, path: str = "") -> str:
+    """(조각, 부모 링크) 형태의 연결 리스트를 경로 문자열로 변환"""
+    segments = []
+    while link is not None:
+        segment, link = link
+        segments.append(segment)
+    segments.reverse()
+    return _join_path(segments, path)
+
+def _resolve_owner(owner) -> DesignNode:
+    """[노드 dict, 부모 항목, DesignNode] 연결 리스트에서 아직 없는 상위 노드 객체를 만들어 반환"""
+    pending = []
+    while owner is not None and owner[2] is None:
+        pending.append(owner)
+        owner = owner[1]
+    parent = owner[2] if owner is not None else None
+    for owner in reversed(pending):
+        data = owner[0]
+        parent = owner[2] = DesignNode(_node_label(data.get('id')), _node_label(data.get('name')),
+                                       _intern(data.get('type')), parent)
+    return parent
+
+def _walk_text_nodes(root, descend_keys=DEFAULT_DESCEND_KEYS, path: str = "",
+                     parent: DesignNode = None, stats: Dict[str, int] = None) -> Iterator[DesignElement]:
+    """명시적 스택으로 JSON 트리를 전위 순회하며 TEXT 요소 반환
+
+    type이 있는 피그마 노드는 descend_keys의 키로만 내려가고(기하 정보, fills 등 생략),
+    type이 없는 래퍼 객체(파일 루트 등)는 모든 값을 탐색합니다.
+    descend_keys가 None이면 모든 dict/list 값을 탐색합니다.
+    경로 문자열과 상위 노드(DesignNode)는 TEXT 노드를 찾았을 때만 만듭니다.
+    상위 노드는 그 전까지 [노드 dict, 부모 항목, DesignNode] 연결 리스트로 들고 다닙니다.
+    stats가 주어지면 순회를 마친 뒤 stats['nodes']에 방문한 객체(dict) 수를 더합니다.
+    """
+    only_key = None
+    if descend_keys is not None:
+        only_key = descend_keys[0] if len(descend_keys) == 1 else None
+        descend_keys = frozenset(descend_keys)
+    containers = (dict, list)
+    stack = [(root, None, None if parent is None else [None, None, parent])]
+    pop = stack.pop
+    push = stack.append
+    visited = 0
+    while stack:
+        node, link, owner = pop()
+        if isinstance(node, dict):
+            visited += 1
+            node_type = node.get('type')
+            if node_type == 'TEXT':
+                element = _build_text_element(node, _link_path(link, path), _resolve_owner(owner))
+                if element is not None:
+                    yield element
+
+            if node_type is None:
+                # type이 없는 래퍼 객체는 계층에 넣지 않음
+                for key, value in reversed(node.items()):
+                    if isinstance(value, containers):
+                        push((value, (key, link), owner))
+            elif only_key is not None:
+                value = node.get(only_key)
+                if isinstance(value, containers):
+                    push((value, (only_key, link), [node, owner, None]))
+            else:
+                child_owner = [node, owner, None]
+                for key, value in reversed(node.items()):
+                    if (descend_keys is None or key in descend_keys) and isinstance(value, containers):
+                        push((value, (key, link), child_owner))
+        elif isinstance(node, list):
+            for i in range(len(node) - 1, -1, -1):
+                item = node[i]
+                if isinstance(item, containers):
+                    push((item, (i, link), owner))
+    if stats is not None:
+        stats['nodes'] = stats.get('nodes', 0) + visited
+
+# 페이지 병렬 추출 워커 프로세스가 읽는 문서 (풀 초기화 때 설정)
+_worker_document = None
+
+def _set_worker_document(data) -> None:
+    global _worker_document
+    _worker_document = data
+
+def _walk_worker_page(task) -> Tuple[List[DesignElement], int]:
+    """워커 프로세스에서 페이지 하나를 순회 (상위 노드 연결은 부모 프로세스에서 함)"""
+    index, path, descend_keys = task
+    stats = {'nodes': 0}
+    page = _worker_document['document']['children'][index]
+    return list(_walk_text_nodes(page, descend_keys, path, stats=stats)), stats['nodes']
+
+def _split_pages(data, descend_keys=DEFAULT_DESCEND_KEYS):
+    """파일 루트를 document.children의 페이지(CANVAS) 단위로 나눈 순회 계획
+
+    (값, 경로, 상위 노드) 목록을 직렬 순회 순서대로 반환하며, 값이 None인 항목은
+    워커가 순회할 페이지입니다 (상위 노드 자리에 페이지 인덱스). 페이지로 나눌 수 없는 구조면 None을 반환합니다.
+    """
+    document = data.get('document') if isinstance(data, dict) and data.get('type') is None else None
+    if not isinstance(document, dict) or document.get('type') in (None, 'TEXT'):
+        return None
+    pages = document.get('children')
+    if not isinstance(pages, list) or (descend_keys is not None and 'children' not in descend_keys):
+        return None
+
+    document_node = DesignNode(_node_label(document.get('id')), _node_label(document.get('name')),
+                               _intern(document.get('type')), None)
+    plan = []
+    for key, value in data.items():
+        if not isinstance(value, (dict, list)):
+            continue
+        if value is not document:
+            plan.append((value, key, None))
+            continue
+        for doc_key, doc_value in document.items():
+            if not isinstance(doc_value, (dict, list)) or (descend_keys is not None and doc_key not in descend_keys):
+                continue
+            if doc_value is not pages:
+                plan.append((doc_value, _join_path([key, doc_key]), document_node))
+                continue
+            for index, page in enumerate(pages):
+                if isinstance(page, (dict, list)):
+                    plan.append((None, _join_path([key, doc_key, index]), index))
+    return plan, document_node
+
+def _relink_pages(elements: List[DesignElement], document_node: DesignNode) -> None:
+    """워커에서 상위 노드 없이 순회한 페이지 요소들을 DOCUMENT 노드 아래로 연결"""
+    seen = set()
+    for element in elements:
+        node = element.parent
+        if node is None:
+            element.parent = document_node
+            continue
+        while id(node) not in seen:
+            seen.add(id(node))
+            if node.parent is None:
+                node.parent = document_node
+                break
+            node = node.parent
+
+def extract_pages_parallel(data, descend_keys=DEFAULT_DESCEND_KEYS, workers: int = None,
+                           stats: Dict[str, int] = None) -> List[DesignElement]:
+    """파싱된 피그마 파일을 페이지(CANVAS)별로 프로세스 풀에서 추출 (_walk_text_nodes와 같은 결과)
+
+    페이지가 둘 이상일 때만 나누고, 페이지 밖의 값은 부모 프로세스에서 순회합니다.
+    fork를 지원하는 환경에서는 워커가 파싱된 문서를 복사 없이 물려받고 결과 요소만 돌려받습니다.
+    """
+    workers = workers or os.cpu_count() or 1
+    split = _split_pages(data, descend_keys) if workers > 1 else None
+    page_count = sum(1 for value, _, _ in split[0] if value is None) if split else 0
+    if page_count < 2:
+        return list(_walk_text_nodes(data, descend_keys, stats=stats))
+
+    plan, document_node = split
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+    elements: List[DesignElement] = []
+    # 파일 루트와 DOCUMENT 객체 방문 수 (직렬 순회와 같게 셈)
+    visited = 2
+    with ProcessPoolExecutor(max_workers=min(workers, page_count), mp_context=context,
+                             initializer=_set_worker_document, initargs=(data,)) as executor:
+        tasks = [(parent, path, descend_keys) for value, path, parent in plan if value is None]
+        pages = iter(executor.map(_walk_worker_page, tasks))
+        for value, path, parent in plan:
+            if value is None:
+                page_elements, page_nodes = next(pages)
+                _relink_pages(page_elements, document_node)
+                elements.extend(page_elements)
+            else:
+                page_stats = {'nodes': 0}
+                elements.extend(_walk_text_nodes(value, descend_keys, path, parent, page_stats))
+                page_nodes = page_stats['nodes']
+            visited += page_nodes
+    if stats is not None:
+        stats['nodes'] = stats.get('nodes', 0) + visited
+    return elements
+
+class _StreamMap:
+    """스트리밍 추출 중 열려 있는 JSON 객체의 상태"""
+    __slots__ = ('fields', 'key', 'typed', 'pending', 'node', 'may_wrap')
+
+    def __init__(self, parent: DesignNode = None, may_wrap: bool = False):
+        self.fields: Dict[str, Any] = {}
+        self.key = None
+        # type 키 유무 (None이면 아직 모름)
+        self.typed = None
+        # 최상위 (또는 래퍼 바로 아래) 객체: type보다 컨테이너 값이 먼저 나오면 type 없는 래퍼로 확정
+        self.may_wrap = may_wrap
+        # 자신의 TEXT 여부/type 유무가 확정되기 전까지 하위에서 발견된 (키, 요소들)을 보류
+        # (None이면 보류하지 않음)
+        self.pending: List[Tuple[str, List[DesignElement]]] = []
+        # 하위 요소의 상위 노드 (id/name/type은 필드가 나올 때 채움)
+        self.node = DesignNode(parent=parent)
+
+class _StreamArray:
+    __slots__ = ('index',)
 
-class DesignChecker:
     def __init__(self):
-        self.design_elements: List[DesignElement] = []
-        self.spec_elements: List[SpecificationElement] = []
+        self.index = 0
+
+def _stream_text_nodes(events: Iterator[Tuple[str, Any]], descend_keys=DEFAULT_DESCEND_KEYS,
+                       stats: Dict[str, int] = None) -> Iterator[DesignElement]:
+    """JSON 파싱 이벤트에서 TEXT 요소를 추출 (_walk_text_nodes와 같은 순서/결과)
+
+    문서 트리를 만들지 않고 열린 객체마다 _NODE_FIELDS 값만 보관합니다.
+    노드 자신이 하위 요소보다 먼저 나오고 descend_keys 규칙도 같게 적용되도록,
+    type이 확정되지 않은 객체 아래에서 발견된 요소는 확정될 때까지 보류합니다.
+    단 파일 루트처럼 최상위 객체(와 래퍼 바로 아래 객체)에서 type보다 컨테이너 값이 먼저 나오면
+    type 없는 래퍼로 확정하고 보류하지 않으므로, 요소를 파싱하는 대로 내보냅니다
+    (그 뒤에 나오는 type은 계층 색인에만 기록).
+    stats는 _walk_text_nodes와 같이 방문한 객체 수를 기록합니다.
+    (type보다 먼저 나온 값은 열어 봐야 하므로 같은 문서라도 더 많이 셀 수 있습니다)
+    """
+    stack: List[Any] = []
+    segments: List[Any] = []
+    # 요소를 보류 중인 열린 객체들 (안쪽이 마지막)
+    holders: List[_StreamMap] = []
+    # 열린 객체들 (안쪽이 마지막)
+    maps: List[_StreamMap] = []
+    ready: List[DesignElement] = []
+    # _NODE_FIELDS 값이 컨테이너일 때 그대로 조립하기 위한 상태
+    building: List[Any] = []
+    build_owner = None
+    build_key = None
+    # 탐색하지 않는 값(기하 정보 등)을 건너뛰는 중첩 깊이
+    skip_depth = 0
+    visited = 0
+
+    def release(elements):
+        if holders:
+            holder = holders[-1]
+            holder.pending.append((holder.key, elements))
+        else:
+            ready.extend(elements)
+
+    def accepted(frame):
+        found = []
+        for key, elements in frame.pending:
+            if not frame.typed or descend_keys is None or key in descend_keys:
+                found.extend(elements)
+        return found
+
+    def settle_wrapper(frame):
+        frame.typed = False
+        holders.pop()
+        found = accepted(frame)
+        frame.pending = None
+        if found:
+            release(found)
+
+    def set_label(frame, key, value):
+        if key == 'type':
+            frame.node.type = _intern(value)
+        else:
+            setattr(frame.node, key, _node_label(value))
+
+    def store_field(frame, key, value):
+        frame.fields[key] = value
+        if key in _HIERARCHY_FIELDS:
+            set_label(frame, key, value)
+        if key == 'type':
+            frame.typed = value is not None
+            if value != 'TEXT' and holders and holders[-1] is frame:
+                holders.pop()
+                found = accepted(frame)
+                frame.pending = None
+                if found:
+                    release(found)
+
+    def value_done():
+        if stack:
+            parent = stack[-1]
+            if isinstance(parent, _StreamArray):
+                parent.index += 1
+
+    for event, value in events:
+        if skip_depth:
+            if event == 'start_map' or event == 'start_array':
+                skip_depth += 1
+            elif event == 'end_map' or event == 'end_array':
+                skip_depth -= 1
+            continue
+
+        if build_owner is not None:
+            # 보관 대상 필드의 컨테이너 값을 조립하는 중
+            if event == 'map_key':
+                building[-1][1] = value
+                continue
+            if event == 'start_map' or event == 'start_array':
+                container = {} if event == 'start_map' else []
+                building.append([container, None])
+                continue
+            if event == 'end_map' or event == 'end_array':
+                container = building.pop()[0]
+                if not building:
+                    owner, key = build_owner, build_key
+                    build_owner = None
+                    store_field(owner, key, container)
+                    if not owner.typed or descend_keys is None or key in descend_keys:
+                        # 조립한 값 안의 TEXT 노드도 순회 규칙대로 포함
+                        nested = list(_walk_text_nodes(container, descend_keys, _join_path(segments + [key]),
+                                                       owner.node, stats))
+                        if nested:
+                            release(nested)
+                    continue
+            else:
+                container = value
+            parent, key = building[-1]
+            if isinstance(parent, dict):
+                parent[key] = container
+            else:
+                parent.append(container)
+            continue
+
+        if event == 'map_key':
+            stack[-1].key = value
+            continue
+
+        if event == 'end_map':
+            frame = stack.pop()
+            maps.pop()
+            if frame.typed is None:
+                frame.typed = False
+            if holders and holders[-1] is frame:
+                holders.pop()
+                found = []
+                if frame.fields.get('type') == 'TEXT':
+                    element = _build_text_element(frame.fields, _join_path(segments), frame.node.parent)
+                    if element is not None:
+                        found.append(element)
+                found.extend(accepted(frame))
+                if found:
+                    release(found)
+            if segments and stack:
+                segments.pop()
+            value_done()
+        elif event == 'end_array':
+            stack.pop()
+            if segments and stack:
+                segments.pop()
+            value_done()
+        else:
+            parent = stack[-1] if stack else None
+            segment = None
+            if isinstance(parent, _StreamMap):
+                segment = parent.key
+                container_start = event == 'start_map' or event == 'start_array'
+                if segment in _NODE_FIELDS and parent.pending is not None:
+                    if container_start:
+                        build_owner, build_key = parent, segment
+                        building.append([{} if event == 'start_map' else [], None])
+                    else:
+                        store_field(parent, segment, value)
+                    continue
+                if segment in _HIERARCHY_FIELDS and not container_start:
+                    # type이 확정된 뒤에 나오는 id/name도 계층 색인에는 기록
+                    set_label(parent, segment, value)
+                if container_start and parent.typed is None and parent.may_wrap:
+                    settle_wrapper(parent)
+                if container_start and parent.typed and descend_keys is not None and segment not in descend_keys:
+                    skip_depth = 1
+                    continue
+            elif parent is not None:
+                segment = parent.index
+
+            if event == 'start_map':
+                if parent is not None:
+                    segments.append(segment)
+                visited += 1
+                if maps:
+                    enclosing = maps[-1]
+                    frame = _StreamMap(enclosing.node, enclosing.may_wrap and enclosing.pending is None
+                                       and not enclosing.typed)
+                else:
+                    frame = _StreamMap(may_wrap=True)
+                maps.append(frame)
+                stack.append(frame)
+                holders.append(frame)
+            elif event == 'start_array':
+                if parent is not None:
+                    segments.append(segment)
+                stack.append(_StreamArray())
+            else:
+                value_done()
+
+        if ready:
+            yield from ready
+            ready.clear()
+
+    if ready:
+        yield from ready
+    if stats is not None:
+        stats['nodes'] = stats.get('nodes', 0) + visited
+
+class DesignChecker:
+    def __init__(self, matcher: TextMatcher = None, top_k: int = 3, extract_workers: int = None,
+                 spec_cache_dir: str = None):
+        self.design_elements: Sequence[DesignElement] = []
+        self.spec_elements: Sequence[SpecificationElement] = []
         self.matches: List[Dict[str, Any]] = []
         self.issues: List[Dict[str, Any]] = []
+        # 텍스트 매칭 규칙 (기본: 유니코드 정규화 + 공백 무시, 유사도 매칭 없음)
+        self.matcher = matcher or get_matcher()
+        # 필요 텍스트마다 기록할 후보 수 (1위 + 대안)
+        self.top_k = max(1, top_k)
+        self.text_index: MatchIndex = None
+        # 범위 지정 항목용 계층 색인과 범위별 요소 인덱스 구간
+        self.hierarchy: HierarchyIndex = None
+        self._scopes: Dict[Tuple[str, str], Ranges] = {}
+        # 마지막 run_check의 단계별 측정값
+        self.metrics: CheckMetrics = None
+        # 설계서에 없는 디자인 텍스트 (run_check(find_orphans=True)일 때만)
+        self.orphans: List[Dict[str, Any]] = None
+        # run_check에서 페이지별 병렬 추출에 쓸 프로세스 수 (None 또는 1이면 직렬)
+        self.extract_workers = extract_workers
+        # 컴파일된 설계서를 저장해 두는 디렉터리 (설계서 내용 해시별 파일, None이면 저장하지 않음)
+        self.spec_cache_dir = spec_cache_dir
         
-    def extract_design_elements(self, json_file: str) -> List[DesignElement]:
-        """피그마 JSON에서 디자인 요소들을 추출"""
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        elements = []
-        
-        def extract_text_content(node):
-            """노드에서 텍스트 내용 추출"""
-            text_content = ""
-            if isinstance(node, dict):
-                if node.get('type') == 'TEXT':
-                    text_content = node.get('characters', '')
-                elif 'characters' in node:
-                    text_content = node.get('characters', '')
-                elif 'name' in node:
-                    text_content = node.get('name', '')
-            return text_content
-        
-        def traverse_nodes(node, path=""):
-            if isinstance(node, dict):
-                # 텍스트 요소만 추출 (TEXT 타입)
-                if node.get('type') == 'TEXT':
-                    text_content = extract_text_content(node)
-                    if text_content.strip():  # 빈 텍스트가 아닌 경우만
-                        element = DesignElement(
-                            id=node.get('id', ''),
-                            name=node.get('name', ''),
-                            type=node.get('type', ''),
-                            text_content=text_content.strip(),
-                            description=node.get('description', ''),
-                            path=path,
-                            properties={
-                                'fills': node.get('fills', []),
-                                'strokes': node.get('strokes', []),
-                                'effects': node.get('effects', []),
-                                'constraints': node.get('constraints', {}),
-                                'layoutMode': node.get('layoutMode', ''),
-                                'itemSpacing': node.get('itemSpacing', ''),
-                                'paddingLeft': node.get('paddingLeft', ''),
-                                'paddingRight': node.get('paddingRight', ''),
-                                'paddingTop': node.get('paddingTop', ''),
-                                'paddingBottom': node.get('paddingBottom', '')
-                            }
-                        )
-                        elements.append(element)
-                
-                # 자식 요소들 탐색
-                for key, value in node.items():
-                    if isinstance(value, (dict, list)):
-                        traverse_nodes(value, f"{path}.{key}" if path else key)
-            elif isinstance(node, list):
-                for i, item in enumerate(node):
-                    traverse_nodes(item, f"{path}[{i}]")
+    def extract_design_elements(self, source: DesignSource, stream: bool = False,
+                                descend_keys=DEFAULT_DESCEND_KEYS, stats: Dict[str, int] = None,
+                                workers: int = None) -> List[DesignElement]:
+        """피그마 JSON에서 디자인 요소들을 추출
+
+        source는 파일 경로, 이미 파싱된 dict/list, JSON bytes, 읽기 가능한 파일 객체 중 하나입니다.
+        stream=True이면 문서 전체를 로드하지 않고 파싱 이벤트를 따라가며 추출합니다.
+        descend_keys는 피그마 노드에서 하위로 내려갈 키 목록이며, None이면 모든 값을 탐색합니다.
+        stats가 주어지면 stats['nodes']에 방문한 노드(객체) 수를 더합니다.
+        workers가 2 이상이면 파싱한 문서를 페이지별로 나눠 프로세스 풀에서 추출합니다 (stream과 함께 쓸 수 없음).
+        """
+        if stream:
+            return list(self.iter_design_elements(source, descend_keys, stats))
+
+        if isinstance(source, (dict, list)):
+            data = source
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            data = json_backend.loads(source)
+        elif hasattr(source, 'read'):
+            data = json_backend.load(source)
+        else:
+            data = json_backend.load_file(source)
         
-        traverse_nodes(data)
-        return elements
+        if workers is not None and workers > 1:
+            return extract_pages_parallel(data, descend_keys, workers, stats)
+        return list(_walk_text_nodes(data, descend_keys, stats=stats))
+    
+    def iter_design_elements(self, source: DesignSource, descend_keys=DEFAULT_DESCEND_KEYS,
+                             stats: Dict[str, int] = None) -> Iterator[DesignElement]:
+        """피그마 JSON을 스트리밍으로 파싱하면서 TEXT 요소를 발견되는 대로 반환"""
+        if isinstance(source, (dict, list)):
+            yield from _walk_text_nodes(source, descend_keys, stats=stats)
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            yield from _stream_text_nodes(iter_json_events(io.BytesIO(source)), descend_keys, stats)
+        elif hasattr(source, 'read'):
+            yield from _stream_text_nodes(iter_json_events(source), descend_keys, stats)
+        else:
+            with open(source, 'rb') as f:
+                yield from _stream_text_nodes(iter_json_events(f), descend_keys, stats)
     
     def load_specification_from_file(self, spec_file: str) -> List[SpecificationElement]:
         """설계서 파일에서 명세 요소들을 로드"""
         try:
-            with open(spec_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            specs = []
-            for item in data.get('specifications', []):
-                spec = SpecificationElement(
-                    id=item.get('id', ''),
-                    name=item.get('name', ''),
-                    text_content=item.get('text_content', ''),
-                    description=item.get('description', ''),
-                    category=item.get('category', ''),
-                    priority=item.get('priority', ''),
-                    design_texts=item.get('design_texts', [])
-                )
-                specs.append(spec)
-            return specs
+            return self._specs_from_data(json_backend.load_file(spec_file))
         except FileNotFoundError:
             print(f"설계서 파일 {spec_file}을 찾을 수 없습니다.")
             return []
     
-    def check_text_implementation(self, spec_elem: SpecificationElement, design_elements: List[DesignElement]) -> Dict[str, Any]:
-        """설계서의 디자인 텍스트들이 실제 디자인에 구현되어 있는지 확인"""
+    def load_compiled_specification(self, spec_file: str) -> CompiledSpec:
+        """설계서를 로드해 컴파일 (spec_cache_dir에 같은 내용의 컴파일 결과가 있으면 그대로 읽음)"""
+        try:
+            with open(spec_file, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            print(f"설계서 파일 {spec_file}을 찾을 수 없습니다.")
+            return CompiledSpec([])
+        
+        digest = source_digest(raw)
+        cache_file = os.path.join(self.spec_cache_dir, f"{digest}.spec") if self.spec_cache_dir else None
+        if cache_file:
+            compiled = load_compiled_spec(cache_file, digest)
+            if compiled is not None:
+                return compiled
+        
+        compiled = CompiledSpec(self._specs_from_data(json_backend.loads(raw)), digest)
+        compiled.normalized_texts(self.matcher)
+        if cache_file:
+            os.makedirs(self.spec_cache_dir, exist_ok=True)
+            compiled.save(cache_file)
+        return compiled
+    
+    @staticmethod
+    def _specs_from_data(data: Dict[str, Any]) -> List[SpecificationElement]:
+        specs = []
+        for item in data.get('specifications', []):
+            spec = SpecificationElement(
+                id=item.get('id', ''),
+                name=item.get('name', ''),
+                text_content=item.get('text_content', ''),
+                description=item.get('description', ''),
+                category=item.get('category', ''),
+                priority=item.get('priority', ''),
+                design_texts=item.get('design_texts', []),
+                page=item.get('page', ''),
+                frame=item.get('frame', '')
+            )
+            specs.append(spec)
+        return specs
+    
+    def check_text_implementation(self, spec_elem: SpecificationElement, design_elements: Sequence[DesignElement],
+                                  text_index: MatchIndex = None, scope: Ranges = None) -> Dict[str, Any]:
+        """설계서의 디자인 텍스트들이 실제 디자인에 구현되어 있는지 확인 (scope가 있으면 그 구간의 요소만)"""
+        # 디자인 텍스트 색인 (여러 항목을 검사할 때는 compare_elements에서 한 번만 생성)
+        if text_index is None:
+            text_index = self.build_text_index(design_elements)
+        
+        # 필요 텍스트별 후보를 한 번에 순위 매김 (일치 > 정규화 일치 > 포함 > 유사도, 같은 프레임 우선)
+        ranked = text_index.resolve(spec_elem.design_texts, self.top_k, scope)
+        return self._implementation_result(spec_elem, design_elements, text_index, ranked)
+    
+    def _implementation_result(self, spec_elem: SpecificationElement, design_elements: Sequence[DesignElement],
+                               text_index: MatchIndex, ranked: List[List[Tuple[int, str, float]]]) -> Dict[str, Any]:
+        """필요 텍스트별 순위 매긴 후보로 항목 하나의 검수 결과 생성"""
         required_texts = spec_elem.design_texts
         found_texts = []
         missing_texts = []
         
-        # 디자인에서 모든 텍스트 수집
-        all_design_texts = [elem.text_content for elem in design_elements]
-        
-        for required_text in required_texts:
-            found = False
-            for design_text in all_design_texts:
-                # 정확한 매칭 또는 포함 관계 확인
-                if (required_text.lower() == design_text.lower() or 
-                    required_text.lower() in design_text.lower() or 
-                    design_text.lower() in required_text.lower()):
-                    found_texts.append({
-                        'required': required_text,
-                        'found': design_text,
-                        'match_type': 'exact' if required_text.lower() == design_text.lower() else 'partial'
-                    })
-                    found = True
-                    break
-            
-            if not found:
+        for required_text, candidates in zip(required_texts, ranked):
+            if not candidates:
                 missing_texts.append(required_text)
+                continue
+            
+            index, match_type, score = candidates[0]
+            found_texts.append({
+                'required': required_text,
+                'found': text_index.texts[index],
+                'match_type': match_type,
+                'score': score,
+                'node_id': design_elements[index].id,
+                'alternatives': [
+                    {
+                        'found': text_index.texts[alt_index],
+                        'match_type': alt_type,
+                        'score': alt_score,
+                        'node_id': design_elements[alt_index].id
+                    }
+                    for alt_index, alt_type, alt_score in candidates[1:]
+                ]
+            })
         
         # 구현률 계산
         implementation_rate = len(found_texts) / len(required_texts) if required_texts else 0
@@ -155,15 +768,67 @@ class DesignChecker:
             'status': 'complete' if implementation_rate == 1.0 else 'partial' if implementation_rate > 0 else 'missing'
         }
     
+    def build_text_index(self, design_elements: Sequence[DesignElement]) -> MatchIndex:
+        """디자인 텍스트 색인 (프레임을 그룹으로 사용)"""
+        return self.matcher.index(_element_column(design_elements, 'text_content'),
+                                  [_frame_path(path) for path in _element_column(design_elements, 'path')])
+    
+    def _reset_indexes(self) -> None:
+        self.text_index = None
+        self.hierarchy = None
+        self._scopes = {}
+    
+    def spec_search_space(self, spec_elem: SpecificationElement) -> Tuple[Sequence[DesignElement], MatchIndex,
+                                                                          Optional[Ranges]]:
+        """설계서 항목이 검색할 디자인 요소, 색인, 요소 인덱스 구간
+
+        색인은 파일 전체로 처음 필요할 때 한 번만 만들고 모든 항목이 공유합니다.
+        범위(page/frame)가 있으면 해당 서브트리 요소의 구간(전위 순회 순서라 연속)으로 후보를 제한합니다.
+        """
+        if self.text_index is None:
+            self.text_index = self.build_text_index(self.design_elements)
+        if not spec_elem.scoped:
+            return self.design_elements, self.text_index, None
+        
+        key = (spec_elem.page, spec_elem.frame)
+        scope = self._scopes.get(key)
+        if scope is None:
+            if self.hierarchy is None:
+                self.hierarchy = HierarchyIndex(_element_column(self.design_elements, 'parent'))
+            scope = self._scopes[key] = self.hierarchy.scope_ranges(*key)
+        return self.design_elements, self.text_index, scope
+    
     def compare_elements(self) -> Tuple[List[Dict], List[Dict]]:
         """디자인 요소와 설계서 요소를 비교"""
+        # 디자인 텍스트 색인은 범위별로 한 번만 만들어 모든 설계서 항목에서 재사용
+        self._reset_indexes()
+        return self._evaluate_specs(self.spec_elements)
+    
+    def compare_spec_sets(self, spec_sets: List[List[SpecificationElement]]) -> List[Tuple[List[Dict], List[Dict]]]:
+        """여러 설계서를 같은 디자인 요소와 비교 (설계서마다 (matches, issues))
+
+        디자인 색인은 한 번만 만들어 모든 설계서가 공유합니다.
+        """
+        self._reset_indexes()
+        return [self._evaluate_specs(spec_elements) for spec_elements in spec_sets]
+    
+    def _evaluate_specs(self, spec_elements: Sequence[SpecificationElement]) -> Tuple[List[Dict], List[Dict]]:
+        """설계서 항목들을 평가 (고유 필요 텍스트마다 범위별로 한 번만 조회하고 항목들에 나눠 줌)"""
+        compiled = spec_elements if isinstance(spec_elements, CompiledSpec) else CompiledSpec(spec_elements)
+        normalized = compiled.normalized_texts(self.matcher)
+        results: List[Dict[str, Any]] = [None] * len(compiled)
+        for positions, _ in compiled.scopes.values():
+            design_elements, text_index, scope = self.spec_search_space(compiled[positions[0]])
+            ranked_sets = text_index.resolve_shared(
+                compiled.texts, [compiled.spec_text_ids[position] for position in positions], self.top_k, normalized,
+                scope)
+            for position, ranked in zip(positions, ranked_sets):
+                results[position] = self._implementation_result(compiled[position], design_elements, text_index,
+                                                                ranked)
+        
         matches = []
         issues = []
-        
-        # 각 설계서 요소에 대해 텍스트 구현 여부 확인
-        for spec_elem in self.spec_elements:
-            result = self.check_text_implementation(spec_elem, self.design_elements)
-            
+        for result in results:
             if result['status'] == 'complete':
                 matches.append(result)
             elif result['status'] == 'partial':
@@ -173,319 +838,327 @@ class DesignChecker:
         
         return matches, issues
     
-    def generate_html_report(self, matches: List[Dict], issues: List[Dict]) -> str:
-        """HTML 형태의 검수 보고서 생성"""
-        html_content = f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>피그마 디자인 텍스트 검수 보고서</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }}
-        .header h1 {{
-            margin: 0;
-            font-size: 2.5em;
-            font-weight: 300;
-        }}
-        .header p {{
-            margin: 10px 0 0 0;
-            opacity: 0.9;
-        }}
-        .stats {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            padding: 30px;
-            background: #f8f9fa;
-        }}
-        .stat-card {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            text-align: center;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }}
-        .stat-number {{
-            font-size: 2em;
-            font-weight: bold;
-            color: #667eea;
-        }}
-        .stat-label {{
-            color: #666;
-            margin-top: 5px;
-        }}
-        .content {{
-            padding: 30px;
-        }}
-        .section {{
-            margin-bottom: 40px;
-        }}
-        .section h2 {{
-            color: #333;
-            border-bottom: 2px solid #667eea;
-            padding-bottom: 10px;
-            margin-bottom: 20px;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 20px;
-            background: white;
-            border-radius: 8px;
-            overflow: hidden;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }}
-        th, td {{
-            padding: 12px 15px;
-            text-align: left;
-            border-bottom: 1px solid #ddd;
-        }}
-        th {{
-            background-color: #667eea;
-            color: white;
-            font-weight: 500;
-        }}
-        tr:hover {{
-            background-color: #f5f5f5;
-        }}
-        .status-complete {{
-            background-color: #d4edda;
-            color: #155724;
-            padding: 4px 8px;
-            border-radius: 4px;
-            font-size: 0.9em;
-        }}
-        .status-partial {{
-            background-color: #fff3cd;
-            color: #856404;
-            padding: 4px 8px;
-            border-radius: 4px;
-            font-size: 0.9em;
-        }}
-        .status-missing {{
-            background-color: #f8d7da;
-            color: #721c24;
-            padding: 4px 8px;
-            border-radius: 4px;
-            font-size: 0.9em;
-        }}
-        .rate {{
-            font-weight: bold;
-            color: #667eea;
-        }}
-        .text-list {{
-            max-width: 300px;
-            overflow: hidden;
-            text-overflow: ellipsis;
-            white-space: nowrap;
-        }}
-        .text-detail {{
-            background: #f8f9fa;
-            padding: 8px;
-            border-radius: 4px;
-            margin: 2px 0;
-            font-size: 0.9em;
-        }}
-        .found-text {{
-            color: #28a745;
-        }}
-        .missing-text {{
-            color: #dc3545;
-        }}
-        .spec-id {{
-            background: #667eea;
-            color: white;
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-size: 0.8em;
-            font-weight: bold;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>📝 피그마 디자인 텍스트 검수 보고서</h1>
-            <p>생성일시: {datetime.now().strftime('%Y년 %m월 %d일 %H:%M:%S')}</p>
-        </div>
+    def find_orphan_texts(self, spec_elements: Sequence[SpecificationElement] = None) -> List[Dict[str, Any]]:
+        """어느 설계서 항목에도 해당하지 않는 디자인 텍스트 (역방향 커버리지)
+
+        같은 텍스트의 노드들은 하나로 묶고, 많이 나온 텍스트부터 반환합니다.
+        spec_elements가 없으면 self.spec_elements를 기준으로 합니다.
+        """
+        design_elements = self.design_elements
+        texts = _element_column(design_elements, 'text_content')
         
-        <div class="stats">
-            <div class="stat-card">
-                <div class="stat-number">{len(matches) + len(issues)}</div>
-                <div class="stat-label">전체 설계서 항목</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number">{len([m for m in matches if m['status'] == 'complete'])}</div>
-                <div class="stat-label">완전 구현</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number">{len([m for m in matches if m['status'] == 'partial'])}</div>
-                <div class="stat-label">부분 구현</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number">{len(issues)}</div>
-                <div class="stat-label">미구현</div>
-            </div>
-        </div>
+        def scope_indices(page, frame):
+            if self.hierarchy is None:
+                self.hierarchy = HierarchyIndex(_element_column(design_elements, 'parent'))
+            return self.hierarchy.scope_indices(page, frame)
         
-        <div class="content">
-            <div class="section">
-                <h2>✅ 구현된 텍스트들</h2>
-                <table>
-                    <thead>
-                        <tr>
-                            <th>설계서 ID</th>
-                            <th>설계서 항목</th>
-                            <th>필요한 텍스트</th>
-                            <th>구현된 텍스트</th>
-                            <th>구현률</th>
-                            <th>상태</th>
-                        </tr>
-                    </thead>
-                    <tbody>
+        orphans = uncovered_indices(texts, self.spec_elements if spec_elements is None else spec_elements,
+                                    self.matcher, scope_indices)
+        ids = _element_column(design_elements, 'id')
+        paths = _element_column(design_elements, 'path')
+        groups: Dict[str, Dict[str, Any]] = {}
+        for index in orphans:
+            group = groups.get(texts[index])
+            if group is None:
+                group = groups[texts[index]] = {'text': texts[index], 'count': 0, 'node_ids': [], 'frames': {}}
+            group['count'] += 1
+            group['node_ids'].append(ids[index])
+            group['frames'][_frame_path(paths[index])] = None
+        results = sorted(groups.values(), key=lambda group: -group['count'])
+        for group in results:
+            group['frames'] = list(group['frames'])
+        return results
+    
+    def compare_incremental(self, snapshot: Dict[str, Any]) -> Tuple[List[Dict], List[Dict], Dict[str, int]]:
+        """이전 스냅샷과 달라진 노드에 영향받는 설계서 항목만 다시 비교
+
+        반환값의 세 번째 요소는 노드 변경 수와 다시 평가한 항목 수입니다.
         """
+        diff = NodeDiff(snapshot.get('nodes', {}), self.design_elements)
+        affected = affected_spec_ids(snapshot, diff, self.design_elements, self.spec_elements, self.matcher)
         
-        # 구현된 항목들
-        for match in matches:
-            html_content += f"""
-                        <tr>
-                            <td><span class="spec-id">{match['spec_id']}</span></td>
-                            <td><strong>{match['spec_name']}</strong></td>
-                            <td class="text-list">
-            """
-            
-            for text in match['required_texts']:
-                html_content += f'<div class="text-detail">{text}</div>'
-            
-            html_content += """
-                            </td>
-                            <td class="text-list">
-            """
-            
-            for found in match['found_texts']:
-                html_content += f'<div class="text-detail found-text">✓ {found["found"]}</div>'
-            
-            for missing in match['missing_texts']:
-                html_content += f'<div class="text-detail missing-text">✗ {missing}</div>'
-            
-            html_content += f"""
-                            </td>
-                            <td class="rate">{match['implementation_rate']:.1%}</td>
-                            <td><span class="status-{match['status']}">{'완전 구현' if match['status'] == 'complete' else '부분 구현'}</span></td>
-                        </tr>
-            """
+        def evaluate(spec_elem):
+            # 다시 평가할 항목이 있을 때만 디자인 색인 생성
+            return self.check_text_implementation(spec_elem, *self.spec_search_space(spec_elem))
         
-        html_content += """
-                    </tbody>
-                </table>
-            </div>
-            
-            <div class="section">
-                <h2>⚠️ 미구현된 텍스트들</h2>
-                <table>
-                    <thead>
-                        <tr>
-                            <th>설계서 ID</th>
-                            <th>설계서 항목</th>
-                            <th>필요한 텍스트</th>
-                            <th>문제점</th>
-                        </tr>
-                    </thead>
-                    <tbody>
+        self._reset_indexes()
+        results = merge_results(snapshot, self.spec_elements, affected, evaluate)
+        matches = [result for result in results if result['status'] != 'missing']
+        issues = [result for result in results if result['status'] == 'missing']
+        
+        changes = diff.summary()
+        changes['rechecked'] = len(affected)
+        changes['changed_specs'] = sum(1 for result in results if result.get('change'))
+        return matches, issues, changes
+    
+    def generate_html_report(self, matches: List[Dict], issues: List[Dict], changes: Dict[str, int] = None,
+                             orphans: List[Dict] = None) -> str:
+        """HTML 형태의 검수 보고서 생성 (changes가 있으면 증분 검수 변경 내역, orphans가 있으면 설계서에 없는 텍스트 표시)"""
+        return ''.join(iter_html_report(matches, issues, changes, orphans))
+    
+    def _load_design(self, design_file: DesignSource, metrics: CheckMetrics) -> None:
+        """디자인 파일을 읽어(load) 요소를 추출(extract)하는 두 단계를 측정하며 실행"""
+        with metrics.stage('load') as stage:
+            if isinstance(design_file, (str, os.PathLike)):
+                with open(design_file, 'rb') as f:
+                    raw = f.read()
+                stage.bytes_read = len(raw)
+                design_data = json_backend.loads(raw)
+                del raw
+            else:
+                design_data = design_file
+        
+        with metrics.stage('extract') as stage:
+            stats = {'nodes': 0}
+            self.design_elements = self.extract_design_elements(design_data, stats=stats,
+                                                                workers=self.extract_workers)
+            stage.nodes = stats['nodes']
+            stage.items = len(self.design_elements)
+    
+    def run_check(self, design_file: str, spec_file: str = None,
+                  report_file: str = "design_text_check_report.html", verbose: bool = True,
+                  snapshot_file: str = None, report_format: str = "html", trace_memory: bool = False,
+                  find_orphans: bool = False) -> str:
+        """전체 검수 프로세스 실행
+
+        snapshot_file이 주어지면 이전 결과 스냅샷과 비교해 바뀐 부분만 다시 검사하고,
+        이번 결과로 스냅샷을 갱신합니다.
+        report_format이 'data'이면 report_file에는 정적 뷰어를, 옆의 .ndjson 파일에는 결과 데이터를 저장합니다.
+        단계별 측정값(load/extract/spec/compare/render)은 self.metrics에 남고,
+        trace_memory=True이면 단계별 최대 메모리 할당량도 기록합니다 (tracemalloc 사용으로 느려짐).
+        find_orphans=True이면 설계서에 없는 디자인 텍스트를 찾아(coverage 단계) 보고서에 함께 표시합니다.
         """
+        log = print if verbose else (lambda *args, **kwargs: None)
+        metrics = self.metrics = CheckMetrics(trace_memory=trace_memory)
+        log("🔍 피그마 디자인 텍스트 검수를 시작합니다...")
         
-        # 미구현된 항목들
-        for issue in issues:
-            html_content += f"""
-                        <tr>
-                            <td><span class="spec-id">{issue['spec_id']}</span></td>
-                            <td><strong>{issue['spec_name']}</strong></td>
-                            <td class="text-list">
-            """
-            
-            for text in issue['required_texts']:
-                html_content += f'<div class="text-detail missing-text">✗ {text}</div>'
+        # 1~2. 디자인 파일 로드 및 요소 추출
+        log("📋 디자인 텍스트 요소를 추출하는 중...")
+        self._load_design(design_file, metrics)
+        log(f"   - {len(self.design_elements)}개의 텍스트 요소를 찾았습니다.")
+        
+        # 3. 설계서 요소 로드
+        log("📖 설계서 요소를 로드하는 중...")
+        if not spec_file:
+            log("❌ 설계서 파일이 필요합니다.")
+            return None
+        with metrics.stage('spec') as stage:
+            self.spec_elements = self.load_compiled_specification(spec_file)
+            stage.items = len(self.spec_elements)
+            if os.path.isfile(spec_file):
+                stage.bytes_read = os.path.getsize(spec_file)
+        log(f"   - {len(self.spec_elements)}개의 설계서 요소를 로드했습니다.")
+        
+        # 4. 요소 비교
+        log("🔍 텍스트 구현 여부를 확인하는 중...")
+        with metrics.stage('compare') as stage:
+            snapshot = load_snapshot(snapshot_file) if snapshot_file else None
+            changes = None
+            if snapshot is not None:
+                matches, issues, changes = self.compare_incremental(snapshot)
+                stage.items = changes['rechecked']
+                log(f"   - 노드 변경: 추가 {changes['added']}, 수정 {changes['modified']}, 삭제 {changes['removed']} "
+                    f"→ {changes['rechecked']}개 항목 재검사")
+            else:
+                matches, issues = self.compare_elements()
+                stage.items = len(self.spec_elements)
+            self.matches, self.issues = matches, issues
             
-            html_content += f"""
-                            </td>
-                            <td><span class="status-missing">모든 필요한 텍스트가 구현되지 않았습니다.</span></td>
-                        </tr>
-            """
+            if snapshot_file:
+                save_snapshot(snapshot_file, build_snapshot(self.design_elements, self.spec_elements,
+                                                            matches + issues, self.matcher))
+        log(f"   - {len(matches)}개 구현됨, {len(issues)}개 미구현")
         
-        html_content += """
-                    </tbody>
-                </table>
-            </div>
-        </div>
-    </div>
-</body>
-</html>
-        """
+        self.orphans = None
+        if find_orphans:
+            log("🔎 설계서에 없는 디자인 텍스트를 찾는 중...")
+            with metrics.stage('coverage') as stage:
+                self.orphans = self.find_orphan_texts()
+                stage.items = sum(group['count'] for group in self.orphans)
+            log(f"   - {len(self.orphans)}종류, {stage.items}개 텍스트가 어느 설계서 항목에도 없습니다.")
         
-        return html_content
+        # 5. 보고서 생성 (조각 단위로 파일에 바로 기록)
+        if report_format == 'data':
+            log(f"📊 보고서 데이터({os.path.basename(data_file_for(report_file))})와 뷰어를 생성하는 중...")
+        else:
+            log("📊 HTML 보고서를 생성하는 중...")
+        with metrics.stage('render') as stage:
+            stage.items = len(matches) + len(issues)
+            stage.bytes_written = self.write_report(report_file, matches, issues, changes, report_format,
+                                                    self.orphans)
+        
+        log(f"✅ 검수 완료! 보고서가 {report_file}에 저장되었습니다.")
+        
+        return report_file
+    
+    def write_report(self, report_file: str, matches: List[Dict], issues: List[Dict],
+                     changes: Dict[str, int] = None, report_format: str = "html",
+                     orphans: List[Dict] = None) -> int:
+        """보고서 파일 기록 후 쓴 바이트 수 반환 (data 형식이면 옆의 .ndjson 데이터 파일 포함)"""
+        if report_format == 'data':
+            data_file = data_file_for(report_file)
+            with open(data_file, 'w', encoding='utf-8') as f:
+                write_report_data(f, matches, issues, changes, orphans)
+            with open(report_file, 'w', encoding='utf-8') as f:
+                f.write(render_report_viewer(os.path.basename(data_file)))
+            return os.path.getsize(data_file) + os.path.getsize(report_file)
+        with open(report_file, 'w', encoding='utf-8') as f:
+            write_html_report(f, matches, issues, changes, orphans)
+        return os.path.getsize(report_file)
     
-    def run_check(self, design_file: str, spec_file: str = None) -> str:
-        """전체 검수 프로세스 실행"""
-        print("🔍 피그마 디자인 텍스트 검수를 시작합니다...")
+    def run_multi_check(self, design_file: str, spec_files: List[str], output_dir: str = "reports",
+                        verbose: bool = True, report_format: str = "html",
+                        trace_memory: bool = False, find_orphans: bool = False) -> Dict[str, Any]:
+        """디자인 파일 하나를 여러 설계서로 검수 (추출과 색인은 한 번만)
+
+        설계서마다 output_dir에 보고서를 쓰고, 설계서별 결과 요약 표(spec_matrix.json)를 저장해 반환합니다.
+        단계는 run_check와 같고, spec/compare/render 단계는 모든 설계서를 합쳐 측정합니다.
+        find_orphans=True이면 설계서마다 그 설계서에 없는 디자인 텍스트도 찾습니다.
+        """
+        log = print if verbose else (lambda *args, **kwargs: None)
+        metrics = self.metrics = CheckMetrics(trace_memory=trace_memory)
+        log(f"🔍 피그마 디자인 텍스트를 {len(spec_files)}개 설계서로 검수합니다...")
+        os.makedirs(output_dir, exist_ok=True)
         
-        # 1. 디자인 요소 추출
-        print("📋 디자인 텍스트 요소를 추출하는 중...")
-        self.design_elements = self.extract_design_elements(design_file)
-        print(f"   - {len(self.design_elements)}개의 텍스트 요소를 찾았습니다.")
+        log("📋 디자인 텍스트 요소를 추출하는 중...")
+        self._load_design(design_file, metrics)
+        log(f"   - {len(self.design_elements)}개의 텍스트 요소를 찾았습니다.")
         
-        # 2. 설계서 요소 로드
-        print("📖 설계서 요소를 로드하는 중...")
-        if spec_file:
-            self.spec_elements = self.load_specification_from_file(spec_file)
-        else:
-            print("❌ 설계서 파일이 필요합니다.")
-            return None
-        print(f"   - {len(self.spec_elements)}개의 설계서 요소를 로드했습니다.")
+        log("📖 설계서 요소를 로드하는 중...")
+        with metrics.stage('spec') as stage:
+            spec_sets = [self.load_compiled_specification(spec_file) for spec_file in spec_files]
+            stage.items = sum(len(spec_elements) for spec_elements in spec_sets)
+            stage.bytes_read = sum(os.path.getsize(spec_file) for spec_file in spec_files if os.path.isfile(spec_file))
         
-        # 3. 요소 비교
-        print("🔍 텍스트 구현 여부를 확인하는 중...")
-        matches, issues = self.compare_elements()
-        print(f"   - {len(matches)}개 구현됨, {len(issues)}개 미구현")
+        log("🔍 텍스트 구현 여부를 확인하는 중...")
+        with metrics.stage('compare') as stage:
+            results = self.compare_spec_sets(spec_sets)
+            stage.items = sum(len(spec_elements) for spec_elements in spec_sets)
         
-        # 4. HTML 보고서 생성
-        print("📊 HTML 보고서를 생성하는 중...")
-        html_content = self.generate_html_report(matches, issues)
+        orphan_sets = [None] * len(spec_sets)
+        if find_orphans:
+            log("🔎 설계서에 없는 디자인 텍스트를 찾는 중...")
+            with metrics.stage('coverage') as stage:
+                orphan_sets = [self.find_orphan_texts(spec_elements) for spec_elements in spec_sets]
+                stage.items = len(spec_sets)
         
-        # 5. 파일 저장
-        report_file = "design_text_check_report.html"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        log("📊 설계서별 보고서를 생성하는 중...")
+        rows = []
+        with metrics.stage('render') as stage:
+            stage.bytes_written = 0
+            for index, (spec_file, (matches, issues), orphans) in enumerate(zip(spec_files, results, orphan_sets)):
+                report_file = os.path.join(output_dir, _spec_report_name(index, spec_file))
+                stage.bytes_written += self.write_report(report_file, matches, issues, report_format=report_format,
+                                                         orphans=orphans)
+                specs = matches + issues
+                rows.append({
+                    'spec': spec_file,
+                    'report': report_file,
+                    'spec_items': len(specs),
+                    'complete': sum(1 for m in matches if m['status'] == 'complete'),
+                    'partial': sum(1 for m in matches if m['status'] == 'partial'),
+                    'missing': len(issues),
+                    'missing_texts': sum(len(s['missing_texts']) for s in specs),
+                    'implementation_rate': (sum(s['implementation_rate'] for s in specs) / len(specs)) if specs else 0,
+                })
+                if orphans is not None:
+                    rows[-1]['orphan_texts'] = sum(group['count'] for group in orphans)
+                log(f"   - {os.path.basename(spec_file)}: 완전 {rows[-1]['complete']} / 부분 {rows[-1]['partial']} / "
+                    f"미구현 {rows[-1]['missing']} → {report_file}")
+            stage.items = len(rows)
         
-        print(f"✅ 검수 완료! 보고서가 {report_file}에 저장되었습니다.")
+        # 마지막 설계서 결과를 run_check와 같은 속성에 남김
+        if spec_sets:
+            self.spec_elements = spec_sets[-1]
+            self.matches, self.issues = results[-1]
+            self.orphans = orphan_sets[-1]
         
-        return report_file
+        matrix = {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'design': design_file if isinstance(design_file, str) else None,
+            'text_elements': len(self.design_elements),
+            'specs': rows,
+        }
+        matrix_file = os.path.join(output_dir, SPEC_MATRIX_FILE)
+        with open(matrix_file, 'w', encoding='utf-8') as f:
+            json.dump(matrix, f, ensure_ascii=False, indent=2)
+        log(f"✅ 검수 완료! 설계서별 요약이 {matrix_file}에 저장되었습니다.")
+        return matrix
+
+SPEC_MATRIX_FILE = "spec_matrix.json"
+
+def _spec_report_name(index: int, spec_file: str) -> str:
+    return f"{index + 1:02d}_{os.path.splitext(os.path.basename(spec_file))[0]}.html"
+
+def _print_profile(metrics: CheckMetrics, show: bool, output_file: str = None) -> None:
+    if show:
+        print("⏱️ 단계별 측정값:")
+        print(metrics.format_table())
+    if output_file:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(metrics.to_dict(), f, ensure_ascii=False, indent=2)
+        print(f"⏱️ 단계별 측정값을 {output_file}에 저장했습니다.")
 
-def main():
-    checker = DesignChecker()
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='피그마 디자인 텍스트 검수')
+    parser.add_argument('design_file', nargs='?', default='figma_detailed.json', help='피그마 JSON 파일')
+    parser.add_argument('spec_file', nargs='?', default='specification.json', help='설계서 JSON 파일')
+    parser.add_argument('--batch', metavar='MANIFEST', help='(디자인, 설계서) 쌍 목록 JSON으로 일괄 검수')
+    parser.add_argument('--glob', metavar='PATTERN', help='패턴에 맞는 디자인 파일들을 --spec 설계서로 일괄 검수')
+    parser.add_argument('--spec', default='specification.json', help='--glob에 사용할 설계서 JSON 파일')
+    parser.add_argument('--specs', nargs='+', metavar='SPEC',
+                        help='디자인 파일 하나를 여러 설계서로 한 번에 검수 (설계서별 보고서를 --output-dir에 저장)')
+    parser.add_argument('--output-dir', default='reports', help='일괄 검수 보고서 저장 디렉토리')
+    parser.add_argument('--workers', type=int, default=None, help='일괄 검수 프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--chunksize', type=int, default=1, help='프로세스에 한 번에 넘길 검수 쌍 수')
+    parser.add_argument('--extract-workers', type=int, default=None,
+                        help='큰 파일 하나를 페이지별로 나눠 추출할 프로세스 수 (일괄 검수에는 적용하지 않음)')
+    parser.add_argument('--snapshot', metavar='FILE',
+                        help='이전 결과 스냅샷 파일 (있으면 바뀐 부분만 재검사 후 갱신, 일괄 검수에서는 쌍별 스냅샷 디렉토리)')
+    parser.add_argument('--format', choices=('html', 'data'), default='html',
+                        help="보고서 형식 (data: NDJSON 데이터 + 페이지/필터/가상 스크롤 뷰어, 항목이 많을 때 사용)")
+    parser.add_argument('--matcher', choices=MATCHER_PRESETS, default='normalized',
+                        help='텍스트 매칭 방식 (exact: 일치/포함만, normalized: 정규화 + 공백 무시, fuzzy: 유사도까지)')
+    parser.add_argument('--fuzzy-threshold', type=float, default=DEFAULT_FUZZY_THRESHOLD,
+                        help='--matcher fuzzy의 2-gram 유사도 기준 (0~1)')
+    parser.add_argument('--top-k', type=int, default=3, help='필요 텍스트마다 기록할 후보 수 (1위 + 대안)')
+    parser.add_argument('--report', default='design_text_check_report.html', help='보고서 HTML 파일 경로')
+    parser.add_argument('--spec-cache', metavar='DIR',
+                        help='컴파일된 설계서 저장 디렉터리 (내용이 같은 설계서는 다시 파싱/컴파일하지 않음)')
+    parser.add_argument('--orphans', action='store_true',
+                        help='어느 설계서 항목에도 없는 디자인 텍스트(오래된 문구, 오타)를 보고서에 함께 표시')
+    parser.add_argument('--profile', action='store_true',
+                        help='단계별 실행 시간/CPU/메모리/처리량 표 출력 (메모리 추적으로 조금 느려짐)')
+    parser.add_argument('--profile-output', metavar='FILE', help='단계별 측정값을 JSON 파일로 저장')
+    args = parser.parse_args(argv)
+    matcher = get_matcher(args.matcher, args.fuzzy_threshold)
+    
+    if args.batch or args.glob:
+        from batch_checker import load_manifest, pairs_from_glob, run_batch
+        pairs = load_manifest(args.batch) if args.batch else pairs_from_glob(args.glob, args.spec)
+        summary = run_batch(pairs, args.output_dir, workers=args.workers, chunksize=args.chunksize,
+                            report_format=args.format, checker_options={'matcher': matcher, 'top_k': args.top_k,
+                                                                        'spec_cache_dir': args.spec_cache},
+                            snapshot_dir=args.snapshot, find_orphans=args.orphans)
+        return 1 if summary['failed'] else 0
+    
+    checker = DesignChecker(matcher, args.top_k, extract_workers=args.extract_workers,
+                            spec_cache_dir=args.spec_cache)
+    
+    if args.specs:
+        if args.snapshot:
+            parser.error('--snapshot은 --specs와 함께 사용할 수 없습니다.')
+        checker.run_multi_check(args.design_file, args.specs, args.output_dir, report_format=args.format,
+                                trace_memory=args.profile, find_orphans=args.orphans)
+        _print_profile(checker.metrics, args.profile, args.profile_output)
+        return 0
     
     # 검수 실행 (실제 설계서 파일 사용)
-    report_file = checker.run_check('figma_detailed.json', 'specification.json')
+    report_file = checker.run_check(args.design_file, args.spec_file, report_file=args.report,
+                                    snapshot_file=args.snapshot, report_format=args.format,
+                                    trace_memory=args.profile, find_orphans=args.orphans)
+    
+    _print_profile(checker.metrics, args.profile, args.profile_output)
     
     # 브라우저에서 보고서 열기
     if report_file:
@@ -494,6 +1167,7 @@ def main():
             print("🌐 브라우저에서 보고서를 열었습니다.")
         except:
             print(f"📄 보고서 파일 위치: {os.path.abspath(report_file)}")
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
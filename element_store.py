@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""추출 결과(DesignElement 목록)를 담는 읽기 전용 바이너리 파일
+
+여러 워커 프로세스가 같은 파일을 mmap으로 열면 운영체제 페이지 캐시를 공유하므로
+동시에 분석해도 추출 결과는 메모리에 한 벌만 올라갑니다.
+요소는 접근할 때마다 파일에서 바로 디코딩하고, 프로세스별로 복사해 두지 않습니다.
+
+형식 (모두 네이티브 바이트 순서):
+    헤더 32바이트     매직, 형식 버전, 바이트 순서, 요소/상위 노드/문자열 수, 문자열 영역 크기
+    문자열 오프셋 표  uint64 × (문자열 수 + 1)
+    요소 표          uint32 × 8 (id, name, type, text, description, path, properties, 상위 노드)
+    상위 노드 표      uint32 × 4 (id, name, type, 부모)
+    문자열 영역       UTF-8 (같은 문자열은 한 번만 저장)
+문자열 0번은 메타데이터 JSON이고, 없는 값(None)은 _NONE으로 표시합니다.
+문자열이 아닌 값(properties 등)은 JSON 텍스트로 저장하고 번호에 _JSON 비트를 붙입니다.
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, List, Optional
+
+from design_checker import DesignElement, _intern
+from node_hierarchy import DesignNode, ancestors
+
+MAGIC = b'FGES'
+FORMAT_VERSION = 1
+_HEADER = struct.Struct('=4sHHIIIIQ')
+_BYTE_ORDER = 1 if sys.byteorder == 'little' else 2
+_ELEMENT_FIELDS = 8
+# column()으로 읽을 수 있는 요소 필드 → 요소 표의 열 번호
+_COLUMNS = {'id': 0, 'name': 1, 'type': 2, 'text_content': 3, 'description': 4, 'path': 5, 'parent': 7}
+_NODE_FIELDS = 4
+_NONE = 0xFFFFFFFF
+_JSON = 0x80000000
+
+
+class ElementStoreError(ValueError):
+    """저장 파일 형식이 맞지 않음"""
+
+
+class _StringTable:
+    def __init__(self):
+        self.offsets = array('Q', [0])
+        self.blob = bytearray()
+        self._numbers: Dict[str, int] = {}
+
+    def add(self, value: Any) -> int:
+        if value is None:
+            return _NONE
+        if type(value) is not str:
+            return self.add(json.dumps(value, ensure_ascii=False)) | _JSON
+        number = self._numbers.get(value)
+        if number is None:
+            number = self._numbers[value] = len(self.offsets) - 1
+            self.blob += value.encode('utf-8', 'surrogatepass')
+            self.offsets.append(len(self.blob))
+        return number
+
+
+def write_element_store(path: str, elements: Iterable[DesignElement], meta: Optional[Dict[str, Any]] = None) -> None:
+    """요소 목록을 저장 파일로 기록 (임시 파일에 쓴 뒤 교체하므로 읽는 쪽은 완성된 파일만 봄)"""
+    strings = _StringTable()
+    strings.add(json.dumps(meta or {}, ensure_ascii=False))
+
+    node_rows = array('I')
+    node_numbers: Dict[DesignNode, int] = {}
+
+    def node_number(node: Optional[DesignNode]) -> int:
+        # type이 없는 래퍼 노드는 건너뛰고, 부모부터 번호를 매김
+        parent = _NONE
+        for ancestor in reversed(list(ancestors(node))):
+            number = node_numbers.get(ancestor)
+            if number is None:
+                number = node_numbers[ancestor] = len(node_rows) // _NODE_FIELDS
+                node_rows.extend((strings.add(ancestor.id), strings.add(ancestor.name),
+                                  strings.add(ancestor.type), parent))
+            parent = number
+        return parent
+
+    element_rows = array('I')
+    for element in elements:
+        element_rows.extend((
+            strings.add(element.id), strings.add(element.name), strings.add(element.type),
+            strings.add(element.text_content), strings.add(element.description), strings.add(element.path),
+            strings.add(element.property_values()), node_number(element.parent),
+        ))
+
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, _BYTE_ORDER, len(element_rows) // _ELEMENT_FIELDS,
+                          len(node_rows) // _NODE_FIELDS, len(strings.offsets) - 1, 0, len(strings.blob))
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            strings.offsets.tofile(f)
+            element_rows.tofile(f)
+            node_rows.tofile(f)
+            f.write(strings.blob)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class ElementStore(Sequence):
+    """저장 파일을 mmap으로 열어 DesignElement 시퀀스처럼 제공
+
+    store[i]는 호출할 때마다 새 DesignElement를 만들며, 상위 노드(DesignNode)는
+    요소끼리 같은 객체를 공유하도록 처음 필요할 때 한 번만 만듭니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                raise ElementStoreError(f"저장 파일이 너무 짧습니다: {path}")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, byte_order, element_count, node_count, string_count, _, blob_size = \
+                _HEADER.unpack_from(self._mmap)
+            if magic != MAGIC or version != FORMAT_VERSION or byte_order != _BYTE_ORDER:
+                raise ElementStoreError(f"지원하지 않는 저장 파일 형식입니다: {path}")
+            offsets_end = _HEADER.size + 8 * (string_count + 1)
+            elements_end = offsets_end + 4 * _ELEMENT_FIELDS * element_count
+            nodes_end = elements_end + 4 * _NODE_FIELDS * node_count
+            if nodes_end + blob_size != size:
+                raise ElementStoreError(f"저장 파일 크기가 맞지 않습니다: {path}")
+        except BaseException:
+            self._mmap.close()
+            raise
+
+        view = memoryview(self._mmap)
+        self._offsets = view[_HEADER.size:offsets_end].cast('Q')
+        self._elements = view[offsets_end:elements_end].cast('I')
+        self._node_rows = view[elements_end:nodes_end].cast('I')
+        self._blob = view[nodes_end:]
+        self._count = element_count
+        self._nodes: Optional[List[DesignNode]] = None
+        self.meta: Dict[str, Any] = json.loads(self._string(0))
+
+    def _string(self, number: int) -> Any:
+        if number == _NONE:
+            return None
+        offsets = self._offsets
+        if number & _JSON:
+            number &= ~_JSON
+            return json.loads(str(self._blob[offsets[number]:offsets[number + 1]], 'utf-8', 'surrogatepass'))
+        return str(self._blob[offsets[number]:offsets[number + 1]], 'utf-8', 'surrogatepass')
+
+    def _node(self, number: int) -> Optional[DesignNode]:
+        if number == _NONE:
+            return None
+        nodes = self._nodes
+        if nodes is None:
+            # 부모가 항상 먼저 기록되어 있으므로 순서대로 만들면 됨
+            rows = self._node_rows
+            nodes = []
+            for start in range(0, len(rows), _NODE_FIELDS):
+                parent = rows[start + 3]
+                nodes.append(DesignNode(self._string(rows[start]), _intern(self._string(rows[start + 1])),
+                                        _intern(self._string(rows[start + 2])),
+                                        None if parent == _NONE else nodes[parent]))
+            self._nodes = nodes
+        return nodes[number]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('element index out of range')
+        string = self._string
+        start = index * _ELEMENT_FIELDS
+        row = self._elements[start:start + _ELEMENT_FIELDS]
+        return DesignElement(
+            string(row[0]), string(row[1]), string(row[2]), string(row[3]), string(row[4]), string(row[5]),
+            string(row[6]), parent=self._node(row[7]),
+        )
+
+    def column(self, field: str, indices: Optional[Sequence] = None) -> List[Any]:
+        """요소들의 필드 하나만 디코딩한 목록 (요소 객체를 만들지 않음, indices가 있으면 그 요소들만)"""
+        rows = self._elements[_COLUMNS[field]::_ELEMENT_FIELDS]
+        if indices is not None:
+            rows = [rows[index] for index in indices]
+        if field == 'parent':
+            return [self._node(number) for number in rows]
+        # 같은 문자열(번호)은 한 번만 디코딩
+        decoded: Dict[int, Any] = {}
+        values = []
+        for number in rows:
+            value = decoded.get(number)
+            if value is None and number not in decoded:
+                value = decoded[number] = self._string(number)
+            values.append(value)
+        return values
+
+    def close(self) -> None:
+        for view in (self._offsets, self._elements, self._node_rows, self._blob):
+            view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> 'ElementStore':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
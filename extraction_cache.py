@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""피그마 파일 버전별 추출 결과(DesignElement 목록) 디스크 캐시
+
+항목은 element_store 형식의 읽기 전용 바이너리 파일로 저장하고 mmap으로 엽니다.
+같은 캐시 디렉터리를 쓰는 워커 프로세스들은 페이지 캐시를 공유하므로,
+여러 요청이 같은 파일을 동시에 분석해도 추출은 한 번, 메모리에는 한 벌만 올라갑니다.
+"""
+import hashlib
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 스레드 잠금만 사용
+    fcntl = None
+
+from design_checker import DesignElement
+from element_store import ElementStore, ElementStoreError, write_element_store
+
+DEFAULT_CACHE_DIR = ".figma_cache"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+class ExtractionCache:
+    """파일 키 + 버전으로 추출 결과를 저장하는 크기 제한 LRU 캐시
+
+    항목마다 바이너리 파일 하나를 쓰고, 최근 사용 시각은 파일 수정 시각으로 관리합니다.
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다.
+    get()은 mmap으로 연 ElementStore를 반환하며, 프로세스 안에서는 같은 항목을 한 번만 엽니다.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # 항목 해시 → 항목별 스레드 잠금 (잡거나 기다리는 스레드가 없으면 삭제)
+        self._key_locks: Dict[str, _KeyLock] = {}
+        # 경로 → ((장치, inode), 열린 저장 파일)
+        self._stores: Dict[str, Tuple[Tuple[int, int], ElementStore]] = {}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def version_key(file_info: dict) -> Optional[str]:
+        """피그마 파일 응답의 version/lastModified로 캐시 버전 문자열 생성"""
+        version = file_info.get('version')
+        last_modified = file_info.get('lastModified')
+        if not version and not last_modified:
+            return None
+        return f"{version or ''}@{last_modified or ''}"
+
+    def _digest(self, file_key: str, version: str) -> str:
+        return hashlib.sha256(f"{file_key}\0{version}".encode('utf-8')).hexdigest()
+
+    def _path(self, file_key: str, version: str) -> str:
+        return os.path.join(self.cache_dir, f"{self._digest(file_key, version)}.bin")
+
+    @contextmanager
+    def lock(self, file_key: str, version: str) -> Iterator[None]:
+        """같은 항목을 여러 프로세스/스레드가 동시에 추출하지 않도록 잠금
+
+        잠금 안에서 get()으로 다시 확인한 뒤 없을 때만 추출/put()하면
+        동시에 들어온 요청 중 하나만 추출하고 나머지는 저장된 결과를 씁니다.
+        """
+        digest = self._digest(file_key, version)
+        lock_path = os.path.join(self.cache_dir, f"{digest}.lock")
+        key_lock = self._acquire_key_lock(digest)
+        try:
+            while True:
+                lock_file = open(lock_path, 'a+b')
+                if fcntl is None:
+                    break
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                # 기다리는 동안 정리(_evict)로 잠금 파일이 지워졌으면 새 파일로 다시 잠금
+                try:
+                    if os.stat(lock_path).st_ino == os.fstat(lock_file.fileno()).st_ino:
+                        break
+                except FileNotFoundError:
+                    pass
+                lock_file.close()
+            with lock_file:
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._release_key_lock(digest, key_lock)
+
+    def _acquire_key_lock(self, digest: str, blocking: bool = True) -> Optional['_KeyLock']:
+        """항목별 스레드 잠금을 잡음 (blocking=False면 다른 스레드가 쓰는 중일 때 None)"""
+        with self._lock:
+            key_lock = self._key_locks.get(digest)
+            if key_lock is None:
+                key_lock = self._key_locks[digest] = _KeyLock()
+            elif not blocking:
+                return None
+            key_lock.users += 1
+        key_lock.lock.acquire()
+        return key_lock
+
+    def _release_key_lock(self, digest: str, key_lock: '_KeyLock') -> None:
+        key_lock.lock.release()
+        with self._lock:
+            key_lock.users -= 1
+            if not key_lock.users:
+                del self._key_locks[digest]
+
+    def _remove_lock_file(self, lock_path: str) -> None:
+        """잠금 파일 삭제 (다른 프로세스/스레드가 잡고 있으면 그대로 둠)"""
+        digest = os.path.basename(lock_path)[:-len('.lock')]
+        key_lock = self._acquire_key_lock(digest, blocking=False)
+        if key_lock is None:
+            return
+        try:
+            if fcntl is None:
+                os.remove(lock_path)
+                return
+            with open(lock_path, 'a+b') as lock_file:
+                try:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    return
+                os.remove(lock_path)
+        except OSError:
+            pass
+        finally:
+            self._release_key_lock(digest, key_lock)
+
+    def get(self, file_key: str, version: str) -> Optional[ElementStore]:
+        """캐시된 추출 결과 반환 (없으면 None)"""
+        path = self._path(file_key, version)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        file_id = (stat.st_dev, stat.st_ino)
+
+        with self._lock:
+            opened = self._stores.get(path)
+        if opened is not None and opened[0] == file_id:
+            store = opened[1]
+        else:
+            try:
+                store = ElementStore(path)
+            except (FileNotFoundError, ElementStoreError):
+                return None
+            if store.meta.get('file_key') != file_key or store.meta.get('version') != version:
+                store.close()
+                return None
+            with self._lock:
+                self._stores[path] = (file_id, store)
+
+        try:
+            os.utime(path)  # LRU 순서 갱신
+        except OSError:
+            pass
+        return store
+
+    def put(self, file_key: str, version: str, elements: List[DesignElement]) -> Optional[ElementStore]:
+        """추출 결과 저장 후 크기 제한에 맞게 오래된 항목 정리
+
+        저장한 항목을 mmap으로 열어 반환하므로, 호출한 쪽은 원래 목록 대신 이것을 쓰면 됩니다.
+        """
+        write_element_store(self._path(file_key, version), elements,
+                            meta={'file_key': file_key, 'version': version})
+        self._evict()
+        return self.get(file_key, version)
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = []
+            lock_paths = []
+            total = 0
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith('.lock'):
+                    lock_paths.append(entry.path)
+                    continue
+                if not entry.name.endswith('.bin'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+            entries.sort()
+            kept = set()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    kept.add(path)
+                    continue
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    kept.add(path)
+                    continue  # Windows에서 다른 프로세스가 매핑 중인 파일
+                # 사용 중인 저장 파일은 참조가 모두 사라질 때 닫힘
+                self._stores.pop(path, None)
+                total -= size
+
+        # 남은 항목이 없는 잠금 파일 정리 (추출 중인 항목의 잠금은 잡혀 있으므로 남음)
+        for lock_path in lock_paths:
+            if lock_path[:-len('.lock')] + '.bin' not in kept:
+                self._remove_lock_file(lock_path)
+
+
+class _KeyLock:
+    """항목 하나의 스레드 잠금과 그것을 잡았거나 기다리는 스레드 수"""
+    __slots__ = ('lock', 'users')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.users = 0
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""피그마 REST API 클라이언트 (연결 재사용, 타임아웃, 부분 조회)"""
+import os
+import threading
+from typing import Any, Dict, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import json_backend
+
+FIGMA_API_BASE = os.environ.get('FIGMA_API_BASE', 'https://api.figma.com/v1')
+# (연결, 읽기) 타임아웃 초
+DEFAULT_TIMEOUT = (5, 120)
+POOL_SIZE = 16
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class FigmaAPIError(Exception):
+    """피그마 API 요청 실패 (status는 HTTP 상태 코드, 연결 오류면 None)"""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+def new_session(pool_size: int = POOL_SIZE, retry: Optional[Retry] = None) -> requests.Session:
+    """호스트별 keep-alive 연결을 pool_size개까지 유지하는 세션"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry or 0)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """keep-alive 연결 풀을 공유하는 세션 (프로세스당 하나)"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = new_session(retry=Retry(total=2, backoff_factor=0.5, status_forcelist=(502, 503, 504),
+                                                   allowed_methods=frozenset(['GET'])))
+    return _session
+
+
+def _file_params(depth: Optional[int] = None, ids: Optional[Iterable[str]] = None,
+                 geometry: Optional[str] = None, version: Optional[str] = None) -> Dict[str, Any]:
+    params = {}
+    if depth is not None:
+        params['depth'] = depth
+    if ids:
+        params['ids'] = ids if isinstance(ids, str) else ','.join(ids)
+    if geometry:
+        params['geometry'] = geometry
+    if version:
+        params['version'] = version
+    return params
+
+
+def _get(path: str, access_token: str, params: Dict[str, Any] = None, timeout=DEFAULT_TIMEOUT,
+         stats: Dict[str, int] = None) -> Dict[str, Any]:
+    url = f"{FIGMA_API_BASE}{path}"
+    headers = {
+        "X-Figma-Token": access_token
+    }
+
+    try:
+        response = get_session().get(url, headers=headers, params=params, timeout=timeout)
+        response.raise_for_status()
+        if stats is not None:
+            stats['bytes'] = stats.get('bytes', 0) + len(response.content)
+        return json_backend.loads(response.content)
+    except requests.exceptions.RequestException as e:
+        status = e.response.status_code if e.response is not None else None
+        raise FigmaAPIError(f"피그마 API 요청 실패: {str(e)}", status) from e
+    except ValueError as e:
+        raise FigmaAPIError(f"피그마 API 응답을 해석할 수 없습니다: {str(e)}", response.status_code) from e
+
+
+def get_figma_json(file_key: str, access_token: str, depth: Optional[int] = None,
+                   ids: Optional[Iterable[str]] = None, geometry: Optional[str] = None,
+                   version: Optional[str] = None, timeout=DEFAULT_TIMEOUT,
+                   stats: Dict[str, int] = None) -> Dict[str, Any]:
+    """피그마 API를 사용해서 JSON 데이터 가져오기
+
+    depth: 문서 트리를 몇 단계까지 받을지 (None이면 전체)
+    ids: 이 노드들과 그 상위/하위만 포함 (쉼표 구분 문자열 또는 목록)
+    geometry: 'paths'일 때만 벡터 기하 정보 포함 (기본은 제외)
+    stats가 주어지면 stats['bytes']에 받은 응답 본문 크기를 더합니다.
+    """
+    return _get(f"/files/{file_key}", access_token,
+                _file_params(depth=depth, ids=ids, geometry=geometry, version=version), timeout, stats)
+
+
+def get_figma_file_meta(file_key: str, access_token: str, timeout=DEFAULT_TIMEOUT) -> Dict[str, Any]:
+    """문서 트리 없이 파일 정보(name, version, lastModified 등)만 조회"""
+    data = _get(f"/files/{file_key}", access_token, _file_params(depth=1), timeout)
+    data.pop('document', None)
+    return data
+
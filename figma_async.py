@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""피그마 파일/노드 동시 조회 (asyncio)
+
+릴리스 검수처럼 여러 파일, 또는 큰 파일의 노드 서브트리 여러 묶음(/files/{key}/nodes)을
+한 번에 받을 때 사용합니다. 응답은 도착하는 순서대로 내보내므로 먼저 온 것부터 추출할 수 있습니다.
+- 동시 요청 수 제한 (세마포어), 호스트별 keep-alive 연결 풀
+- 429/5xx 응답과 연결 오류는 Retry-After 헤더만큼 (없으면 지수 백오프 + 지터) 기다렸다가 재시도
+
+aiohttp가 설치되어 있으면 사용하고, 없으면 requests 세션 요청을 스레드에서 실행합니다.
+base_url을 바꾸면 로컬 가짜 피그마 서버(synthetic_figma.FakeFigmaServer)로 시험할 수 있습니다.
+"""
+import argparse
+import asyncio
+import email.utils
+import functools
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    import aiohttp
+except ImportError:  # requests + 스레드로 대체
+    aiohttp = None
+
+from requests.exceptions import RequestException
+
+import figma_api
+import json_backend
+from figma_api import DEFAULT_TIMEOUT, FigmaAPIError, _file_params, new_session
+
+# 재시도할 응답 상태 (None은 연결/타임아웃 오류)
+RETRY_STATUSES = frozenset((None, 429, 500, 502, 503, 504))
+DEFAULT_CONCURRENCY = 8
+# /nodes 요청 하나에 넣을 노드 ID 수 (URL 길이 제한)
+NODE_BATCH_SIZE = 50
+
+
+@dataclass(frozen=True)
+class FigmaRequest:
+    """조회할 파일 하나 또는 노드 묶음 하나 (ids가 있으면 /nodes 엔드포인트)"""
+    file_key: str
+    ids: Tuple[str, ...] = ()
+    version: Optional[str] = None
+    depth: Optional[int] = None
+    geometry: Optional[str] = None
+
+    @property
+    def path(self) -> str:
+        return f"/files/{self.file_key}/nodes" if self.ids else f"/files/{self.file_key}"
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        return _file_params(depth=self.depth, ids=self.ids or None, geometry=self.geometry, version=self.version)
+
+
+def node_requests(file_key: str, node_ids: Sequence[str], batch_size: int = NODE_BATCH_SIZE,
+                  version: Optional[str] = None, depth: Optional[int] = None) -> List[FigmaRequest]:
+    """노드 ID들을 batch_size개씩 나눈 /nodes 요청 목록"""
+    return [FigmaRequest(file_key, tuple(node_ids[start:start + batch_size]), version=version, depth=depth)
+            for start in range(0, len(node_ids), batch_size)]
+
+
+def retry_delay(headers: Mapping[str, str], attempt: int, backoff: float, max_backoff: float) -> float:
+    """다음 재시도까지 기다릴 시간 (Retry-After 초/HTTP 날짜 우선, 없으면 지수 백오프 + 지터)"""
+    value = headers.get('Retry-After')
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    return min(max_backoff, backoff * 2 ** attempt) * random.uniform(0.5, 1.0)
+
+
+class AsyncFigmaFetcher:
+    """동시 요청 수를 제한하고 재시도하는 비동기 피그마 클라이언트
+
+    async with 블록 안에서 fetch()/iter_fetch()를 호출합니다.
+    Retry-After가 max_retry_after초보다 길면 기다리지 않고 실패로 처리합니다.
+    requests/retries는 보낸 요청 수와 그중 재시도 수입니다.
+    """
+
+    def __init__(self, access_token: str, concurrency: int = DEFAULT_CONCURRENCY, max_retries: int = 4,
+                 backoff: float = 0.5, max_backoff: float = 30.0, max_retry_after: float = 300.0,
+                 timeout=DEFAULT_TIMEOUT, base_url: Optional[str] = None):
+        self.access_token = access_token
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.timeout = timeout
+        self.base_url = (base_url or figma_api.FIGMA_API_BASE).rstrip('/')
+        self.requests = 0
+        self.retries = 0
+        self._client = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # aiohttp가 없을 때 요청을 실행할 스레드 (기본 실행기는 CPU 수에 따라 작을 수 있어 따로 둠)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def __aenter__(self) -> 'AsyncFigmaFetcher':
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        if aiohttp is not None:
+            connect, read = self.timeout if isinstance(self.timeout, tuple) else (self.timeout, self.timeout)
+            self._client = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.concurrency),
+                headers={'X-Figma-Token': self.access_token},
+                timeout=aiohttp.ClientTimeout(sock_connect=connect, sock_read=read),
+            )
+        else:
+            self._client = new_session(self.concurrency)
+            self._executor = ThreadPoolExecutor(self.concurrency, thread_name_prefix='figma-fetch')
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if aiohttp is not None:
+            await self._client.close()
+        else:
+            self._executor.shutdown(wait=False)
+            self._client.close()
+        self._client = None
+
+    async def _get(self, request: FigmaRequest) -> Tuple[Optional[int], Mapping[str, str], Any]:
+        """(상태, 헤더, 성공이면 JSON/실패면 오류 내용), 200 응답을 해석할 수 없으면 FigmaAPIError"""
+        url = f"{self.base_url}{request.path}"
+        params = {key: str(value) for key, value in request.params.items()}
+        if aiohttp is not None:
+            try:
+                async with self._client.get(url, params=params) as response:
+                    body = await response.read()
+                    status, headers = response.status, response.headers
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                return None, {}, e
+        else:
+            try:
+                response = await asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(
+                    self._client.get, url, params=params, timeout=self.timeout,
+                    headers={'X-Figma-Token': self.access_token}))
+            except RequestException as e:
+                return None, {}, e
+            status, headers, body = response.status_code, response.headers, response.content
+        if status != 200:
+            return status, headers, body[:200].decode('utf-8', 'replace')
+        try:
+            # 큰 문서의 파싱이 이벤트 루프를 오래 막지 않도록 스레드에서
+            return status, headers, await asyncio.to_thread(json_backend.loads, body)
+        except ValueError as e:
+            raise FigmaAPIError(f"피그마 API 응답을 해석할 수 없습니다: {request.path} ({str(e)})", status) from e
+
+    async def fetch(self, request: FigmaRequest) -> Dict[str, Any]:
+        """요청 하나의 응답 JSON (재시도 후에도 실패하면 FigmaAPIError)"""
+        for attempt in range(self.max_retries + 1):
+            # 재시도를 기다리는 동안에는 다른 요청이 자리를 쓰도록 시도마다 세마포어를 잡음
+            async with self._semaphore:
+                self.requests += 1
+                status, headers, result = await self._get(request)
+            if status == 200:
+                return result
+
+            rate_limit = headers.get('X-Figma-Rate-Limit-Type')
+            message = f"피그마 API 요청 실패: {request.path} ({status or '연결 오류'}: {result})"
+            if rate_limit:
+                message += f" [rate limit: {rate_limit}]"
+            if status not in RETRY_STATUSES or attempt == self.max_retries:
+                raise FigmaAPIError(message, status)
+            delay = retry_delay(headers, attempt, self.backoff, self.max_backoff)
+            if delay > self.max_retry_after:
+                raise FigmaAPIError(f"{message} - Retry-After {delay:.0f}초", status)
+            self.retries += 1
+            await asyncio.sleep(delay)
+
+    async def _fetch_pair(self, request: FigmaRequest) -> Tuple[FigmaRequest, Dict[str, Any]]:
+        return request, await self.fetch(request)
+
+    async def iter_fetch(self, requests: Iterable[FigmaRequest]) -> AsyncIterator[Tuple[FigmaRequest, Dict[str, Any]]]:
+        """모든 요청을 동시에 보내고 응답이 도착하는 순서대로 (요청, 응답 JSON) 반환
+
+        하나라도 실패하면 나머지 요청을 취소하고 예외를 전달합니다.
+        """
+        tasks = [asyncio.ensure_future(self._fetch_pair(request)) for request in requests]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def fetch_and_extract(requests: Iterable[FigmaRequest], access_token: str,
+                            extract: Callable[[Dict[str, Any]], Any] = None, executor=None,
+                            **options) -> AsyncIterator[Tuple[FigmaRequest, Any]]:
+    """응답이 도착하는 대로 extract(응답 JSON)를 실행해 (요청, 추출 결과) 반환
+
+    extract는 executor(기본: 스레드 풀)에서 실행하므로 추출하는 동안에도 다른 응답을 계속 받습니다.
+    기본 extract는 DesignChecker.extract_design_elements입니다. options는 AsyncFigmaFetcher 인자입니다.
+    """
+    if extract is None:
+        from design_checker import DesignChecker
+        extract = DesignChecker().extract_design_elements
+    loop = asyncio.get_running_loop()
+    async with AsyncFigmaFetcher(access_token, **options) as fetcher:
+        async for request, data in fetcher.iter_fetch(requests):
+            yield request, await loop.run_in_executor(executor, extract, data)
+
+
+def fetch_documents(requests: Sequence[FigmaRequest], access_token: str, **options) -> List[Dict[str, Any]]:
+    """여러 요청을 동시에 보내고 요청 순서대로 응답 JSON 반환 (동기 호출용)"""
+    async def run():
+        async with AsyncFigmaFetcher(access_token, **options) as fetcher:
+            return await asyncio.gather(*(fetcher.fetch(request) for request in requests))
+    return asyncio.run(run())
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='피그마 파일/노드 동시 다운로드')
+    parser.add_argument('file_keys', nargs='+', help='피그마 파일 키')
+    parser.add_argument('--token', default=os.environ.get('FIGMA_TOKEN'), help='액세스 토큰 (기본: FIGMA_TOKEN)')
+    parser.add_argument('--ids', help='받을 노드 ID (쉼표 구분, 파일 키가 하나일 때만)')
+    parser.add_argument('--batch-size', type=int, default=NODE_BATCH_SIZE, help='/nodes 요청 하나의 노드 수')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help='동시 요청 수')
+    parser.add_argument('--output-dir', default='figma_files', help='받은 JSON 저장 디렉토리')
+    args = parser.parse_args(argv)
+    if not args.token:
+        parser.error('--token 또는 FIGMA_TOKEN이 필요합니다.')
+    if args.ids and len(args.file_keys) > 1:
+        parser.error('--ids는 파일 키가 하나일 때만 사용할 수 있습니다.')
+
+    if args.ids:
+        batch = node_requests(args.file_keys[0], [node_id for node_id in args.ids.split(',') if node_id],
+                                  args.batch_size)
+    else:
+        batch = [FigmaRequest(file_key) for file_key in args.file_keys]
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    def save(request, data):
+        suffix = f"_nodes{batch.index(request) + 1:03d}" if request.ids else ''
+        output_file = os.path.join(args.output_dir, f"{request.file_key}{suffix}.json")
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        return output_file
+
+    async def run():
+        async with AsyncFigmaFetcher(args.token, concurrency=args.concurrency) as fetcher:
+            async for request, data in fetcher.iter_fetch(batch):
+                print(f"   ✅ {save(request, data)}")
+            return fetcher
+
+    print(f"📥 {len(batch)}개 요청을 최대 {args.concurrency}개씩 동시에 받습니다...")
+    start = time.perf_counter()
+    try:
+        fetcher = asyncio.run(run())
+    except FigmaAPIError as e:
+        print(f"❌ {e}")
+        return 1
+    print(f"✅ 완료 ({time.perf_counter() - start:.2f}s, 요청 {fetcher.requests}회, 재시도 {fetcher.retries}회)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""이전 검수 결과 스냅샷을 이용한 증분 재검수
+
+스냅샷에는 TEXT 노드별 (텍스트/프레임/상위 노드 해시, 매칭된 설계서 ID)와 설계서 항목별 결과를 저장합니다.
+다음 검수에서는 추가/변경/삭제된 노드와 관련된 설계서 항목만 다시 평가합니다.
+"""
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from node_hierarchy import ancestors
+
+
+SNAPSHOT_VERSION = 3
+
+
+def text_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def node_hash(element) -> str:
+    """매칭 결과에 영향을 주는 노드 내용의 해시
+
+    텍스트, 프레임 근접성 판단에 쓰는 프레임, 페이지/프레임 범위 판단에 쓰는 상위 노드 ID/이름
+    """
+    scope = "/".join(f"{node.id}:{node.name}" for node in ancestors(element.parent))
+    return text_hash(f"{element.frame}\0{scope}\0{element.text_content}")
+
+
+def spec_hash(spec) -> str:
+    """결과에 영향을 주는 설계서 항목 내용의 해시 (검색 범위 포함)"""
+    payload = json.dumps([spec.id, spec.name, spec.design_texts, spec.page, spec.frame], ensure_ascii=False)
+    return text_hash(payload)
+
+
+def load_snapshot(snapshot_file: str) -> Optional[Dict[str, Any]]:
+    """스냅샷 파일 로드 (없거나 형식이 다르면 None)"""
+    if not snapshot_file or not os.path.exists(snapshot_file):
+        return None
+    try:
+        with open(snapshot_file, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except ValueError:
+        return None
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+
+def save_snapshot(snapshot_file: str, snapshot: Dict[str, Any]) -> None:
+    temp_file = f"{snapshot_file}.tmp"
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(snapshot, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(temp_file, snapshot_file)
+
+
+def build_snapshot(design_elements, spec_elements, results: Iterable[Dict[str, Any]],
+                   matcher=None) -> Dict[str, Any]:
+    """이번 검수의 노드/설계서 결과 스냅샷 생성 (matcher 설정도 기록)"""
+    matched: Dict[str, List[str]] = {}
+    spec_results = {}
+    results_by_id = {result['spec_id']: result for result in results}
+    for spec in spec_elements:
+        result = results_by_id.get(spec.id)
+        if result is None:
+            continue
+        spec_results[spec.id] = {'hash': spec_hash(spec), 'result': _stored_result(result)}
+        for found in result['found_texts']:
+            # 대안 후보 노드가 바뀌어도 결과가 달라지므로 함께 기록
+            for candidate in [found] + found.get('alternatives', []):
+                node_id = candidate.get('node_id')
+                if node_id is not None:
+                    spec_ids = matched.setdefault(node_id, [])
+                    if spec.id not in spec_ids:
+                        spec_ids.append(spec.id)
+
+    nodes = {}
+    for element in design_elements:
+        if element.id not in nodes:
+            nodes[element.id] = [node_hash(element), matched.get(element.id, [])]
+
+    return {
+        'version': SNAPSHOT_VERSION,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'matcher': matcher.signature if matcher is not None else None,
+        'nodes': nodes,
+        'specs': spec_results,
+    }
+
+
+def _stored_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in result.items() if key != 'change'}
+
+
+def _result_signature(result: Dict[str, Any]):
+    return (
+        result['status'],
+        [(found['required'], found['found']) for found in result['found_texts']],
+        list(result['missing_texts']),
+    )
+
+
+class NodeDiff:
+    """이전 스냅샷과 현재 디자인 사이의 TEXT 노드 변경 내역"""
+
+    def __init__(self, previous_nodes: Dict[str, List[Any]], design_elements):
+        self.added: List[int] = []
+        self.modified: List[int] = []
+        self.removed: List[str] = []
+
+        seen = set()
+        for index, element in enumerate(design_elements):
+            if element.id in seen:
+                continue
+            seen.add(element.id)
+            previous = previous_nodes.get(element.id)
+            if previous is None:
+                self.added.append(index)
+            elif previous[0] != node_hash(element):
+                self.modified.append(index)
+        self.removed = [node_id for node_id in previous_nodes if node_id not in seen]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+    def summary(self) -> Dict[str, int]:
+        return {'added': len(self.added), 'modified': len(self.modified), 'removed': len(self.removed)}
+
+
+def affected_spec_ids(snapshot: Dict[str, Any], diff: NodeDiff, design_elements, spec_elements,
+                      matcher) -> Set[str]:
+    """다시 평가해야 하는 설계서 항목 ID
+
+    - 매칭 설정이 스냅샷과 다르면 모든 항목
+    - 새로 추가되었거나 내용이 바뀐 설계서 항목
+    - 삭제/변경된 노드에 매칭되어 있던 항목
+    - 추가/변경된 노드의 새 텍스트와 매칭될 수 있는 필요 텍스트를 가진 항목
+    """
+    if snapshot.get('matcher') != matcher.signature:
+        return {spec.id for spec in spec_elements}
+
+    previous_specs = snapshot.get('specs', {})
+    previous_nodes = snapshot.get('nodes', {})
+    affected = {spec.id for spec in spec_elements
+                if spec.id not in previous_specs or previous_specs[spec.id]['hash'] != spec_hash(spec)}
+
+    for node_id in diff.removed:
+        affected.update(previous_nodes[node_id][1])
+    for index in diff.modified:
+        affected.update(previous_nodes[design_elements[index].id][1])
+
+    changed_texts = {design_elements[index].text_content for index in diff.added + diff.modified}
+    if changed_texts:
+        # 설계서 쪽 필요 텍스트 색인 (크기는 설계서에 비례, 매칭 관계는 대칭이라 같은 규칙 사용)
+        # 컴파일된 설계서(CompiledSpec)는 필요 텍스트 → 항목 ID 표를 이미 들고 있음
+        required_specs = getattr(spec_elements, 'text_spec_ids', None)
+        if required_specs is None:
+            required_specs = {}
+            for spec in spec_elements:
+                for required_text in spec.design_texts:
+                    required_specs.setdefault(required_text, set()).add(spec.id)
+        required_texts = list(required_specs)
+        required_index = matcher.index(required_texts)
+        for text in changed_texts:
+            for index in required_index.find_all(text):
+                affected.update(required_specs[required_texts[index]])
+    return affected
+
+
+def merge_results(snapshot: Dict[str, Any], spec_elements, affected: Set[str], evaluate) -> List[Dict[str, Any]]:
+    """영향받은 항목은 evaluate(spec)로 다시 평가하고 나머지는 이전 결과 재사용
+
+    다시 평가한 결과가 이전과 다르면 result['change']에 'new' 또는 'updated'를 표시합니다.
+    """
+    previous_specs = snapshot.get('specs', {})
+    results = []
+    for spec in spec_elements:
+        previous = previous_specs.get(spec.id)
+        if spec.id not in affected and previous is not None:
+            results.append(dict(previous['result']))
+            continue
+
+        result = evaluate(spec)
+        if previous is None:
+            result['change'] = 'new'
+        elif _result_signature(result) != _result_signature(previous['result']):
+            result['change'] = 'updated'
+        results.append(result)
+    return results
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""오래 걸리는 분석 작업을 요청 밖에서 처리하는 로컬 작업 큐"""
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# 분석 단계 (진행률 표시 순서)
+STAGES = ('download', 'extract', 'compare', 'render')
+
+# 완료된 작업을 보관하는 시간 (초)
+DEFAULT_RETENTION = 60 * 60
+
+
+class Job:
+    """작업 하나의 상태와 진행 이벤트"""
+
+    def __init__(self, key: str):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.status = 'queued'
+        self.stage: Optional[str] = None
+        self.events: List[Dict[str, Any]] = []
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self._changed = threading.Condition()
+
+    @property
+    def done(self) -> bool:
+        return self.status in ('done', 'error')
+
+    def _record(self, **event) -> None:
+        with self._changed:
+            event['time'] = time.time()
+            self.events.append(event)
+            self._changed.notify_all()
+
+    def set_stage(self, stage: str, **details) -> None:
+        """진행 단계 갱신 (워커에서 호출)"""
+        self.status = 'running'
+        self.stage = stage
+        self._record(status=self.status, stage=stage, **details)
+
+    def _finish(self, result: Any = None, error: str = None) -> None:
+        self.result = result
+        self.error = error
+        self.status = 'error' if error is not None else 'done'
+        self.finished_at = time.time()
+        self._record(status=self.status, stage=self.stage, error=error)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """작업이 끝날 때까지 최대 timeout초 대기 (끝났으면 True)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            while not self.done:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._changed.wait(remaining)
+        return True
+
+    def iter_events(self, timeout: float = 15.0) -> Iterator[Optional[Dict[str, Any]]]:
+        """진행 이벤트를 순서대로 반환, 작업이 끝나면 종료
+
+        timeout 동안 새 이벤트가 없으면 None을 반환하므로 스트림 유지(keep-alive)에 사용할 수 있습니다.
+        """
+        sent = 0
+        while True:
+            with self._changed:
+                if sent >= len(self.events) and not self.done:
+                    self._changed.wait(timeout)
+                pending = self.events[sent:]
+                finished = self.done
+            if not pending and not finished:
+                yield None
+            for event in pending:
+                yield event
+            sent += len(pending)
+            if finished and sent >= len(self.events):
+                return
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        data = {
+            'job_id': self.id,
+            'status': self.status,
+            'stage': self.stage,
+            'stages': list(STAGES),
+            'events': list(self.events),
+            'error': self.error,
+        }
+        if include_result and self.status == 'done':
+            data['result'] = self.result
+        return data
+
+
+class JobQueue:
+    """작업 큐와 워커 풀
+
+    같은 key(파일 키 + 버전 등)로 진행 중인 작업이 있으면 새로 만들지 않고 그 작업을 돌려줍니다.
+    """
+
+    def __init__(self, workers: int = 2, retention: float = DEFAULT_RETENTION):
+        self.retention = retention
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='analysis')
+        self._jobs: Dict[str, Job] = {}
+        self._inflight: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key: str, func: Callable[[Job], Any]) -> Job:
+        """작업 등록 후 바로 반환 (func(job)은 워커에서 실행되며 반환값이 결과)"""
+        with self._lock:
+            self._prune()
+            job = self._inflight.get(key)
+            if job is not None:
+                return job
+            job = Job(key)
+            self._jobs[job.id] = job
+            self._inflight[key] = job
+        job._record(status=job.status, stage=None)
+        self._executor.submit(self._run, job, func)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job: Job, func: Callable[[Job], Any]) -> None:
+        try:
+            result = func(job)
+        except Exception as e:
+            job._finish(error=str(e))
+        else:
+            job._finish(result=result)
+        finally:
+            with self._lock:
+                if self._inflight.get(job.key) is job:
+                    del self._inflight[job.key]
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.retention
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.finished_at is not None and job.finished_at < cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""JSON 파서 선택 (빠른 선택 의존성이 있으면 사용하고, 없으면 표준 json)
+
+우선순위는 orjson → simdjson(pysimdjson) → json이며, 환경 변수 JSON_BACKEND로 고정할 수 있습니다.
+모든 백엔드가 bytes를 그대로 받으므로 파일은 'rb'로 읽어 str 디코딩 복사를 건너뜁니다.
+빠른 백엔드가 거부한 문서(NaN, 64비트를 넘는 정수 등)는 표준 json으로 다시 파싱합니다.
+파싱 결과에는 순환 참조가 없으므로 파싱하는 동안 순환 GC를 멈춥니다
+(수백만 개의 dict/list를 만드는 동안 GC가 반복해서 도는 비용이 파싱 시간만큼 큼).
+"""
+import gc
+import json
+import os
+from contextlib import contextmanager
+from typing import IO, Any, Callable, Dict, Iterator, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # 선택 의존성
+    simdjson = None
+
+JSONInput = Union[str, bytes, bytearray, memoryview]
+
+
+def _stdlib_loads(data: JSONInput) -> Any:
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def _simdjson_loads(data: JSONInput) -> Any:
+    if isinstance(data, (bytearray, memoryview)):
+        data = bytes(data)
+    return simdjson.loads(data)
+
+
+# 이름 → loads 함수 (설치된 것만, 우선순위 순)
+BACKENDS: Dict[str, Callable[[JSONInput], Any]] = {}
+if orjson is not None:
+    BACKENDS['orjson'] = orjson.loads
+if simdjson is not None:
+    BACKENDS['simdjson'] = _simdjson_loads
+BACKENDS['json'] = _stdlib_loads
+
+
+def _select_backend(name: Optional[str]) -> str:
+    if not name:
+        return next(iter(BACKENDS))
+    if name not in BACKENDS:
+        raise ValueError(f"JSON 백엔드 {name!r}을 사용할 수 없습니다 (사용 가능: {', '.join(BACKENDS)})")
+    return name
+
+
+# 기본 백엔드 이름
+BACKEND = _select_backend(os.environ.get('JSON_BACKEND'))
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def loads(data: JSONInput, backend: Optional[str] = None) -> Any:
+    """JSON 문자열/bytes 파싱 (backend를 지정하지 않으면 BACKEND 사용)"""
+    name = _select_backend(backend) if backend else BACKEND
+    with _gc_paused():
+        try:
+            return BACKENDS[name](data)
+        except ValueError:
+            if name == 'json':
+                raise
+            # 빠른 백엔드가 지원하지 않는 문법일 수 있으므로 표준 json의 결과(또는 오류)를 따름
+            return _stdlib_loads(data)
+
+
+def dumps(value: Any) -> str:
+    """공백 없는 JSON 문자열 (orjson이 있으면 사용, 비ASCII 문자는 그대로, orjson은 NaN/Infinity를 null로 씀)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode('utf-8')
+        except TypeError:
+            # orjson이 지원하지 않는 값(64비트를 넘는 정수 등)은 표준 json으로
+            pass
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def load(fp: IO, backend: Optional[str] = None) -> Any:
+    """읽기 가능한 파일 객체(텍스트 또는 바이너리) 파싱"""
+    return loads(fp.read(), backend)
+
+
+def load_file(path: Union[str, os.PathLike], backend: Optional[str] = None) -> Any:
+    """파일을 bytes로 읽어 파싱"""
+    with open(path, 'rb') as f:
+        return loads(f.read(), backend)
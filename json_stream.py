@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""대용량 JSON 문서를 통째로 메모리에 올리지 않고 이벤트 단위로 읽는 스트리밍 파서"""
+import codecs
+import json
+import re
+from json.decoder import scanstring
+from typing import Any, IO, Iterator, Tuple
+
+try:
+    import ijson
+except ImportError:  # 선택 의존성: 없으면 내장 토크나이저 사용
+    ijson = None
+
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_NUMBER = re.compile(r'-?(?:0|[1-9]\d*)(\.\d+)?([eE][-+]?\d+)?')
+_LITERALS = (('true', True, 'boolean'), ('false', False, 'boolean'), ('null', None, 'null'))
+
+
+def iter_json_events(fp: IO, chunk_size: int = CHUNK_SIZE, use_ijson: bool = True) -> Iterator[Tuple[str, Any]]:
+    """JSON 스트림을 (이벤트, 값) 튜플로 순차 반환
+
+    이벤트 이름은 ijson.basic_parse와 동일합니다:
+    start_map, map_key, end_map, start_array, end_array, string, number, boolean, null.
+    ijson이 설치되어 있으면 그 백엔드를, 없으면 내장 토크나이저를 사용합니다.
+    """
+    if use_ijson and ijson is not None:
+        return ijson.basic_parse(fp, use_float=True)
+    return _iter_builtin_events(fp, chunk_size)
+
+
+def _iter_builtin_events(fp: IO, chunk_size: int) -> Iterator[Tuple[str, Any]]:
+    """순수 파이썬 토크나이저 (문자열 디코딩은 json 모듈의 C 구현을 재사용)"""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    buf = ''
+    pos = 0
+    eof = False
+    # 열린 컨테이너 스택: True는 객체, False는 배열
+    containers = []
+    expect_key = False
+
+    def fill():
+        nonlocal buf, pos, eof
+        chunk = fp.read(chunk_size)
+        if isinstance(chunk, bytes):
+            text = decoder.decode(chunk, final=not chunk)
+        else:
+            text = chunk
+        if not chunk:
+            eof = True
+        buf = buf[pos:] + text
+        pos = 0
+
+    fill()
+    while True:
+        pos = _WHITESPACE.match(buf, pos).end()
+        if pos >= len(buf):
+            if eof:
+                break
+            fill()
+            continue
+
+        char = buf[pos]
+        if char == '"':
+            try:
+                value, end = scanstring(buf, pos + 1)
+            except json.JSONDecodeError:
+                # 청크 경계에서 잘린 문자열이면 더 읽어서 재시도
+                if eof:
+                    raise
+                fill()
+                continue
+            pos = end
+            if expect_key:
+                expect_key = False
+                yield 'map_key', value
+            else:
+                yield 'string', value
+        elif char == '{':
+            pos += 1
+            containers.append(True)
+            expect_key = True
+            yield 'start_map', None
+        elif char == '[':
+            pos += 1
+            containers.append(False)
+            yield 'start_array', None
+        elif char == '}' or char == ']':
+            if not containers or containers.pop() != (char == '}'):
+                raise ValueError(f"잘못된 JSON: 위치 {pos}의 예상치 못한 '{char}'")
+            pos += 1
+            expect_key = False
+            yield ('end_map' if char == '}' else 'end_array'), None
+        elif char == ',':
+            pos += 1
+            expect_key = bool(containers) and containers[-1]
+        elif char == ':':
+            pos += 1
+        else:
+            match = _NUMBER.match(buf, pos)
+            if match is not None:
+                # '1.' 이나 '1e-' 처럼 청크 경계에서 잘린 숫자일 수 있으므로 여유분 확보
+                if len(buf) - match.end() < 3 and not eof:
+                    fill()
+                    continue
+                pos = match.end()
+                number = match.group()
+                if match.group(1) or match.group(2):
+                    yield 'number', float(number)
+                else:
+                    yield 'number', int(number)
+                continue
+
+            for literal, value, event in _LITERALS:
+                if buf.startswith(literal, pos):
+                    pos += len(literal)
+                    yield event, value
+                    break
+            else:
+                if len(buf) - pos < 5 and not eof:
+                    fill()
+                    continue
+                raise ValueError(f"잘못된 JSON: 위치 {pos}의 예상치 못한 문자 '{char}'")
+
+    if containers:
+        raise ValueError("잘못된 JSON: 문서가 완전히 닫히지 않았습니다.")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""TEXT 요소의 상위 노드(페이지/프레임) 계층 색인
+
+추출할 때 TEXT 요소마다 가장 가까운 상위 노드(DesignNode)를 연결해 두고,
+검수할 때 노드 ID/이름 → 하위 TEXT 요소 범위 색인을 만들어
+페이지/프레임 범위가 지정된 설계서 항목이 해당 서브트리의 텍스트(연속 구간)만 찾도록 합니다.
+"""
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+PAGE_TYPE = 'CANVAS'
+# 프레임 범위로 지정할 수 없는 노드 타입
+_NON_FRAME_TYPES = frozenset(('DOCUMENT', PAGE_TYPE))
+
+
+class DesignNode:
+    """TEXT 요소를 감싸는 상위 노드 (하위 요소들이 같은 객체를 공유)
+
+    스트리밍 추출에서는 자식보다 뒤에 나오는 id/name/type 값을 나중에 채웁니다.
+    type이 None인 노드(파일 루트 같은 래퍼 객체)는 계층에서 건너뜁니다.
+    """
+    __slots__ = ('id', 'name', 'type', 'parent')
+
+    def __init__(self, id: str = '', name: str = '', type: Optional[str] = None,
+                 parent: Optional['DesignNode'] = None):
+        self.id = id
+        self.name = name
+        self.type = type
+        self.parent = parent
+
+    def __repr__(self) -> str:
+        return f"DesignNode(id={self.id!r}, name={self.name!r}, type={self.type!r})"
+
+
+def ancestors(node: Optional[DesignNode]) -> Iterator[DesignNode]:
+    """node부터 루트까지 type이 있는 상위 노드 (가까운 순서)"""
+    while node is not None:
+        if node.type is not None:
+            yield node
+        node = node.parent
+
+
+def page_of(node: Optional[DesignNode]) -> Optional[DesignNode]:
+    """노드가 속한 페이지 (CANVAS) 노드"""
+    for ancestor in ancestors(node):
+        if ancestor.type == PAGE_TYPE:
+            return ancestor
+    return None
+
+
+class HierarchyIndex:
+    """상위 노드 → 하위 TEXT 요소 인덱스 범위 색인
+
+    추출 결과는 전위 순회 순서이므로 한 노드 아래의 요소들은 연속된 구간 [first, last]가 됩니다.
+    페이지는 CANVAS 노드, 프레임은 그 외 모든 상위 노드를 ID 또는 이름으로 찾습니다.
+    parents는 요소 순서대로 각 TEXT 요소의 가장 가까운 상위 노드입니다.
+    """
+
+    def __init__(self, parents: Iterable[Optional[DesignNode]]):
+        self._ranges: Dict[DesignNode, List[int]] = {}
+        self._pages: Dict[str, List[DesignNode]] = {}
+        self._frames: Dict[str, List[DesignNode]] = {}
+        # 현재 요소를 감싸는 노드들 (루트부터)과 각 노드의 스택 위치
+        # 요소마다 루트까지 올라가지 않고, 열려 있는 노드를 만날 때까지만 올라감
+        stack: List[DesignNode] = []
+        depths: Dict[DesignNode, int] = {}
+        previous = None
+        index = -1
+        for index, parent in enumerate(parents):
+            if parent is previous:
+                continue
+            previous = parent
+            opened = []
+            node = parent
+            while node is not None and node not in depths:
+                if node.type is not None:
+                    opened.append(node)
+                node = node.parent
+            depth = 0 if node is None else depths[node] + 1
+            for closed in stack[depth:]:
+                self._ranges[closed][1] = index - 1
+                del depths[closed]
+            del stack[depth:]
+            for node in opened:
+                if node not in self._ranges:
+                    self._ranges[node] = [index, index]
+                    self._register(node)
+            for node in reversed(opened):
+                depths[node] = len(stack)
+                stack.append(node)
+        for node in stack:
+            self._ranges[node][1] = index
+
+    def _register(self, node: DesignNode) -> None:
+        if node.type in _NON_FRAME_TYPES:
+            if node.type != PAGE_TYPE:
+                return
+            keys = self._pages
+        else:
+            keys = self._frames
+        for key in {node.id, node.name}:
+            if isinstance(key, str) and key:
+                keys.setdefault(key, []).append(node)
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def scope_nodes(self, page: str = '', frame: str = '') -> List[DesignNode]:
+        """범위에 해당하는 노드들 (frame이 있으면 page 안의 프레임, 없으면 페이지)"""
+        pages = self._pages.get(page, []) if page else None
+        if not frame:
+            return list(pages or [])
+        frames = self._frames.get(frame, [])
+        if pages is not None:
+            pages = set(pages)
+            frames = [node for node in frames if page_of(node) in pages]
+        return frames
+
+    def scope_ranges(self, page: str = '', frame: str = '') -> Tuple[Tuple[int, int], ...]:
+        """범위 안 TEXT 요소 인덱스 구간 [start, end)들 (오름차순, 중첩된 노드가 함께 지정돼도 겹치지 않음)"""
+        ranges: List[Tuple[int, int]] = []
+        for first, last in sorted(self._ranges[node] for node in self.scope_nodes(page, frame)):
+            if ranges and first <= ranges[-1][1]:
+                if last + 1 > ranges[-1][1]:
+                    ranges[-1] = (ranges[-1][0], last + 1)
+                continue
+            ranges.append((first, last + 1))
+        return tuple(ranges)
+
+    def scope_indices(self, page: str = '', frame: str = '') -> List[int]:
+        """범위 안 TEXT 요소 인덱스 (오름차순, 중첩된 노드가 함께 지정돼도 중복 없음)"""
+        return [index for start, end in self.scope_ranges(page, frame) for index in range(start, end)]
@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""검수 결과 HTML 보고서를 조각(chunk) 단위로 만드는 스트리밍 렌더러
+
+보고서 전체를 문자열 하나로 이어 붙이지 않고 생성기로 조각을 내보내므로
+파일이나 WSGI 응답에 바로 쓸 수 있습니다. 모든 값은 HTML 이스케이프됩니다.
+
+항목이 아주 많을 때는 데이터 형식(NDJSON)과 정적 뷰어(templates/report_viewer.html)를
+사용하면 브라우저가 페이지/필터/가상 스크롤로 필요한 행만 그립니다.
+"""
+import json
+import os
+from datetime import datetime
+from html import escape
+from typing import IO, Dict, Iterable, Iterator, List
+
+# 이 크기만큼 모이면 한 번에 내보냄 (작은 write 호출 줄이기)
+CHUNK_SIZE = 64 * 1024
+
+# 데이터 보고서 형식 버전 (첫 줄 요약의 version)
+REPORT_DATA_VERSION = 1
+VIEWER_TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates', 'report_viewer.html')
+
+# 증분 검수에서 결과가 바뀐 항목 표시
+CHANGE_BADGES = {
+    'new': '<span class="change-badge">신규</span>',
+    'updated': '<span class="change-badge">변경</span>',
+}
+
+REPORT_HEAD = """
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>피그마 디자인 텍스트 검수 보고서</title>
+    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            margin: 0;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            max-width: 1400px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 8px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+            overflow: hidden;
+        }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 30px;
+            text-align: center;
+        }
+        .header h1 {
+            margin: 0;
+            font-size: 2.5em;
+            font-weight: 300;
+        }
+        .header p {
+            margin: 10px 0 0 0;
+            opacity: 0.9;
+        }
+        .stats {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+            padding: 30px;
+            background: #f8f9fa;
+        }
+        .stat-card {
+            background: white;
+            padding: 20px;
+            border-radius: 8px;
+            text-align: center;
+            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+        }
+        .stat-number {
+            font-size: 2em;
+            font-weight: bold;
+            color: #667eea;
+        }
+        .stat-label {
+            color: #666;
+            margin-top: 5px;
+        }
+        .content {
+            padding: 30px;
+        }
+        .section {
+            margin-bottom: 40px;
+        }
+        .section h2 {
+            color: #333;
+            border-bottom: 2px solid #667eea;
+            padding-bottom: 10px;
+            margin-bottom: 20px;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin-top: 20px;
+            background: white;
+            border-radius: 8px;
+            overflow: hidden;
+            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+        }
+        th, td {
+            padding: 12px 15px;
+            text-align: left;
+            border-bottom: 1px solid #ddd;
+        }
+        th {
+            background-color: #667eea;
+            color: white;
+            font-weight: 500;
+        }
+        tr:hover {
+            background-color: #f5f5f5;
+        }
+        .status-complete {
+            background-color: #d4edda;
+            color: #155724;
+            padding: 4px 8px;
+            border-radius: 4px;
+            font-size: 0.9em;
+        }
+        .status-partial {
+            background-color: #fff3cd;
+            color: #856404;
+            padding: 4px 8px;
+            border-radius: 4px;
+            font-size: 0.9em;
+        }
+        .status-missing {
+            background-color: #f8d7da;
+            color: #721c24;
+            padding: 4px 8px;
+            border-radius: 4px;
+            font-size: 0.9em;
+        }
+        .rate {
+            font-weight: bold;
+            color: #667eea;
+        }
+        .text-list {
+            max-width: 300px;
+            overflow: hidden;
+            text-overflow: ellipsis;
+            white-space: nowrap;
+        }
+        .text-detail {
+            background: #f8f9fa;
+            padding: 8px;
+            border-radius: 4px;
+            margin: 2px 0;
+            font-size: 0.9em;
+        }
+        .found-text {
+            color: #28a745;
+        }
+        .missing-text {
+            color: #dc3545;
+        }
+        .change-badge {
+            background: #fd7e14;
+            color: white;
+            padding: 2px 6px;
+            border-radius: 3px;
+            font-size: 0.8em;
+            margin-left: 4px;
+        }
+        .spec-id {
+            background: #667eea;
+            color: white;
+            padding: 2px 6px;
+            border-radius: 3px;
+            font-size: 0.8em;
+            font-weight: bold;
+        }
+    </style>
+</head>
+"""
+
+MATCH_TABLE_HEAD = """
+        <div class="content">
+            <div class="section">
+                <h2>✅ 구현된 텍스트들</h2>
+                <table>
+                    <thead>
+                        <tr>
+                            <th>설계서 ID</th>
+                            <th>설계서 항목</th>
+                            <th>필요한 텍스트</th>
+                            <th>구현된 텍스트</th>
+                            <th>구현률</th>
+                            <th>상태</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+"""
+
+ISSUE_TABLE_HEAD = """
+                    </tbody>
+                </table>
+            </div>
+            
+            <div class="section">
+                <h2>⚠️ 미구현된 텍스트들</h2>
+                <table>
+                    <thead>
+                        <tr>
+                            <th>설계서 ID</th>
+                            <th>설계서 항목</th>
+                            <th>필요한 텍스트</th>
+                            <th>문제점</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+"""
+
+ORPHAN_TABLE_HEAD = """
+                    </tbody>
+                </table>
+            </div>
+            
+            <div class="section">
+                <h2>🔎 설계서에 없는 디자인 텍스트</h2>
+                <table>
+                    <thead>
+                        <tr>
+                            <th>디자인 텍스트</th>
+                            <th>노드 수</th>
+                            <th>프레임</th>
+                            <th>노드 ID</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+"""
+
+# 설계서에 없는 텍스트 행마다 보여 줄 최대 프레임/노드 ID 수
+ORPHAN_LIST_LIMIT = 3
+
+REPORT_TAIL = """
+                    </tbody>
+                </table>
+            </div>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+
+def _stat_card(number, label: str) -> str:
+    return f"""
+            <div class="stat-card">
+                <div class="stat-number">{escape(str(number))}</div>
+                <div class="stat-label">{escape(label)}</div>
+            </div>"""
+
+
+def _spec_cells(result: Dict) -> str:
+    return (f'<td><span class="spec-id">{escape(str(result["spec_id"]))}</span>'
+            f'{CHANGE_BADGES.get(result.get("change"), "")}</td>'
+            f'<td><strong>{escape(str(result["spec_name"]))}</strong></td>')
+
+
+def _match_row(match: Dict) -> str:
+    parts = ['\n                        <tr>', _spec_cells(match), '<td class="text-list">']
+    for text in match['required_texts']:
+        parts.append(f'<div class="text-detail">{escape(text)}</div>')
+    parts.append('</td><td class="text-list">')
+    for found in match['found_texts']:
+        alternatives = found.get('alternatives')
+        title = f' title="다른 후보: {escape(", ".join(alt["found"] for alt in alternatives))}"' if alternatives else ''
+        parts.append(f'<div class="text-detail found-text"{title}>✓ {escape(found["found"])}</div>')
+    for missing in match['missing_texts']:
+        parts.append(f'<div class="text-detail missing-text">✗ {escape(missing)}</div>')
+    status_label = '완전 구현' if match['status'] == 'complete' else '부분 구현'
+    parts.append(f'</td><td class="rate">{match["implementation_rate"]:.1%}</td>'
+                 f'<td><span class="status-{escape(match["status"])}">{status_label}</span></td></tr>')
+    return ''.join(parts)
+
+
+def _issue_row(issue: Dict) -> str:
+    parts = ['\n                        <tr>', _spec_cells(issue), '<td class="text-list">']
+    for text in issue['required_texts']:
+        parts.append(f'<div class="text-detail missing-text">✗ {escape(text)}</div>')
+    parts.append('</td><td><span class="status-missing">모든 필요한 텍스트가 구현되지 않았습니다.</span></td></tr>')
+    return ''.join(parts)
+
+
+def _limited(values: List[str], limit: int = ORPHAN_LIST_LIMIT) -> str:
+    shown = ', '.join(escape(str(value)) for value in values[:limit])
+    return shown + (f' 외 {len(values) - limit}개' if len(values) > limit else '')
+
+
+def _orphan_row(orphan: Dict) -> str:
+    return (f'\n                        <tr><td><div class="text-detail missing-text">{escape(orphan["text"])}</div></td>'
+            f'<td class="rate">{orphan["count"]}</td>'
+            f'<td class="text-list">{_limited(orphan["frames"])}</td>'
+            f'<td class="text-list">{_limited(orphan["node_ids"])}</td></tr>')
+
+
+def _buffered(pieces: Iterable[str], chunk_size: int) -> Iterator[str]:
+    buffer: List[str] = []
+    size = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            yield ''.join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield ''.join(buffer)
+
+
+def iter_html_report(matches: List[Dict], issues: List[Dict], changes: Dict[str, int] = None,
+                     orphans: List[Dict] = None, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """HTML 보고서를 조각 단위로 생성
+
+    changes가 있으면 증분 검수 변경 내역을, orphans가 있으면 설계서에 없는 디자인 텍스트 표를 함께 표시합니다.
+    """
+    return _buffered(_iter_pieces(matches, issues, changes, orphans), chunk_size)
+
+
+def _iter_pieces(matches: List[Dict], issues: List[Dict], changes: Dict[str, int] = None,
+                 orphans: List[Dict] = None) -> Iterator[str]:
+    yield REPORT_HEAD
+    yield f"""<body>
+    <div class="container">
+        <div class="header">
+            <h1>📝 피그마 디자인 텍스트 검수 보고서</h1>
+            <p>생성일시: {datetime.now().strftime('%Y년 %m월 %d일 %H:%M:%S')}</p>
+        </div>
+        
+        <div class="stats">"""
+    counts = _report_counts(matches, issues)
+    yield _stat_card(counts['total'], '전체 설계서 항목')
+    yield _stat_card(counts['complete'], '완전 구현')
+    yield _stat_card(counts['partial'], '부분 구현')
+    yield _stat_card(counts['missing'], '미구현')
+    if changes:
+        yield _stat_card(changes['added'] + changes['modified'] + changes['removed'],
+                         f"변경된 텍스트 노드 (추가 {changes['added']} / 수정 {changes['modified']} / 삭제 {changes['removed']})")
+        yield _stat_card(changes['changed_specs'], f"결과가 바뀐 항목 ({changes['rechecked']}개 재검사)")
+    if orphans is not None:
+        yield _stat_card(sum(orphan['count'] for orphan in orphans), f"설계서에 없는 디자인 텍스트 ({len(orphans)}종류)")
+    yield """
+        </div>
+        """
+
+    # 구현된 항목들
+    yield MATCH_TABLE_HEAD
+    for match in matches:
+        yield _match_row(match)
+
+    # 미구현된 항목들
+    yield ISSUE_TABLE_HEAD
+    for issue in issues:
+        yield _issue_row(issue)
+
+    # 설계서에 없는 디자인 텍스트
+    if orphans is not None:
+        yield ORPHAN_TABLE_HEAD
+        for orphan in orphans:
+            yield _orphan_row(orphan)
+
+    yield REPORT_TAIL
+
+
+def write_html_report(fp: IO[str], matches: List[Dict], issues: List[Dict], changes: Dict[str, int] = None,
+                      orphans: List[Dict] = None) -> None:
+    """HTML 보고서를 파일 객체에 바로 기록"""
+    for chunk in iter_html_report(matches, issues, changes, orphans):
+        fp.write(chunk)
+
+
+def _report_counts(matches: List[Dict], issues: List[Dict]) -> Dict[str, int]:
+    return {
+        'total': len(matches) + len(issues),
+        'complete': sum(1 for m in matches if m['status'] == 'complete'),
+        'partial': sum(1 for m in matches if m['status'] == 'partial'),
+        'missing': len(issues),
+    }
+
+
+def _data_row(result: Dict) -> Dict:
+    row = {
+        'id': result['spec_id'],
+        'name': result['spec_name'],
+        'status': result['status'],
+        'rate': round(result['implementation_rate'], 4),
+        'required': result['required_texts'],
+        'found': [found['found'] for found in result['found_texts']],
+        'missing': result['missing_texts'],
+    }
+    if result.get('change'):
+        row['change'] = result['change']
+    return row
+
+
+def iter_report_data(matches: List[Dict], issues: List[Dict], changes: Dict[str, int] = None,
+                     orphans: List[Dict] = None, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """검수 결과를 NDJSON으로 생성 (첫 줄은 요약, 이후 설계서 항목당 한 줄)
+
+    orphans(설계서에 없는 디자인 텍스트)가 있으면 요약 줄의 orphans에 담습니다.
+    """
+    return _buffered(_iter_data_lines(matches, issues, changes, orphans), chunk_size)
+
+
+def _iter_data_lines(matches: List[Dict], issues: List[Dict], changes: Dict[str, int] = None,
+                     orphans: List[Dict] = None) -> Iterator[str]:
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+    summary = {
+        'version': REPORT_DATA_VERSION,
+        'generated_at': datetime.now().strftime('%Y년 %m월 %d일 %H:%M:%S'),
+        'counts': _report_counts(matches, issues),
+        'changes': changes,
+    }
+    if orphans is not None:
+        summary['orphans'] = orphans
+    yield encoder.encode(summary) + '\n'
+    for result in matches:
+        yield encoder.encode(_data_row(result)) + '\n'
+    for result in issues:
+        yield encoder.encode(_data_row(result)) + '\n'
+
+
+def write_report_data(fp: IO[str], matches: List[Dict], issues: List[Dict], changes: Dict[str, int] = None,
+                      orphans: List[Dict] = None) -> None:
+    """NDJSON 데이터 보고서를 파일 객체에 바로 기록"""
+    for chunk in iter_report_data(matches, issues, changes, orphans):
+        fp.write(chunk)
+
+
+def render_report_viewer(data_url: str) -> str:
+    """data_url의 NDJSON을 읽어 보여주는 정적 뷰어 HTML"""
+    with open(VIEWER_TEMPLATE, 'r', encoding='utf-8') as f:
+        template = f.read()
+    # </script> 같은 문자열이 스크립트를 끝내지 않도록 '/'도 이스케이프
+    return template.replace('__REPORT_DATA_URL__', json.dumps(data_url).replace('/', '\\/'))
+
+
+def data_file_for(report_file: str) -> str:
+    """뷰어 HTML 옆에 두는 데이터 파일 경로 (report.html → report.ndjson)"""
+    return os.path.splitext(report_file)[0] + '.ndjson'
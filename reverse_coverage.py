@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""역방향 커버리지: 어떤 설계서 항목에도 해당하지 않는 디자인 텍스트 찾기
+
+디자인 텍스트마다 모든 설계서 텍스트와 비교하지 않고, 설계서의 필요 텍스트들로
+매칭 색인(MatchIndex)을 만들어 디자인 텍스트를 조회합니다 (매칭 관계는 대칭).
+같은 디자인 텍스트는 한 번만 조회하므로 디자인 크기에 거의 선형입니다.
+"""
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from text_matcher import TextMatcher
+
+# (page, frame) → 범위 안 디자인 요소 인덱스
+ScopeIndices = Callable[[str, str], Sequence[int]]
+
+
+def uncovered_indices(texts: Sequence[str], spec_elements, matcher: TextMatcher,
+                      scope_indices: Optional[ScopeIndices] = None) -> List[int]:
+    """어느 설계서 항목의 필요 텍스트와도 매칭되지 않는 디자인 텍스트 인덱스 (오름차순)
+
+    범위(page/frame)가 지정된 항목의 텍스트는 그 범위 안의 디자인 텍스트만 덮습니다.
+    빈 텍스트(공백뿐인 텍스트 포함)는 결과에서 제외합니다.
+    """
+    # 컴파일된 설계서(CompiledSpec)는 범위별 고유 필요 텍스트를 이미 모아 두고 있음
+    scope_texts = getattr(spec_elements, 'scope_texts', None)
+    if scope_texts is not None:
+        required: Dict[Optional[Tuple[str, str]], Sequence[str]] = scope_texts()
+    else:
+        required = {}
+        for spec in spec_elements:
+            scope = (spec.page, spec.frame) if spec.scoped else None
+            required.setdefault(scope, {}).update(dict.fromkeys(spec.design_texts))
+
+    covered = [False] * len(texts)
+    # 범위 없는 항목이 가장 많이 덮으므로 먼저 처리하고, 이미 덮인 텍스트는 다시 조회하지 않음
+    for scope in sorted(required, key=lambda scope: scope is not None):
+        if scope is None:
+            candidates = range(len(texts))
+        elif scope_indices is None:
+            continue
+        else:
+            candidates = scope_indices(*scope)
+        index = matcher.index(list(required[scope]))
+        verdicts: Dict[str, bool] = {}
+        for position in candidates:
+            if covered[position]:
+                continue
+            text = texts[position]
+            verdict = verdicts.get(text)
+            if verdict is None:
+                verdict = verdicts[text] = index.find_first(text) is not None
+            covered[position] = verdict
+    return [position for position, text in enumerate(texts) if not covered[position] and text.strip()]
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""web_app 운영 서버 실행
+
+gunicorn이 설치되어 있으면 gthread 워커(프로세스 × 스레드)로, 없으면 werkzeug 멀티스레드 서버
+한 프로세스로 실행합니다. 기본은 프로세스 하나입니다: 분석 작업 큐(/jobs)와 측정값(/metrics)은
+프로세스 메모리에 있으므로, 워커 프로세스를 여럿 띄우면 /jobs/<id> 조회가 작업을 만든 프로세스가
+아닌 곳에 도착해 404가 되고 같은 작업 합치기와 /metrics도 프로세스별로 나뉩니다.
+--workers를 2 이상으로 하려면 앞단 프록시에서 클라이언트별로 같은 프로세스(포트)에 고정해야 합니다.
+추출 캐시와 컴파일된 설계서 캐시 디렉터리는 프로세스 간에 공유됩니다.
+SIGTERM/SIGINT를 받으면 새 연결을 받지 않고, 처리 중인 요청과 분석 작업이 끝날 때까지
+graceful_timeout초 기다린 뒤 종료합니다.
+
+설정은 명령행 인자 또는 환경 변수로 지정합니다.
+    WEB_HOST, WEB_PORT, WEB_WORKERS, WEB_THREADS, WEB_TIMEOUT, WEB_GRACEFUL_TIMEOUT
+요청 본문 크기 제한(MAX_REQUEST_MB)과 분석 대기 시간(ANALYSIS_TIMEOUT)은 web_app에서 읽습니다.
+"""
+import argparse
+import os
+import signal
+import threading
+import time
+
+try:
+    from gunicorn.app.base import BaseApplication
+except ImportError:  # Windows 등 gunicorn이 없는 환경
+    BaseApplication = None
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.environ.get(name, default))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='피그마 디자인 검수 웹 서버 (운영용)')
+    parser.add_argument('--host', default=os.environ.get('WEB_HOST', '0.0.0.0'), help='바인드 주소')
+    parser.add_argument('--port', type=int, default=_env_int('WEB_PORT', 5000), help='포트')
+    parser.add_argument('--workers', type=int, default=_env_int('WEB_WORKERS', 1),
+                        help='워커 프로세스 수 (gunicorn 필요, 기본: 1, 작업/측정값 상태가 프로세스별이므로 '
+                             '2 이상이면 앞단에서 클라이언트를 한 프로세스에 고정해야 함)')
+    parser.add_argument('--threads', type=int, default=_env_int('WEB_THREADS', 8),
+                        help='워커 프로세스당 요청 처리 스레드 수')
+    parser.add_argument('--timeout', type=int, default=_env_int('WEB_TIMEOUT', 330),
+                        help='요청 처리 제한 시간 (초, ANALYSIS_TIMEOUT보다 길게)')
+    parser.add_argument('--graceful-timeout', type=int, default=_env_int('WEB_GRACEFUL_TIMEOUT', 30),
+                        help='종료 신호 후 처리 중인 요청을 기다리는 시간 (초)')
+    return parser
+
+
+def _shutdown_jobs(timeout: float) -> bool:
+    """분석 작업 큐를 닫고 실행 중인 작업을 최대 timeout초 기다림 (모두 끝났으면 True)"""
+    from web_app import job_queue
+    waiter = threading.Thread(target=job_queue.shutdown, daemon=True)
+    waiter.start()
+    waiter.join(timeout)
+    return not waiter.is_alive()
+
+
+if BaseApplication is not None:
+    class _GunicornApplication(BaseApplication):
+        def __init__(self, application, options):
+            self.application = application
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return self.application
+
+
+def run_gunicorn(args) -> None:
+    from web_app import app
+
+    def worker_exit(server, worker):
+        _shutdown_jobs(args.graceful_timeout)
+
+    print(f"🚀 gunicorn으로 http://{args.host}:{args.port} 에서 실행합니다 "
+          f"(프로세스 {args.workers} × 스레드 {args.threads})")
+    if args.workers > 1:
+        print("⚠️ 분석 작업(/jobs)과 측정값(/metrics)은 프로세스별로 따로 관리됩니다. "
+              "앞단 프록시에서 클라이언트를 한 프로세스에 고정하지 않으면 작업 조회가 404가 될 수 있습니다.")
+    _GunicornApplication(app, {
+        'bind': f"{args.host}:{args.port}",
+        'workers': args.workers,
+        'threads': args.threads,
+        'worker_class': 'gthread',
+        'timeout': args.timeout,
+        'graceful_timeout': args.graceful_timeout,
+        'worker_exit': worker_exit,
+    }).run()
+
+
+class _InflightRequests:
+    """처리 중인 요청 수를 세는 WSGI 미들웨어 (종료할 때 모두 끝나기를 기다림)"""
+
+    def __init__(self, application):
+        self.application = application
+        self.count = 0
+        self._changed = threading.Condition()
+
+    def __call__(self, environ, start_response):
+        with self._changed:
+            self.count += 1
+        try:
+            # 스트리밍 응답도 본문을 다 보낼 때까지 처리 중으로 셈
+            yield from self.application(environ, start_response)
+        finally:
+            with self._changed:
+                self.count -= 1
+                self._changed.notify_all()
+
+    def wait_idle(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            while self.count:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._changed.wait(remaining)
+        return True
+
+
+def run_threaded(args) -> None:
+    from werkzeug.serving import WSGIRequestHandler, make_server
+    from web_app import app
+
+    if args.workers > 1:
+        print("⚠️ gunicorn이 없어 프로세스 하나로 실행합니다 (pip install gunicorn).")
+
+    class RequestHandler(WSGIRequestHandler):
+        # 요청을 읽는 소켓 제한 시간 (느린 클라이언트가 스레드를 붙잡지 않도록)
+        timeout = args.timeout
+
+    inflight = _InflightRequests(app)
+    server = make_server(args.host, args.port, inflight, threaded=True, request_handler=RequestHandler)
+    stopping = threading.Event()
+
+    def stop(signum, frame):
+        if not stopping.is_set():
+            stopping.set()
+            # serve_forever를 실행 중인 스레드에서 shutdown()을 부르면 멈추므로 별도 스레드에서 호출
+            threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    print(f"🚀 http://{args.host}:{args.port} 에서 실행합니다 (스레드, gunicorn 없음)")
+    try:
+        server.serve_forever()
+    finally:
+        print("🛑 새 요청을 받지 않고 처리 중인 요청을 기다립니다...")
+        started = time.monotonic()
+        if not inflight.wait_idle(args.graceful_timeout):
+            print(f"⚠️ {args.graceful_timeout}초 안에 끝나지 않은 요청 {inflight.count}개를 중단합니다.")
+        jobs_done = _shutdown_jobs(max(0.0, args.graceful_timeout - (time.monotonic() - started)))
+        server.server_close()
+        if not jobs_done:
+            print("⚠️ 끝나지 않은 분석 작업을 중단하고 종료합니다.")
+            os._exit(1)
+        print("✅ 서버를 종료했습니다.")
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if BaseApplication is not None:
+        run_gunicorn(args)
+    else:
+        run_threaded(args)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""컴파일된 설계서: 필요 텍스트를 항목 간에 중복 없이 모은 조회 구조
+
+설계서 항목들의 필요 텍스트를 고유 텍스트 목록으로 모으고 항목마다 그 텍스트 ID를 들고 있으므로,
+검수할 때 고유 텍스트마다 (범위별로) 한 번만 디자인 색인을 조회하고 결과를 항목들에 나눠 줍니다.
+매칭 설정별 정규화 텍스트도 미리 계산해 두며, pickle로 저장해 다음 실행에서 파싱/컴파일 없이 다시 읽습니다.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+from dataclasses import fields
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from text_matcher import TextMatcher
+
+# 저장 형식 버전 (CompiledSpec 구조가 바뀌면 올림)
+FORMAT_VERSION = 1
+
+# 검색 범위 (page, frame), 범위 없는 항목은 None
+Scope = Optional[Tuple[str, str]]
+
+
+def spec_scope(spec) -> Scope:
+    return (spec.page, spec.frame) if spec.scoped else None
+
+
+def source_digest(data: bytes) -> str:
+    """설계서 원본 내용의 해시 (저장된 컴파일 결과가 최신인지 확인용)"""
+    return hashlib.sha256(data).hexdigest()
+
+
+class CompiledSpec(Sequence):
+    """설계서 항목 목록 + 고유 필요 텍스트 색인
+
+    항목 목록처럼 순회/인덱싱할 수 있어 SpecificationElement 목록 자리에 그대로 씁니다.
+    - texts: 고유 필요 텍스트 (처음 나온 순서), spec_text_ids: 항목별 필요 텍스트 ID (원래 순서, 중복 포함)
+    - text_spec_ids: 필요 텍스트 → 그 텍스트를 가진 항목 ID들
+    - scopes: 범위 → (그 범위 항목 위치들, 그 범위의 고유 텍스트 ID들)
+    """
+
+    def __init__(self, specs: Sequence, source: Optional[str] = None):
+        self.specs = list(specs)
+        self.source = source
+        self.texts: List[str] = []
+        self.spec_text_ids: List[Tuple[int, ...]] = []
+        self.scopes: Dict[Scope, Tuple[List[int], List[int]]] = {}
+        # 매칭 설정 signature → texts의 정규화 결과
+        self._normalized: Dict[str, List[str]] = {}
+
+        text_ids: Dict[str, int] = {}
+        for position, spec in enumerate(self.specs):
+            positions, scope_text_ids = self.scopes.setdefault(spec_scope(spec), ([], []))
+            positions.append(position)
+            ids = []
+            for text in spec.design_texts:
+                text_id = text_ids.get(text)
+                if text_id is None:
+                    text_id = text_ids[text] = len(self.texts)
+                    self.texts.append(text)
+                ids.append(text_id)
+            self.spec_text_ids.append(tuple(ids))
+            scope_text_ids.extend(ids)
+        for positions, scope_text_ids in self.scopes.values():
+            scope_text_ids[:] = dict.fromkeys(scope_text_ids)
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    def __getitem__(self, index):
+        return self.specs[index]
+
+    @property
+    def text_spec_ids(self) -> Dict[str, List[str]]:
+        """필요 텍스트 → 그 텍스트를 가진 항목 ID들 (처음 쓸 때 만듦)"""
+        mapping = self.__dict__.get('_text_spec_ids')
+        if mapping is None:
+            by_text: List[Dict[str, None]] = [{} for _ in self.texts]
+            for spec, text_ids in zip(self.specs, self.spec_text_ids):
+                for text_id in text_ids:
+                    by_text[text_id][spec.id] = None
+            mapping = self._text_spec_ids = {text: list(spec_ids) for text, spec_ids in zip(self.texts, by_text)}
+        return mapping
+
+    def __getstate__(self):
+        # 항목은 필드 값으로 저장하고 (스크립트로 실행한 __main__의 클래스를 참조하지 않도록)
+        # 필요 텍스트는 texts/spec_text_ids로 복원하므로 빼서 다시 읽는 객체 수를 줄임
+        state = self.__dict__.copy()
+        state.pop('_text_spec_ids', None)
+        names = [field.name for field in fields(self.specs[0])] if self.specs else []
+        state['specs'] = [tuple(None if name == 'design_texts' else getattr(spec, name) for name in names)
+                          for spec in self.specs]
+        return state
+
+    def __setstate__(self, state):
+        from design_checker import SpecificationElement
+        texts = state['texts']
+        specs = []
+        for values, text_ids in zip(state['specs'], state['spec_text_ids']):
+            spec = SpecificationElement(*values)
+            spec.design_texts = [texts[text_id] for text_id in text_ids]
+            specs.append(spec)
+        state['specs'] = specs
+        self.__dict__.update(state)
+
+    def scope_texts(self) -> Dict[Scope, List[str]]:
+        """범위 → 그 범위 항목들의 고유 필요 텍스트 (처음 나온 순서)"""
+        return {scope: [self.texts[text_id] for text_id in text_ids]
+                for scope, (_, text_ids) in self.scopes.items()}
+
+    def normalized_texts(self, matcher: TextMatcher) -> List[str]:
+        """매칭 설정으로 정규화한 고유 텍스트 (설정별로 한 번만 계산해 함께 저장)"""
+        normalized = self._normalized.get(matcher.signature)
+        if normalized is None:
+            normalized = self._normalized[matcher.signature] = [matcher.normalize(text) for text in self.texts]
+        return normalized
+
+    def save(self, path: str) -> None:
+        """pickle로 저장 (같은 디렉터리의 임시 파일에 쓴 뒤 교체하므로 동시에 읽어도 안전)"""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((FORMAT_VERSION, self), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+def load_compiled_spec(path: str, source: Optional[str] = None) -> Optional[CompiledSpec]:
+    """저장된 컴파일 결과 (없거나, 형식이 다르거나, source 해시가 다르면 None)
+
+    pickle 파일이므로 직접 만든 캐시 파일만 읽어야 합니다.
+    """
+    try:
+        with open(path, 'rb') as f:
+            version, compiled = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError, ValueError):
+        return None
+    if version != FORMAT_VERSION or not isinstance(compiled, CompiledSpec):
+        return None
+    if source is not None and compiled.source != source:
+        return None
+    return compiled
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""성능 측정용 합성 피그마 문서/설계서 생성기
+
+같은 시드와 옵션이면 항상 같은 문서를 만듭니다.
+문서는 페이지(CANVAS) → 화면 프레임 → 오토 레이아웃 프레임/그룹/인스턴스 → TEXT/도형 구조이고,
+설계서는 문서에 실제로 있는 텍스트(일부는 변형/누락)로 항목을 만듭니다.
+FakeFigmaServer는 생성한 문서를 피그마 REST API처럼 제공하는 로컬 서버입니다 (지연/429/5xx 재현).
+"""
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+# 한국어/영어 UI 문구 재료
+KOREAN_WORDS = ['캠페인', '생성형AI', '진행중', '대기', '완료', '처리 현황', '필터', '검색', '상태', '생성일',
+                '수정일', '생성자', '다음', '이전', '저장', '취소', '확인', '삭제', '목록', '상세', '설정', '알림',
+                '사용자', '관리', '등록', '수정', '조회', '결과', '전체', '선택']
+ENGLISH_WORDS = ['Campaign', 'Save', 'Cancel', 'Submit', 'Next', 'Previous', 'Search', 'Filter', 'Status',
+                 'Created', 'Updated', 'Owner', 'Settings', 'Delete', 'Confirm', 'Dashboard', 'Report', 'Export',
+                 'Import', 'User', 'Account', 'Profile', 'Overview', 'Details']
+SCREEN_NAMES = ['목록', '상세', '등록', '수정', '설정', '대시보드', 'Login', 'Home', 'Settings', 'Report']
+_CONTAINER_TYPES = ('FRAME', 'GROUP', 'INSTANCE', 'COMPONENT')
+
+
+def make_text(rng: random.Random, korean_ratio: float = 0.7) -> str:
+    """UI 문구 하나 (라벨, 버튼, 안내 문장, 숫자가 붙은 항목)"""
+    words = KOREAN_WORDS if rng.random() < korean_ratio else ENGLISH_WORDS
+    roll = rng.random()
+    if roll < 0.5:
+        return rng.choice(words)
+    if roll < 0.8:
+        return ' '.join(rng.choice(words) for _ in range(rng.randint(2, 3)))
+    if roll < 0.9:
+        return f"{rng.choice(words)} {rng.randint(1, 999)}"
+    return ' '.join(rng.choice(words) for _ in range(rng.randint(5, 10)))
+
+
+class _DocumentBuilder:
+    def __init__(self, rng: random.Random, depth: int, fanout: int, text_ratio: float, korean_ratio: float,
+                 max_nodes: Optional[int]):
+        self.rng = rng
+        self.depth = depth
+        self.fanout = fanout
+        self.text_ratio = text_ratio
+        self.korean_ratio = korean_ratio
+        self.max_nodes = max_nodes
+        self.count = 0
+
+    def _id(self) -> str:
+        self.count += 1
+        return f"{self.count // 1000}:{self.count % 1000}"
+
+    def _full(self) -> bool:
+        return self.max_nodes is not None and self.count >= self.max_nodes
+
+    def _box(self) -> Dict[str, float]:
+        rng = self.rng
+        return {'x': round(rng.uniform(0, 1440), 1), 'y': round(rng.uniform(0, 4000), 1),
+                'width': round(rng.uniform(8, 600), 1), 'height': round(rng.uniform(8, 200), 1)}
+
+    def _fills(self) -> List[Dict[str, Any]]:
+        rng = self.rng
+        return [{'blendMode': 'NORMAL', 'type': 'SOLID',
+                 'color': {'r': round(rng.random(), 3), 'g': round(rng.random(), 3), 'b': round(rng.random(), 3),
+                           'a': 1}}]
+
+    def text(self) -> Dict[str, Any]:
+        characters = make_text(self.rng, self.korean_ratio)
+        return {
+            'id': self._id(), 'name': characters[:30], 'type': 'TEXT',
+            'characters': characters,
+            'absoluteBoundingBox': self._box(),
+            'constraints': {'vertical': 'TOP', 'horizontal': 'LEFT'},
+            'fills': self._fills(), 'strokes': [], 'effects': [],
+            'style': {'fontFamily': 'Pretendard', 'fontWeight': self.rng.choice([400, 500, 700]),
+                      'fontSize': self.rng.choice([12, 14, 16, 20, 24]), 'textAlignHorizontal': 'LEFT',
+                      'letterSpacing': 0, 'lineHeightPx': 22},
+            'characterStyleOverrides': [], 'styleOverrideTable': {},
+        }
+
+    def shape(self) -> Dict[str, Any]:
+        rng = self.rng
+        node_type = rng.choice(['RECTANGLE', 'VECTOR', 'ELLIPSE', 'LINE'])
+        node = {'id': self._id(), 'name': node_type.title(), 'type': node_type,
+                'absoluteBoundingBox': self._box(), 'fills': self._fills(), 'strokes': [],
+                'strokeWeight': 1, 'effects': []}
+        if node_type == 'VECTOR':
+            node['fillGeometry'] = [{'path': ' '.join(f"L {rng.randint(0, 99)} {rng.randint(0, 99)}"
+                                                      for _ in range(rng.randint(4, 24))),
+                                     'windingRule': 'NONZERO'}]
+        return node
+
+    def container(self, level: int, name: str = None, node_type: str = None) -> Dict[str, Any]:
+        rng = self.rng
+        node_type = node_type or rng.choice(_CONTAINER_TYPES)
+        node = {'id': self._id(), 'name': name or f"{node_type.title()} {self.count}", 'type': node_type,
+                'absoluteBoundingBox': self._box(), 'fills': self._fills(), 'strokes': [], 'effects': [],
+                'constraints': {'vertical': 'TOP', 'horizontal': 'LEFT'}, 'children': []}
+        if node_type == 'FRAME' and rng.random() < 0.6:
+            padding = rng.choice([0, 8, 16, 24])
+            node.update({'layoutMode': rng.choice(['VERTICAL', 'HORIZONTAL']), 'itemSpacing': rng.choice([4, 8, 12]),
+                         'paddingLeft': padding, 'paddingRight': padding,
+                         'paddingTop': padding, 'paddingBottom': padding})
+        if node_type == 'INSTANCE':
+            node['componentId'] = f"{rng.randint(1, 200)}:{rng.randint(1, 999)}"
+        self.fill(node, level + 1)
+        return node
+
+    def fill(self, node: Dict[str, Any], level: int) -> None:
+        rng = self.rng
+        children = node['children']
+        for _ in range(rng.randint(1, 2 * self.fanout - 1)):
+            if self._full():
+                break
+            roll = rng.random()
+            if level >= self.depth:
+                # 가장 깊은 단계에서는 TEXT와 도형만 (같은 비율 유지)
+                roll *= self.text_ratio + 0.15
+            if roll < self.text_ratio:
+                children.append(self.text())
+            elif roll < self.text_ratio + 0.15:
+                children.append(self.shape())
+            else:
+                children.append(self.container(level))
+
+
+def generate_document(seed: int = 0, pages: int = 3, screens: int = 8, depth: int = 5, fanout: int = 4,
+                      text_ratio: float = 0.35, korean_ratio: float = 0.7,
+                      max_nodes: Optional[int] = None) -> Dict[str, Any]:
+    """피그마 파일 API 응답 형태의 합성 문서
+
+    - pages × screens개의 화면 프레임 아래를 depth 단계까지 채움
+    - fanout: 컨테이너당 평균 자식 수 (1 ~ 2×fanout-1개)
+    - text_ratio: 자식 중 TEXT 비율, korean_ratio: 한국어 문구 비율
+    - max_nodes: 전체 노드 수 상한 (도달하면 생성 중단)
+    """
+    rng = random.Random(seed)
+    builder = _DocumentBuilder(rng, depth, fanout, text_ratio, korean_ratio, max_nodes)
+    document = {'id': '0:0', 'name': 'Document', 'type': 'DOCUMENT', 'children': []}
+    for page_number in range(pages):
+        page = {'id': builder._id(), 'name': f"페이지 {page_number + 1}", 'type': 'CANVAS',
+                'backgroundColor': {'r': 0.96, 'g': 0.96, 'b': 0.96, 'a': 1}, 'children': []}
+        document['children'].append(page)
+        for screen_number in range(screens):
+            if builder._full():
+                break
+            name = f"{rng.choice(SCREEN_NAMES)} / {page_number + 1}-{screen_number + 1}"
+            page['children'].append(builder.container(1, name, 'FRAME'))
+    return {
+        'name': f'synthetic-{seed}',
+        'lastModified': '2025-01-01T00:00:00Z',
+        'version': str(seed),
+        'document': document,
+        'components': {},
+        'styles': {},
+        'schemaVersion': 0,
+    }
+
+
+def _screen_texts(document: Dict[str, Any]):
+    """(페이지 이름, 화면 이름, 화면 안 텍스트 목록)"""
+    screens = []
+    for page in document['document']['children']:
+        for screen in page.get('children', []):
+            texts = []
+            stack = [screen]
+            while stack:
+                node = stack.pop()
+                if node.get('type') == 'TEXT':
+                    texts.append(node['characters'])
+                stack.extend(reversed(node.get('children', [])))
+            if texts:
+                screens.append((page['name'], screen['name'], texts))
+    return screens
+
+
+def generate_specification(document: Dict[str, Any], spec_count: int = 200, texts_per_spec: int = 5,
+                           missing_ratio: float = 0.1, variant_ratio: float = 0.1, scoped_ratio: float = 0.5,
+                           seed: int = 0) -> Dict[str, Any]:
+    """문서에 맞는 설계서 (specification.json 형식)
+
+    필요 텍스트는 한 화면의 텍스트에서 고르고, missing_ratio만큼은 없는 문구,
+    variant_ratio만큼은 띄어쓰기를 뺀 변형으로 바꿉니다.
+    scoped_ratio만큼의 항목은 그 화면(page/frame)으로 검색 범위를 지정합니다.
+    """
+    rng = random.Random(seed)
+    screens = _screen_texts(document)
+    specifications = []
+    for number in range(spec_count):
+        page_name, screen_name, texts = rng.choice(screens)
+        design_texts = []
+        for _ in range(rng.randint(1, 2 * texts_per_spec - 1)):
+            roll = rng.random()
+            if roll < missing_ratio:
+                # 어휘에 없는 문구라 포함 관계로도 매칭되지 않음
+                design_texts.append(f"미구현 문구 {rng.randint(1, 99999)}")
+            elif roll < missing_ratio + variant_ratio:
+                design_texts.append(rng.choice(texts).replace(' ', ''))
+            else:
+                design_texts.append(rng.choice(texts))
+        spec = {
+            'id': str(number + 1),
+            'name': f"{screen_name} 항목 {number + 1}",
+            'text_content': design_texts[0],
+            'description': f"{page_name} {screen_name} 화면",
+            'category': rng.choice(['page', 'filter', 'search', 'list', 'button', 'modal']),
+            'priority': rng.choice(['high', 'medium', 'low']),
+            'design_texts': design_texts,
+        }
+        if rng.random() < scoped_ratio:
+            spec.update({'page': page_name, 'frame': screen_name})
+        specifications.append(spec)
+    return {
+        'project_name': document.get('name', 'synthetic'),
+        'version': '1.0',
+        'created_date': '2025-01-01',
+        'specifications': specifications,
+    }
+
+
+def count_nodes(document: Dict[str, Any]) -> int:
+    count = 0
+    stack = [document['document']]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.get('children', []))
+    return count
+
+
+def _index_nodes(document: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    nodes = {}
+    stack = [document['document']]
+    while stack:
+        node = stack.pop()
+        nodes[node['id']] = node
+        stack.extend(node.get('children', []))
+    return nodes
+
+
+class FakeFigmaServer:
+    """합성 문서를 /v1/files/{key}, /v1/files/{key}/nodes로 제공하는 로컬 HTTP 서버
+
+    latency: 응답마다 기다리는 시간 (초, 네트워크 지연 재현)
+    rate_limit_every: N번째 요청마다 429 + Retry-After(retry_after초) 응답
+    error_every: N번째 요청마다 503 응답
+    malformed_every: N번째 요청마다 중간에 잘린 JSON 본문으로 200 응답
+    request_count/max_inflight는 받은 요청 수와 동시에 처리한 최대 요청 수, requests는 받은 요청의
+    (경로, 쿼리 파라미터) 목록입니다.
+    with 블록 안에서 base_url로 접속합니다.
+    """
+
+    def __init__(self, documents: Dict[str, Dict[str, Any]], latency: float = 0.0, rate_limit_every: int = 0,
+                 retry_after: float = 0.0, error_every: int = 0, malformed_every: int = 0,
+                 token: Optional[str] = None):
+        self.documents = documents
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.error_every = error_every
+        self.malformed_every = malformed_every
+        self.token = token
+        self.request_count = 0
+        self.max_inflight = 0
+        self.requests: List[Tuple[str, Dict[str, List[str]]]] = []
+        self._inflight = 0
+        self._lock = threading.Lock()
+        self._nodes: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/v1"
+
+    def __enter__(self) -> 'FakeFigmaServer':
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                fake._handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _respond(self, handler, status: int, body: Dict[str, Any], headers: Dict[str, str] = None,
+                 truncate: bool = False) -> None:
+        payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        if truncate:
+            payload = payload[:len(payload) // 2]
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json; charset=utf-8')
+        handler.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+    def _handle(self, handler) -> None:
+        url = urlparse(handler.path)
+        query = parse_qs(url.query)
+        with self._lock:
+            self.request_count += 1
+            number = self.request_count
+            self.requests.append((url.path, query))
+            self._inflight += 1
+            self.max_inflight = max(self.max_inflight, self._inflight)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            if self.token is not None and handler.headers.get('X-Figma-Token') != self.token:
+                return self._respond(handler, 403, {'status': 403, 'err': 'Invalid token'})
+            if self.rate_limit_every and number % self.rate_limit_every == 0:
+                return self._respond(handler, 429, {'status': 429, 'err': 'Rate limit exceeded'},
+                                     {'Retry-After': f"{self.retry_after:g}", 'X-Figma-Rate-Limit-Type': 'low'})
+            if self.error_every and number % self.error_every == 0:
+                return self._respond(handler, 503, {'status': 503, 'err': 'Service unavailable'})
+            if self.malformed_every and number % self.malformed_every == 0:
+                return self._respond(handler, 200, {'status': 200, 'err': None, 'document': {}}, truncate=True)
+
+            parts = url.path.strip('/').split('/')
+            if len(parts) < 3 or parts[:2] != ['v1', 'files'] or parts[2] not in self.documents:
+                return self._respond(handler, 404, {'status': 404, 'err': 'Not found'})
+            document = self.documents[parts[2]]
+            if parts[3:] == ['nodes']:
+                nodes = self._nodes.get(parts[2])
+                if nodes is None:
+                    nodes = self._nodes[parts[2]] = _index_nodes(document)
+                ids = [node_id for value in query.get('ids', []) for node_id in value.split(',') if node_id]
+                body = {key: document[key] for key in ('name', 'lastModified', 'version')}
+                body['nodes'] = {node_id: {'document': nodes[node_id], 'components': {}, 'styles': {}}
+                                 if node_id in nodes else None for node_id in ids}
+                return self._respond(handler, 200, body)
+            if parts[3:]:
+                return self._respond(handler, 404, {'status': 404, 'err': 'Not found'})
+            if query.get('depth') == ['1']:
+                root = dict(document['document'])
+                root['children'] = [{key: value for key, value in page.items() if key != 'children'}
+                                    for page in root.get('children', [])]
+                return self._respond(handler, 200, dict(document, document=root))
+            return self._respond(handler, 200, document)
+        finally:
+            with self._lock:
+                self._inflight -= 1
+
+
+def add_document_arguments(parser: argparse.ArgumentParser) -> None:
+    """문서 생성 옵션 (benchmark.py에서도 같은 옵션을 사용)"""
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--pages', type=int, default=3)
+    parser.add_argument('--screens', type=int, default=8, help='페이지당 화면 프레임 수')
+    parser.add_argument('--depth', type=int, default=5)
+    parser.add_argument('--fanout', type=int, default=4)
+    parser.add_argument('--text-ratio', type=float, default=0.35)
+    parser.add_argument('--korean-ratio', type=float, default=0.7)
+    parser.add_argument('--max-nodes', type=int, default=None)
+
+
+def add_generator_arguments(parser: argparse.ArgumentParser) -> None:
+    """문서 + 설계서 생성 옵션"""
+    add_document_arguments(parser)
+    parser.add_argument('--specs', type=int, default=200)
+    parser.add_argument('--texts-per-spec', type=int, default=5)
+    parser.add_argument('--missing-ratio', type=float, default=0.1)
+    parser.add_argument('--scoped-ratio', type=float, default=0.5)
+
+
+def document_from_args(args) -> Dict[str, Any]:
+    return generate_document(args.seed, args.pages, args.screens, args.depth, args.fanout,
+                             args.text_ratio, args.korean_ratio, args.max_nodes)
+
+
+def generate_from_args(args) -> tuple:
+    """(문서, 설계서) 생성"""
+    document = document_from_args(args)
+    specification = generate_specification(document, args.specs, args.texts_per_spec, args.missing_ratio,
+                                           scoped_ratio=args.scoped_ratio, seed=args.seed)
+    return document, specification
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='성능 측정용 합성 피그마 문서/설계서 생성')
+    parser.add_argument('design_file', help='저장할 피그마 JSON 경로')
+    parser.add_argument('spec_file', help='저장할 설계서 JSON 경로')
+    add_generator_arguments(parser)
+    args = parser.parse_args(argv)
+
+    document, specification = generate_from_args(args)
+    with open(args.design_file, 'w', encoding='utf-8') as f:
+        json.dump(document, f, ensure_ascii=False)
+    with open(args.spec_file, 'w', encoding='utf-8') as f:
+        json.dump(specification, f, ensure_ascii=False, indent=2)
+    print(f"✅ 노드 {count_nodes(document):,}개 문서를 {args.design_file}에, "
+          f"설계서 항목 {len(specification['specifications']):,}개를 {args.spec_file}에 저장했습니다.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
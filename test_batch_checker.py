@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""일괄 검수 시험 (매니페스트/패턴으로 쌍 만들기, 쌍별 결과와 실패 처리)
+
+    python -m pytest -q test_batch_checker.py
+"""
+import json
+import os
+
+import pytest
+
+from batch_checker import SUMMARY_FILE, load_manifest, pairs_from_glob, run_batch
+from synthetic_figma import generate_document, generate_specification
+
+
+def _write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    return str(path)
+
+
+@pytest.fixture
+def design_files(tmp_path):
+    designs = tmp_path / 'designs'
+    designs.mkdir()
+    files = []
+    for seed in range(2):
+        document = generate_document(seed=seed, pages=2, screens=2, depth=3)
+        files.append((_write_json(designs / f"design{seed}.json", document),
+                      _write_json(tmp_path / f"spec{seed}.json", generate_specification(document, 20, seed=seed))))
+    return files
+
+
+def test_load_manifest_resolves_relative_paths(tmp_path):
+    manifest = _write_json(tmp_path / 'manifest.json', {'pairs': [
+        {'design': 'designs/a.json', 'spec': 'spec.json'}, ['b.json', '/abs/spec.json']]})
+
+    assert load_manifest(manifest) == [(str(tmp_path / 'designs' / 'a.json'), str(tmp_path / 'spec.json')),
+                                       (str(tmp_path / 'b.json'), '/abs/spec.json')]
+
+
+def test_pairs_from_glob(tmp_path, design_files):
+    pattern = str(tmp_path / 'designs' / '*.json')
+
+    assert pairs_from_glob(pattern, 'spec.json') == [(design, 'spec.json') for design, _ in design_files]
+
+
+def test_run_batch_summary(tmp_path, design_files):
+    output_dir = str(tmp_path / 'reports')
+    summary = run_batch(design_files, output_dir, workers=2)
+
+    assert (summary['total'], summary['succeeded'], summary['failed']) == (2, 2, 0)
+    assert [result['design'] for result in summary['results']] == [design for design, _ in design_files]
+    assert all(os.path.exists(result['report']) for result in summary['results'])
+    assert summary['spec_items'] == 40
+    assert summary['complete'] + summary['partial'] + summary['missing'] == 40
+    with open(os.path.join(output_dir, SUMMARY_FILE), encoding='utf-8') as f:
+        assert json.load(f)['results'] == summary['results']
+
+
+def test_missing_spec_file_fails_pair(tmp_path, design_files):
+    """설계서 파일이 없으면 빈 설계서로 통과시키지 않고 그 쌍을 실패로 기록"""
+    (design, spec), (other_design, _) = design_files
+    summary = run_batch([(design, spec), (other_design, str(tmp_path / 'missing.json'))],
+                        str(tmp_path / 'reports'), workers=1)
+
+    assert (summary['succeeded'], summary['failed']) == (1, 1)
+    failed = summary['results'][1]
+    assert failed['status'] == 'error'
+    assert failed['error'].startswith('FileNotFoundError') and 'missing.json' in failed['error']
+
+
+def test_snapshot_and_orphans_per_pair(tmp_path, design_files):
+    """snapshot_dir/find_orphans는 쌍마다 전달 (두 번째 실행은 쌍별 스냅샷으로 증분 검수)"""
+    snapshot_dir = str(tmp_path / 'snapshots')
+    first = run_batch(design_files, str(tmp_path / 'first'), workers=2, snapshot_dir=snapshot_dir, find_orphans=True)
+    second = run_batch(design_files, str(tmp_path / 'second'), workers=2, snapshot_dir=snapshot_dir)
+
+    snapshots = [result['snapshot'] for result in first['results']]
+    assert len(set(snapshots)) == 2 and all(os.path.exists(snapshot) for snapshot in snapshots)
+    assert [result['snapshot'] for result in second['results']] == snapshots
+    assert all(result['orphan_texts'] > 0 for result in first['results'])
+    assert all('orphan_texts' not in result for result in second['results'])
+    for before, after in zip(first['results'], second['results']):
+        compare = next(stage for stage in after['metrics']['stages'] if stage['name'] == 'compare')
+        assert compare['items'] == 0
+        assert (after['complete'], after['partial'], after['missing']) == \
+            (before['complete'], before['partial'], before['missing'])
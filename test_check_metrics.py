@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""검수 단계별 측정값 시험
+
+    python -m pytest -q test_check_metrics.py
+"""
+import threading
+import time
+
+from check_metrics import CheckMetrics, MetricsRegistry
+
+
+def _busy(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_cpu_time_excludes_other_threads():
+    """다른 스레드가 CPU를 쓰는 동안 기다리기만 한 단계의 CPU 시간은 0에 가까움"""
+    worker = threading.Thread(target=_busy, args=(0.3,))
+    metrics = CheckMetrics()
+    with metrics.stage('wait'):
+        worker.start()
+        worker.join()
+    with metrics.stage('busy'):
+        _busy(0.1)
+
+    wait, busy = metrics.stages
+    assert wait.wall_seconds >= 0.3
+    assert wait.cpu_seconds < 0.05
+    assert busy.cpu_seconds > 0.05
+
+
+def test_registry_renders_counters():
+    metrics = CheckMetrics()
+    with metrics.stage('download') as stage:
+        stage.bytes_read = 1024
+    with metrics.stage('extract') as stage:
+        stage.nodes = 10
+        stage.items = 3
+    registry = MetricsRegistry()
+    registry.observe(metrics)
+    registry.observe(metrics, failed=True)
+    text = registry.render_prometheus()
+
+    assert 'design_check_runs_total 2' in text
+    assert 'design_check_failures_total 1' in text
+    assert 'design_check_stage_read_bytes_total{stage="download"} 2048' in text
+    assert 'design_check_stage_nodes_total{stage="extract"} 20' in text
+    assert 'design_check_stage_duration_seconds_count{stage="extract"} 2' in text
+    assert metrics.to_dict()['stages'][0]['bytes_read'] == 1024
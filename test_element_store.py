@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""추출 결과 저장 파일(ElementStore) 시험 (저장/읽기가 같은 요소, 열 단위 읽기, 형식 검사)
+
+    python -m pytest -q test_element_store.py
+"""
+import os
+
+import pytest
+
+from design_checker import DesignChecker, DesignElement, _element_column
+from element_store import ElementStore, ElementStoreError, write_element_store
+from node_hierarchy import DesignNode, ancestors
+from synthetic_figma import generate_document, generate_specification
+
+
+def _chain(element):
+    return [(node.id, node.name, node.type) for node in ancestors(element.parent)]
+
+
+@pytest.fixture(scope='module')
+def document():
+    return generate_document(seed=6, pages=2, screens=3, depth=4)
+
+
+@pytest.fixture
+def stored(tmp_path, document):
+    elements = DesignChecker().extract_design_elements(document)
+    path = str(tmp_path / 'elements.bin')
+    write_element_store(path, elements, meta={'file_key': '파일', 'version': '3'})
+    with ElementStore(path) as store:
+        yield elements, store
+
+
+def test_roundtrip(stored):
+    elements, store = stored
+
+    assert store.meta == {'file_key': '파일', 'version': '3'}
+    assert len(store) == len(elements)
+    assert list(store) == elements
+    assert [_chain(element) for element in store] == [_chain(element) for element in elements]
+    assert store[-1] == elements[-1] and store[2:5] == elements[2:5]
+    with pytest.raises(IndexError):
+        store[len(elements)]
+    # 같은 상위 노드는 요소끼리 같은 객체를 공유
+    loaded = list(store)
+    shared = [(i, j) for i in range(len(elements)) for j in range(i) if elements[i].parent is elements[j].parent]
+    assert shared and all(loaded[i].parent is loaded[j].parent for i, j in shared)
+
+
+def test_columns(stored):
+    elements, store = stored
+
+    for field in ('id', 'name', 'text_content', 'path'):
+        assert store.column(field) == [getattr(element, field) for element in elements]
+    assert store.column('text_content', [3, 0]) == [elements[3].text_content, elements[0].text_content]
+    assert [_chain(element) for element in store] == [[(node.id, node.name, node.type) for node in ancestors(parent)]
+                                                      for parent in _element_column(store, 'parent')]
+
+
+def test_values_and_wrapper_nodes(tmp_path):
+    """None/빈 값, 서로게이트, dict 속성을 그대로 복원하고 type 없는 래퍼 노드는 계층에서 뺌"""
+    page = DesignNode('1:0', '페이지', 'CANVAS', DesignNode('root', '', None))
+    elements = [
+        DesignElement('1:1', '제목', 'TEXT', '😀 \ud800', '', '', None, DesignNode('1:2', '프레임', 'FRAME', page)),
+        DesignElement('1:3', '', 'TEXT', '본문', None, 'document.children[0]', {'fontSize': 12, 'fills': []}),
+    ]
+    path = str(tmp_path / 'values.bin')
+    write_element_store(path, elements)
+
+    with ElementStore(path) as store:
+        assert list(store) == elements and store.meta == {}
+        assert store[0].text_content == '😀 \ud800' and store[1].description is None
+        assert _chain(store[0]) == [('1:2', '프레임', 'FRAME'), ('1:0', '페이지', 'CANVAS')]
+        assert store[0].parent.parent.parent is None and store[1].parent is None
+
+
+def test_rejects_broken_files(tmp_path, stored):
+    _, store = stored
+    with open(store.path, 'rb') as f:
+        data = f.read()
+    for name, broken in (('short', data[:10]), ('magic', b'XXXX' + data[4:]), ('truncated', data[:-1])):
+        path = str(tmp_path / f"{name}.bin")
+        with open(path, 'wb') as f:
+            f.write(broken)
+        with pytest.raises(ElementStoreError):
+            ElementStore(path)
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+
+def test_checker_results_from_store(stored, document):
+    """저장 파일을 design_elements로 써도 검수 결과가 같음"""
+    elements, store = stored
+    specification = generate_specification(document, 60, seed=6)
+    results = []
+    for design_elements in (elements, store):
+        checker = DesignChecker()
+        checker.design_elements = design_elements
+        checker.spec_elements = checker._specs_from_data(specification)
+        results.append(checker.compare_elements())
+
+    assert results[0] == results[1]
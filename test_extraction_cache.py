@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""추출 결과 디스크 캐시 시험 (저장/읽기, 버전 구분, 크기 제한 정리, 항목별 잠금)
+
+    python -m pytest -q test_extraction_cache.py
+"""
+import os
+import threading
+import time
+
+import pytest
+
+from design_checker import DesignChecker
+from extraction_cache import ExtractionCache
+from synthetic_figma import generate_document
+
+
+@pytest.fixture(scope='module')
+def elements():
+    return DesignChecker().extract_design_elements(generate_document(seed=5, pages=2, screens=2, depth=3))
+
+
+def _cache_files(cache, suffix):
+    return sorted(name for name in os.listdir(cache.cache_dir) if name.endswith(suffix))
+
+
+def test_put_and_get_roundtrip(tmp_path, elements):
+    cache = ExtractionCache(str(tmp_path))
+    assert cache.get('file', 'v1') is None
+
+    stored = cache.put('file', 'v1', elements)
+
+    assert list(stored) == elements
+    assert cache.get('file', 'v1') is stored
+    # 다른 버전, 다른 프로세스(새 캐시 객체)
+    assert cache.get('file', 'v2') is None
+    assert list(ExtractionCache(str(tmp_path)).get('file', 'v1')) == elements
+
+
+def test_version_key():
+    assert ExtractionCache.version_key({'version': '12', 'lastModified': '2024-01-01T00:00:00Z'}) == \
+        '12@2024-01-01T00:00:00Z'
+    assert ExtractionCache.version_key({'version': '12'}) == '12@'
+    assert ExtractionCache.version_key({'name': '버전 없음'}) is None
+
+
+def test_evicts_least_recently_used(tmp_path, elements):
+    cache = ExtractionCache(str(tmp_path))
+    cache.put('a', 'v', elements)
+    entry_size = os.path.getsize(os.path.join(cache.cache_dir, _cache_files(cache, '.bin')[0]))
+    cache.max_bytes = entry_size * 2
+    cache.put('b', 'v', elements)
+    # a를 최근에 사용한 것으로 만든 뒤 c를 넣으면 b가 정리됨
+    past = time.time() - 60
+    for name in _cache_files(cache, '.bin'):
+        os.utime(os.path.join(cache.cache_dir, name), (past, past))
+    assert cache.get('a', 'v') is not None
+
+    cache.put('c', 'v', elements)
+
+    assert cache.get('b', 'v') is None
+    assert cache.get('a', 'v') is not None and cache.get('c', 'v') is not None
+    assert len(_cache_files(cache, '.bin')) == 2
+
+
+def test_lock_files_follow_entries(tmp_path, elements):
+    """정리된 항목의 잠금 파일은 지우고, 잡혀 있는 잠금 파일은 남김"""
+    cache = ExtractionCache(str(tmp_path), max_bytes=0)
+    with cache.lock('a', 'v'):
+        cache.put('a', 'v', elements)
+    with cache.lock('b', 'v'):
+        cache.put('b', 'v', elements)
+        assert len(_cache_files(cache, '.lock')) == 1
+
+    assert _cache_files(cache, '.bin') == []
+    assert cache._key_locks == {}
+
+
+def test_lock_is_per_entry(tmp_path):
+    """같은 항목은 한 번에 하나씩, 다른 항목은 기다리지 않고 동시에 잠금"""
+    cache = ExtractionCache(str(tmp_path))
+    active = {}
+    overlaps = []
+    guard = threading.Lock()
+
+    def work(file_key):
+        with cache.lock(file_key, 'v'):
+            with guard:
+                active[file_key] = active.get(file_key, 0) + 1
+                overlaps.append((file_key, active[file_key], len(active)))
+            time.sleep(0.05)
+            with guard:
+                active[file_key] -= 1
+                if not active[file_key]:
+                    del active[file_key]
+
+    threads = [threading.Thread(target=work, args=(file_key,)) for file_key in ('a', 'a', 'a', 'b')]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(count == 1 for _, count, _ in overlaps)
+    assert max(keys for _, _, keys in overlaps) == 2
+    assert cache._key_locks == {}
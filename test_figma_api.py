@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""피그마 REST API 클라이언트 시험 (로컬 가짜 피그마 서버 synthetic_figma.FakeFigmaServer 사용)
+
+    python -m pytest -q test_figma_api.py
+"""
+import json
+
+import pytest
+
+import figma_api
+from figma_api import FigmaAPIError, get_figma_file_meta, get_figma_json, get_session
+from synthetic_figma import FakeFigmaServer, generate_document
+
+TOKEN = 'test-token'
+
+
+@pytest.fixture(scope='module')
+def documents():
+    return {f"file{seed}": generate_document(seed=seed, pages=2, screens=2, depth=3) for seed in range(4)}
+
+
+@pytest.fixture
+def fake_api(documents, monkeypatch):
+    with FakeFigmaServer(documents, token=TOKEN) as server:
+        monkeypatch.setattr(figma_api, 'FIGMA_API_BASE', server.base_url)
+        yield server
+
+
+def test_get_figma_json_parameters(fake_api, documents):
+    """depth/ids/geometry/version을 쿼리 파라미터로 보냄"""
+    data = get_figma_json('file2', TOKEN, depth=2, ids=['1:2', '1:3'], geometry='paths', version='42')
+
+    assert data['name'] == documents['file2']['name']
+    assert fake_api.requests == [('/v1/files/file2', {
+        'depth': ['2'], 'ids': ['1:2,1:3'], 'geometry': ['paths'], 'version': ['42']})]
+
+
+def test_get_figma_json_defaults(fake_api, documents):
+    """인자를 주지 않으면 쿼리 파라미터 없이 전체 문서를 받음 (stats에 받은 크기 기록)"""
+    stats = {}
+    data = get_figma_json('file2', TOKEN, ids='', stats=stats)
+
+    assert data == documents['file2']
+    assert fake_api.requests == [('/v1/files/file2', {})]
+    assert stats['bytes'] == len(json.dumps(documents['file2'], ensure_ascii=False).encode('utf-8'))
+
+
+def test_get_figma_file_meta(fake_api, documents):
+    """depth=1로 받아 문서 트리를 뺀 파일 정보만 반환"""
+    meta = get_figma_file_meta('file3', TOKEN)
+
+    assert 'document' not in meta
+    assert meta['version'] == documents['file3']['version']
+    assert fake_api.requests == [('/v1/files/file3', {'depth': ['1']})]
+
+
+def test_get_figma_json_errors(fake_api):
+    with pytest.raises(FigmaAPIError) as error:
+        get_figma_json('file0', 'wrong-token')
+    assert error.value.status == 403
+
+    with pytest.raises(FigmaAPIError) as error:
+        get_figma_json('missing', TOKEN)
+    assert error.value.status == 404
+
+
+def test_session_is_shared_and_retries_server_errors(documents, monkeypatch):
+    """프로세스당 세션 하나를 재사용하고, 503은 세션이 다시 요청"""
+    assert get_session() is get_session()
+    with FakeFigmaServer(documents, error_every=2, token=TOKEN) as server:
+        monkeypatch.setattr(figma_api, 'FIGMA_API_BASE', server.base_url)
+        get_figma_json('file0', TOKEN)
+        data = get_figma_json('file1', TOKEN)
+
+    assert data['name'] == documents['file1']['name']
+    assert server.request_count == 3
+
+
+def test_malformed_body_is_api_error(documents, monkeypatch):
+    with FakeFigmaServer(documents, malformed_every=1) as server:
+        monkeypatch.setattr(figma_api, 'FIGMA_API_BASE', server.base_url)
+        with pytest.raises(FigmaAPIError) as error:
+            get_figma_json('file0', TOKEN)
+
+    assert error.value.status == 200
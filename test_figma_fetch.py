@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""피그마 비동기 동시 조회 시험 (로컬 가짜 피그마 서버 synthetic_figma.FakeFigmaServer 사용)
+
+    python -m pytest -q test_figma_fetch.py
+"""
+import asyncio
+import time
+
+import pytest
+
+from figma_api import FigmaAPIError
+from figma_async import AsyncFigmaFetcher, FigmaRequest, fetch_documents, node_requests
+from synthetic_figma import FakeFigmaServer, _index_nodes, generate_document
+
+TOKEN = 'test-token'
+
+
+@pytest.fixture(scope='module')
+def documents():
+    return {f"file{seed}": generate_document(seed=seed, pages=2, screens=2, depth=3) for seed in range(6)}
+
+
+def _fetch(server, requests, **options):
+    options.setdefault('backoff', 0.01)
+    return fetch_documents(requests, TOKEN, base_url=server.base_url, **options)
+
+
+def _run_fetcher(server, requests, **options):
+    """(도착 순서대로 받은 요청 목록, 요청 수, 재시도 수)"""
+    async def run():
+        async with AsyncFigmaFetcher(TOKEN, base_url=server.base_url, **options) as fetcher:
+            received = [request async for request, _ in fetcher.iter_fetch(requests)]
+            return received, fetcher.requests, fetcher.retries
+    return asyncio.run(run())
+
+
+def test_retry_after_is_honored(documents):
+    """429 응답은 Retry-After만큼 기다렸다가 재시도 (백오프 시간을 쓰지 않음)"""
+    with FakeFigmaServer(documents, rate_limit_every=2, retry_after=0.3, token=TOKEN) as server:
+        requests = [FigmaRequest('file0')]
+        # 두 번째 요청이 429를 받도록 하나를 먼저 보냄
+        _fetch(server, requests)
+        start = time.perf_counter()
+        received, sent, retries = _run_fetcher(server, requests, backoff=10.0, max_backoff=10.0)
+        elapsed = time.perf_counter() - start
+
+    assert received == requests
+    assert (sent, retries) == (2, 1)
+    assert server.request_count == 3
+    assert 0.3 <= elapsed < 3.0
+
+
+def test_retry_after_longer_than_limit_fails(documents):
+    """Retry-After가 max_retry_after보다 길면 기다리지 않고 실패"""
+    with FakeFigmaServer(documents, rate_limit_every=1, retry_after=60) as server:
+        start = time.perf_counter()
+        with pytest.raises(FigmaAPIError) as error:
+            _fetch(server, [FigmaRequest('file0')], max_retry_after=1.0)
+        elapsed = time.perf_counter() - start
+
+    assert error.value.status == 429
+    assert 'rate limit: low' in str(error.value)
+    assert server.request_count == 1
+    assert elapsed < 3.0
+
+
+def test_server_errors_exhaust_retries(documents):
+    """5xx 응답이 계속되면 max_retries번 재시도한 뒤 마지막 상태로 실패"""
+    with FakeFigmaServer(documents, error_every=1) as server:
+        with pytest.raises(FigmaAPIError) as error:
+            _fetch(server, [FigmaRequest('file0')], max_retries=2)
+
+    assert error.value.status == 503
+    assert server.request_count == 3
+
+
+def test_client_errors_are_not_retried(documents):
+    with FakeFigmaServer(documents, token=TOKEN) as server:
+        with pytest.raises(FigmaAPIError) as error:
+            _fetch(server, [FigmaRequest('missing')])
+
+    assert error.value.status == 404
+    assert server.request_count == 1
+
+
+def test_malformed_body_is_api_error(documents):
+    """200 응답의 본문이 올바른 JSON이 아니면 ValueError가 아니라 FigmaAPIError"""
+    with FakeFigmaServer(documents, malformed_every=1) as server:
+        with pytest.raises(FigmaAPIError) as error:
+            _fetch(server, [FigmaRequest('file0')])
+
+    assert error.value.status == 200
+    assert '/files/file0' in str(error.value)
+    assert server.request_count == 1
+
+
+def test_concurrency_is_bounded(documents):
+    """동시 요청 수는 concurrency 이하이고, 그 수만큼은 실제로 동시에 보냄"""
+    requests = [FigmaRequest(file_key) for file_key in documents]
+    with FakeFigmaServer(documents, latency=0.2) as server:
+        received, sent, retries = _run_fetcher(server, requests, concurrency=2)
+
+    assert sorted(received, key=requests.index) == requests
+    assert (sent, retries) == (len(requests), 0)
+    assert server.max_inflight == 2
+
+
+def test_results_follow_request_order(documents):
+    """fetch_documents는 응답 도착 순서와 관계없이 요청 순서대로 반환 (재시도가 섞여도)"""
+    file_keys = list(documents) * 2
+    with FakeFigmaServer(documents, latency=0.05, error_every=3) as server:
+        results = _fetch(server, [FigmaRequest(file_key) for file_key in file_keys], concurrency=4, max_retries=10)
+
+    assert [result['name'] for result in results] == [documents[file_key]['name'] for file_key in file_keys]
+    assert server.request_count > len(file_keys)
+
+
+def test_node_batches(documents):
+    """노드 ID를 batch_size개씩 /nodes로 나눠 받음"""
+    node_ids = list(_index_nodes(documents['file1']))[:7]
+    requests = node_requests('file1', node_ids, batch_size=3, version='1')
+    with FakeFigmaServer(documents) as server:
+        results = _fetch(server, requests)
+
+    assert [request.ids for request in requests] == [tuple(node_ids[0:3]), tuple(node_ids[3:6]), tuple(node_ids[6:7])]
+    assert [list(result['nodes']) for result in results] == [list(request.ids) for request in requests]
+    # 동시에 보내므로 서버가 받은 순서는 정해지지 않음
+    assert sorted(query['ids'][0] for _, query in server.requests) == sorted(','.join(request.ids)
+                                                                           for request in requests)
+    assert all(path == '/v1/files/file1/nodes' and query['version'] == ['1'] for path, query in server.requests)
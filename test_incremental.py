@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""증분 재검수 시험 (스냅샷으로 다시 검사한 결과가 전체 검수 결과와 같음)
+
+    python -m pytest -q test_incremental.py
+"""
+import copy
+import json
+import random
+
+import pytest
+
+from design_checker import DesignChecker
+from synthetic_figma import _index_nodes, generate_document, generate_specification
+from text_matcher import get_matcher
+
+
+def _write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    return str(path)
+
+
+def _run(tmp_path, name, document, specification, matcher, snapshot_file=None):
+    checker = DesignChecker(get_matcher(matcher))
+    checker.run_check(_write_json(tmp_path / f"{name}.json", document),
+                      _write_json(tmp_path / f"{name}_spec.json", specification),
+                      report_file=str(tmp_path / f"{name}.html"), verbose=False, snapshot_file=snapshot_file)
+    return checker
+
+
+def _results(checker):
+    return {result['spec_id']: {key: value for key, value in result.items() if key != 'change'}
+            for result in checker.matches + checker.issues}
+
+
+def _edit(document, specification, seed):
+    """텍스트 변경/노드 추가·삭제/프레임 이름 변경/설계서 항목 변경을 섞은 새 버전"""
+    rng = random.Random(seed)
+    document, specification = copy.deepcopy(document), copy.deepcopy(specification)
+    nodes = _index_nodes(document)
+    texts = [node for node in nodes.values() if node['type'] == 'TEXT']
+    frames = [node for node in nodes.values() if node['type'] == 'FRAME' and node.get('children')]
+    specs = specification['specifications']
+
+    for node in rng.sample(texts, 5):
+        node['characters'] = rng.choice(texts)['characters']
+    for frame in rng.sample(frames, 2):
+        frame['children'].pop(0)
+    missing = next(text for spec in specs for text in spec['design_texts'] if text.startswith('미구현'))
+    frame = rng.choice(frames)
+    frame['children'].append({'id': '99:1', 'name': '새 텍스트', 'type': 'TEXT', 'characters': missing})
+    rng.choice(frames)['name'] = '이름이 바뀐 화면'
+    specs[0]['design_texts'] = [rng.choice(texts)['characters']]
+    specs.append(dict(specs[1], id='new', design_texts=[texts[0]['characters'], '없는 문구']))
+    return document, specification
+
+
+@pytest.mark.parametrize('matcher', ['exact', 'normalized', 'fuzzy'])
+def test_incremental_matches_full_check(tmp_path, matcher):
+    document = generate_document(seed=11, pages=2, screens=4, depth=4)
+    specification = generate_specification(document, 80, seed=11)
+    snapshot_file = str(tmp_path / 'snapshot.json')
+    _run(tmp_path, 'v1', document, specification, matcher, snapshot_file)
+
+    for version in range(2, 4):
+        document, specification = _edit(document, specification, version)
+        incremental = _run(tmp_path, f"v{version}", document, specification, matcher, snapshot_file)
+        full = _run(tmp_path, f"v{version}_full", document, specification, matcher)
+
+        assert _results(incremental) == _results(full)
+        compare = next(stage for stage in incremental.metrics.stages if stage.name == 'compare')
+        assert 0 < compare.items < len(specification['specifications'])
+
+
+def test_unchanged_design_rechecks_nothing(tmp_path):
+    document = generate_document(seed=12, pages=2, screens=3, depth=4)
+    specification = generate_specification(document, 40, seed=12)
+    snapshot_file = str(tmp_path / 'snapshot.json')
+    first = _run(tmp_path, 'v1', document, specification, 'normalized', snapshot_file)
+    second = _run(tmp_path, 'v2', document, specification, 'normalized', snapshot_file)
+
+    assert _results(second) == _results(first)
+    compare = next(stage for stage in second.metrics.stages if stage.name == 'compare')
+    assert compare.items == 0
+    # 매칭 설정이 바뀌면 모든 항목을 다시 평가
+    third = _run(tmp_path, 'v3', document, specification, 'fuzzy', snapshot_file)
+    compare = next(stage for stage in third.metrics.stages if stage.name == 'compare')
+    assert compare.items == len(specification['specifications'])
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""작업 큐 시험 (진행 이벤트, 같은 키 작업 공유, 실패 기록, 완료 작업 정리)
+
+    python -m pytest -q test_job_queue.py
+"""
+import threading
+
+import pytest
+
+from job_queue import STAGES, JobQueue
+
+
+@pytest.fixture
+def queue():
+    queue = JobQueue(workers=2)
+    yield queue
+    queue.shutdown()
+
+
+def test_job_runs_through_stages(queue):
+    def analyze(job):
+        for stage in STAGES:
+            job.set_stage(stage, progress=stage)
+        return {'matches': 3}
+
+    job = queue.submit('file@1', analyze)
+
+    assert job.wait(5)
+    assert job.status == 'done' and job.result == {'matches': 3}
+    assert [event['status'] for event in job.events] == ['queued'] + ['running'] * len(STAGES) + ['done']
+    assert [event['stage'] for event in job.events[1:-1]] == list(STAGES)
+    assert job.to_dict()['result'] == {'matches': 3}
+    assert queue.get(job.id) is job
+
+
+def test_same_key_shares_inflight_job(queue):
+    release = threading.Event()
+    calls = []
+
+    def analyze(job):
+        calls.append(job.id)
+        release.wait(5)
+        return job.key
+
+    first = queue.submit('file@1', analyze)
+    assert queue.submit('file@1', analyze) is first
+    other = queue.submit('file@2', analyze)
+    release.set()
+
+    assert first.wait(5) and other.wait(5)
+    assert other is not first and len(calls) == 2
+    # 끝난 뒤에는 같은 키로 새 작업을 만듦
+    again = queue.submit('file@1', analyze)
+    assert again is not first and again.wait(5)
+
+
+def test_error_is_recorded(queue):
+    def fail(job):
+        job.set_stage('download')
+        raise ValueError('피그마 파일을 받을 수 없습니다')
+
+    job = queue.submit('broken', fail)
+
+    assert job.wait(5)
+    assert (job.status, job.stage, job.error) == ('error', 'download', '피그마 파일을 받을 수 없습니다')
+    assert 'result' not in job.to_dict()
+
+
+def test_iter_events_streams_until_done(queue):
+    step = threading.Event()
+
+    def analyze(job):
+        job.set_stage('extract')
+        step.wait(5)
+        job.set_stage('compare')
+        return None
+
+    job = queue.submit('file@1', analyze)
+    events = job.iter_events(timeout=0.05)
+    seen = []
+    for event in events:
+        seen.append(event)
+        # 대기 중에는 None(keep-alive)을 받은 뒤 작업을 진행시킴
+        if event is None:
+            step.set()
+
+    statuses = [event['status'] for event in seen if event is not None]
+    assert None in seen
+    assert statuses[0] == 'queued' and statuses[-1] == 'done'
+    assert [event['stage'] for event in seen if event is not None and event['status'] == 'running'] == \
+        ['extract', 'compare']
+
+
+def test_wait_timeout_and_prune():
+    queue = JobQueue(workers=1, retention=0)
+    release = threading.Event()
+    try:
+        job = queue.submit('slow', lambda job: release.wait(5))
+        assert not job.wait(0.05)
+        release.set()
+        assert job.wait(5)
+        # 보관 시간이 지난 완료 작업은 다음 등록 때 정리
+        queue.submit('next', lambda job: None).wait(5)
+        assert queue.get(job.id) is None
+    finally:
+        queue.shutdown()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""반복 순회기(_walk_text_nodes) 시험 (재귀 순회와 같은 순서/경로, 깊은 트리, 내려갈 키 제한)
+
+    python -m pytest -q test_node_walker.py
+"""
+import pytest
+
+from design_checker import DesignChecker, _walk_text_nodes
+from node_hierarchy import ancestors
+from synthetic_figma import count_nodes, generate_document
+
+
+def _recursive_walk(node, descend_keys, path='', found=None):
+    """이전 재귀 순회 방식의 (id, 경로) 목록"""
+    found = [] if found is None else found
+    if isinstance(node, dict):
+        if node.get('type') == 'TEXT' and node.get('characters', '').strip():
+            found.append((node.get('id', ''), path))
+        for key, value in node.items():
+            if descend_keys is not None and 'type' in node and key not in descend_keys:
+                continue
+            if isinstance(value, (dict, list)):
+                _recursive_walk(value, descend_keys, f"{path}.{key}" if path else key, found)
+    elif isinstance(node, list):
+        for i, item in enumerate(node):
+            _recursive_walk(item, descend_keys, f"{path}[{i}]", found)
+    return found
+
+
+@pytest.fixture(scope='module')
+def document():
+    return generate_document(seed=2, pages=2, screens=3, depth=5)
+
+
+@pytest.mark.parametrize('descend_keys', [('children',), None])
+def test_same_order_and_paths_as_recursive_walk(document, descend_keys):
+    elements = list(_walk_text_nodes(document, descend_keys))
+
+    assert elements
+    assert [(element.id, element.path) for element in elements] == _recursive_walk(document, descend_keys)
+
+
+def test_skips_non_children_values_of_typed_nodes():
+    """type이 있는 노드는 children으로만 내려감 (래퍼 객체는 모든 값을 탐색)"""
+    document = {'meta': {'type': 'TEXT', 'id': 'wrapped', 'characters': '래퍼 안'},
+                'document': {'type': 'DOCUMENT', 'children': [
+                    {'type': 'TEXT', 'id': 'text', 'characters': '본문',
+                     'absoluteBoundingBox': {'type': 'TEXT', 'id': 'geometry', 'characters': '기하 정보'}}]}}
+
+    assert [element.id for element in _walk_text_nodes(document)] == ['wrapped', 'text']
+    assert [element.id for element in _walk_text_nodes(document, None)] == ['wrapped', 'text', 'geometry']
+
+
+def test_deep_tree_does_not_recurse():
+    depth = 20000
+    node = {'type': 'TEXT', 'id': 'leaf', 'characters': '가장 안쪽'}
+    for level in range(depth):
+        node = {'type': 'FRAME', 'id': str(level), 'name': f"프레임 {level}", 'children': [node]}
+
+    elements = list(_walk_text_nodes({'document': node}))
+
+    assert [element.id for element in elements] == ['leaf']
+    assert elements[0].path == 'document' + '.children[0]' * depth
+    assert len(list(ancestors(elements[0].parent))) == depth
+
+
+def test_parent_chain_and_node_count(document):
+    stats = {}
+    elements = DesignChecker().extract_design_elements(document)
+
+    # 피그마 노드에서는 children만 따라가므로 방문 수는 노드 수와 같음
+    list(_walk_text_nodes(document['document'], stats=stats))
+    assert stats['nodes'] == count_nodes(document)
+    for element in elements:
+        chain = list(ancestors(element.parent))
+        assert chain[-1].type == 'DOCUMENT' and chain[-2].type == 'CANVAS'
+        # 같은 상위 노드는 요소끼리 같은 객체를 공유
+        assert chain[-1] is list(ancestors(elements[0].parent))[-1]
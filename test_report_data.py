@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""NDJSON 데이터 보고서 시험 (요약 줄 + 항목별 줄, 청크 나눔, 뷰어 HTML)
+
+    python -m pytest -q test_report_data.py
+"""
+import json
+
+import pytest
+
+from design_checker import DesignChecker
+from report_writer import REPORT_DATA_VERSION, data_file_for, iter_report_data, render_report_viewer
+from synthetic_figma import generate_document, generate_specification
+
+
+def _result(spec_id, status, required, found, change=None):
+    result = {
+        'spec_id': spec_id,
+        'spec_name': f"항목 {spec_id}",
+        'status': status,
+        'implementation_rate': len(found) / len(required),
+        'required_texts': required,
+        'found_texts': [{'required': text, 'found': text} for text in found],
+        'missing_texts': [text for text in required if text not in found],
+    }
+    if change:
+        result['change'] = change
+    return result
+
+
+MATCHES = [_result('1', 'complete', ['로그인', '"따옴표"\n줄바꿈'], ['로그인', '"따옴표"\n줄바꿈']),
+           _result('2', 'partial', ['검색', '필터', '정렬'], ['검색'], change='updated')]
+ISSUES = [_result('3', 'missing', ['</script> 😀'], [], change='new')]
+ORPHANS = [{'text': '오래된 문구', 'count': 2, 'frames': ['홈'], 'node_ids': ['1:2', '1:3']}]
+
+
+def _lines(chunks):
+    data = ''.join(chunks)
+    assert data.endswith('\n')
+    return [json.loads(line) for line in data.splitlines()]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 50, 64 * 1024])
+def test_summary_then_one_line_per_spec(chunk_size):
+    changes = {'added': 1, 'modified': 0, 'removed': 2, 'rechecked': 2, 'changed_specs': 2}
+    chunks = list(iter_report_data(MATCHES, ISSUES, changes, ORPHANS, chunk_size=chunk_size))
+    summary, *rows = _lines(chunks)
+
+    assert all(len(chunk) >= chunk_size for chunk in chunks[:-1])
+    assert summary['version'] == REPORT_DATA_VERSION
+    assert summary['counts'] == {'total': 3, 'complete': 1, 'partial': 1, 'missing': 1}
+    assert summary['changes'] == changes and summary['orphans'] == ORPHANS
+    assert [row['id'] for row in rows] == ['1', '2', '3']
+    assert rows[1] == {'id': '2', 'name': '항목 2', 'status': 'partial', 'rate': 0.3333,
+                       'required': ['검색', '필터', '정렬'], 'found': ['검색'], 'missing': ['필터', '정렬'],
+                       'change': 'updated'}
+    assert 'change' not in rows[0]
+    assert rows[0]['required'] == MATCHES[0]['required_texts'] and rows[2]['missing'] == ['</script> 😀']
+
+
+def test_summary_without_optional_sections():
+    summary, *rows = _lines(iter_report_data([], [], None, None))
+
+    assert summary['counts'] == {'total': 0, 'complete': 0, 'partial': 0, 'missing': 0}
+    assert summary['changes'] is None and 'orphans' not in summary
+    assert rows == []
+
+
+def test_viewer_escapes_data_url():
+    html = render_report_viewer('</script><b>.ndjson')
+
+    assert '</script><b>' not in html
+    assert json.dumps('</script><b>.ndjson').replace('/', '\\/') in html
+    assert data_file_for('reports/report.html') == 'reports/report.ndjson'
+
+
+def test_run_check_writes_data_report(tmp_path):
+    document = generate_document(seed=8, pages=2, screens=2, depth=3)
+    design_file, spec_file = tmp_path / 'design.json', tmp_path / 'spec.json'
+    design_file.write_text(json.dumps(document, ensure_ascii=False), encoding='utf-8')
+    spec_file.write_text(json.dumps(generate_specification(document, 30, seed=8), ensure_ascii=False),
+                         encoding='utf-8')
+    report_file = str(tmp_path / 'report.html')
+
+    checker = DesignChecker()
+    checker.run_check(str(design_file), str(spec_file), report_file=report_file, verbose=False, report_format='data')
+
+    with open(data_file_for(report_file), encoding='utf-8') as f:
+        summary, *rows = [json.loads(line) for line in f]
+    assert summary['counts']['total'] == len(rows) == 30
+    assert [row['id'] for row in rows] == [result['spec_id'] for result in checker.matches + checker.issues]
+    with open(report_file, encoding='utf-8') as f:
+        assert '"report.ndjson"' in f.read()
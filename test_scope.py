@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""페이지/프레임 범위 매칭 시험 (서브트리 구간, 범위 밖 같은 텍스트 제외, 범위별 색인과 같은 결과)
+
+    python -m pytest -q test_scope.py
+"""
+import pytest
+
+from design_checker import DesignChecker, SpecificationElement, _element_column
+from node_hierarchy import HierarchyIndex, ancestors
+from synthetic_figma import generate_document, generate_specification
+from text_matcher import get_matcher
+
+
+def _text(node_id, characters):
+    return {'id': node_id, 'name': characters, 'type': 'TEXT', 'characters': characters}
+
+
+def _frame(node_id, name, children):
+    return {'id': node_id, 'name': name, 'type': 'FRAME', 'children': children}
+
+
+DOCUMENT = {'document': {'id': '0:0', 'type': 'DOCUMENT', 'children': [
+    {'id': '1:0', 'name': '회원', 'type': 'CANVAS', 'children': [
+        _frame('1:1', '로그인', [_text('1:2', '아이디'), _text('1:3', '로그인'),
+                                 _frame('1:4', '팝업', [_text('1:5', '확인')])]),
+        _frame('1:6', '가입', [_text('1:7', '아이디'), _frame('1:8', '팝업', [_text('1:9', '취소')])]),
+    ]},
+    {'id': '2:0', 'name': '설정', 'type': 'CANVAS', 'children': [
+        _frame('2:1', '팝업', [_text('2:2', '확인'), _text('2:3', '저장')]),
+    ]},
+]}}
+
+
+@pytest.fixture
+def checker():
+    checker = DesignChecker(get_matcher('normalized'))
+    checker.design_elements = checker.extract_design_elements(DOCUMENT)
+    return checker
+
+
+def _spec(texts, page='', frame=''):
+    return SpecificationElement(id='1', name='항목', text_content=texts[0], description='', category='',
+                                priority='', design_texts=texts, page=page, frame=frame)
+
+
+def test_scope_ranges(checker):
+    hierarchy = HierarchyIndex(_element_column(checker.design_elements, 'parent'))
+
+    assert [element.id for element in checker.design_elements] == ['1:2', '1:3', '1:5', '1:7', '1:9', '2:2', '2:3']
+    assert hierarchy.scope_ranges('회원') == ((0, 5),)
+    assert hierarchy.scope_ranges('', '로그인') == ((0, 3),)
+    assert hierarchy.scope_ranges('', '1:6') == ((3, 5),)
+    # 같은 이름의 프레임이 여러 개면 모두, 페이지를 주면 그 페이지 안에서만
+    assert hierarchy.scope_ranges('', '팝업') == ((2, 3), (4, 7))
+    assert hierarchy.scope_ranges('회원', '팝업') == ((2, 3), (4, 5))
+    assert hierarchy.scope_indices('회원', '팝업') == [2, 4]
+    assert hierarchy.scope_ranges('없는 페이지') == ()
+
+
+def test_scope_excludes_same_text_elsewhere(checker):
+    results = {}
+    for name, spec in {'unscoped': _spec(['아이디', '저장']), 'page': _spec(['아이디', '저장'], page='회원'),
+                       'frame': _spec(['아이디', '확인'], frame='가입'),
+                       'missing_scope': _spec(['아이디'], page='없는 페이지')}.items():
+        results[name] = checker.check_text_implementation(spec, *checker.spec_search_space(spec))
+
+    assert results['unscoped']['status'] == 'complete'
+    assert (results['page']['status'], results['page']['missing_texts']) == ('partial', ['저장'])
+    assert [found['node_id'] for found in results['frame']['found_texts']] == ['1:7']
+    assert results['missing_scope']['status'] == 'missing'
+
+
+@pytest.mark.parametrize('preset', ['exact', 'normalized', 'fuzzy'])
+def test_scoped_matches_per_scope_index(preset):
+    """파일 전체 색인을 구간으로 거른 결과가 범위마다 요소를 따로 모아 만든 색인의 결과와 같음"""
+    document = generate_document(seed=9, pages=3, screens=4, depth=5)
+    checker = DesignChecker(get_matcher(preset))
+    checker.design_elements = checker.extract_design_elements(document)
+    checker.spec_elements = checker._specs_from_data(generate_specification(document, 150, scoped_ratio=1.0, seed=9))
+    # 다른 화면의 텍스트도 섞어 범위 밖 후보가 생기도록 함
+    for spec, other in zip(checker.spec_elements, reversed(checker.spec_elements)):
+        spec.design_texts = spec.design_texts + other.design_texts[:1]
+    matches, issues = checker.compare_elements()
+
+    hierarchy = HierarchyIndex(_element_column(checker.design_elements, 'parent'))
+    expected = []
+    for spec in checker.spec_elements:
+        elements = [checker.design_elements[index] for index in hierarchy.scope_indices(spec.page, spec.frame)]
+        assert all(spec.frame in {node.name for node in ancestors(element.parent)} for element in elements)
+        expected.append(checker.check_text_implementation(spec, elements, checker.build_text_index(elements)))
+
+    results = {result['spec_id']: result for result in matches + issues}
+    assert [results[spec.id] for spec in checker.spec_elements] == expected
+    assert any(result['missing_texts'] for result in expected)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""스트리밍 JSON 파서/추출 시험 (청크 경계, 트리 순회와 같은 결과, 파싱하는 대로 요소 반환)
+
+    python -m pytest -q test_streaming.py
+"""
+import io
+import json
+
+import pytest
+
+from design_checker import DesignChecker, _stream_text_nodes, _walk_text_nodes
+from json_stream import CHUNK_SIZE, _iter_builtin_events
+from node_hierarchy import ancestors
+from synthetic_figma import generate_document
+
+# 청크 경계에서 잘리기 쉬운 값들 (이스케이프, 서로게이트 쌍, 여러 바이트 UTF-8 문자, 지수 표기 숫자, 리터럴)
+TRICKY = {
+    'escaped': 'a"b\\c\n\t\u0001',
+    'surrogate': '😀 이모지',
+    '한글 키': ['가나다', '', '라마바사' * 10],
+    'numbers': [0, -0.5, 1e-05, 12345678901234567890, 3.25e+20, -7],
+    'literals': [True, False, None, {}, [], [[]], {'a': {}}],
+}
+
+
+def _chain(element):
+    return [(node.id, node.name, node.type) for node in ancestors(element.parent)]
+
+
+class _CountingReader(io.BytesIO):
+    """읽어 간 바이트 수를 기록하는 파일 객체"""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.consumed = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.consumed += len(chunk)
+        return chunk
+
+
+def _build(events):
+    """이벤트 목록을 다시 파이썬 값으로 조립"""
+    stack = [[]]
+    keys = []
+    for event, value in events:
+        if event == 'map_key':
+            keys.append(value)
+            continue
+        if event in ('start_map', 'start_array'):
+            stack.append({} if event == 'start_map' else [])
+            continue
+        if event in ('end_map', 'end_array'):
+            value = stack.pop()
+        parent = stack[-1]
+        if isinstance(parent, dict):
+            parent[keys.pop()] = value
+        else:
+            parent.append(value)
+    return stack[0][0]
+
+
+@pytest.fixture(scope='module')
+def document():
+    return generate_document(seed=3, pages=2, screens=3, depth=4)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 5, 64, 64 * 1024])
+def test_tokenizer_chunk_boundaries(chunk_size):
+    data = json.dumps(TRICKY, ensure_ascii=False).encode('utf-8')
+    events = list(_iter_builtin_events(io.BytesIO(data), chunk_size))
+
+    assert _build(events) == TRICKY
+    assert events == list(_iter_builtin_events(io.BytesIO(data), len(data)))
+
+
+def test_tokenizer_rejects_broken_json():
+    for broken in (b'{"a": [1, 2}', b'{"a": 1', b'[1, nul]'):
+        with pytest.raises(ValueError):
+            list(_iter_builtin_events(io.BytesIO(broken), 4))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 4096])
+@pytest.mark.parametrize('descend_keys', [('children',), None])
+def test_stream_matches_tree_walk(document, chunk_size, descend_keys):
+    data = json.dumps(document, ensure_ascii=False).encode('utf-8')
+    expected = list(_walk_text_nodes(document, descend_keys))
+    streamed = list(_stream_text_nodes(_iter_builtin_events(io.BytesIO(data), chunk_size), descend_keys))
+
+    assert streamed == expected
+    assert [_chain(element) for element in streamed] == [_chain(element) for element in expected]
+
+
+def test_wrapper_type_after_children():
+    """래퍼가 아닌 노드는 type이 children 뒤에 나와도 하위 요소를 보류해 트리 순회와 같은 순서"""
+    document = {'document': {'type': 'DOCUMENT', 'children': [
+        {'children': [{'type': 'TEXT', 'characters': '안쪽'}], 'type': 'TEXT', 'characters': '바깥',
+         'absoluteBoundingBox': {'type': 'TEXT', 'characters': '기하 정보'}},
+    ]}}
+    data = json.dumps(document, ensure_ascii=False).encode('utf-8')
+    streamed = list(_stream_text_nodes(_iter_builtin_events(io.BytesIO(data), 3)))
+
+    assert [element.text_content for element in streamed] == ['바깥', '안쪽']
+    assert streamed == list(_walk_text_nodes(document))
+
+
+def test_elements_arrive_while_parsing():
+    """파일 루트(type 없음) 아래의 요소도 문서 끝까지 읽기 전에 나옴"""
+    document = generate_document(seed=4, pages=3, screens=8)
+    data = json.dumps(document, ensure_ascii=False).encode('utf-8')
+    reader = _CountingReader(data)
+    elements = DesignChecker().iter_design_elements(reader)
+
+    first = next(elements)
+    assert len(data) > 4 * CHUNK_SIZE
+    assert reader.consumed <= 2 * CHUNK_SIZE
+    assert [first] + list(elements) == list(_walk_text_nodes(document))
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""텍스트 역색인 시험 (전체 비교와 같은 결과, 길이 순 조회, 인덱스 구간 제한)
+
+    python -m pytest -q test_text_index.py
+"""
+import random
+from itertools import groupby
+
+import pytest
+
+from text_index import TextIndex, ngrams, within_ranges
+
+RANGES = [None, ((0, 40),), ((5, 17), (60, 61), (90, 150))]
+
+
+@pytest.fixture(scope='module')
+def texts():
+    # 글자 종류를 줄여 포함 관계가 많이 생기도록 함
+    rng = random.Random(7)
+    return [''.join(rng.choice('가나다AaB ') for _ in range(rng.randint(0, 8))) for _ in range(150)]
+
+
+@pytest.fixture(scope='module')
+def index(texts):
+    return TextIndex(texts)
+
+
+def _in_ranges(index, ranges):
+    return ranges is None or any(start <= index < end for start, end in ranges)
+
+
+def _by_length(indices, lengths, per_length, longest_first=False):
+    """(길이, 인덱스) 순으로 정렬하고 길이마다 per_length개까지"""
+    ordered = sorted(indices, key=lambda index: (-lengths[index] if longest_first else lengths[index], index))
+    return [index for _, same in groupby(ordered, key=lengths.__getitem__) for index in list(same)[:per_length]]
+
+
+def test_ngrams():
+    assert ngrams('') == []
+    assert ngrams('가') == ['가']
+    assert ngrams('가나다') == ['가나', '나다']
+
+
+def test_within_ranges():
+    indices = [1, 3, 5, 7, 9, 11]
+    assert list(within_ranges(indices, None)) == indices
+    assert list(within_ranges(indices, ((2, 6), (9, 10)))) == [3, 5, 9]
+    assert list(within_ranges(indices, ((0, 100),), 2, 4)) == [5, 7]
+
+
+@pytest.mark.parametrize('ranges', RANGES)
+def test_equal_is_casefolded(index, texts, ranges):
+    for query in set(texts):
+        expected = [i for i, text in enumerate(texts)
+                    if text.casefold() == query.upper().casefold() and _in_ranges(i, ranges)]
+        assert index.equal(query.upper(), ranges=ranges) == expected
+        assert index.equal(query.upper(), limit=1, ranges=ranges) == expected[:1]
+
+
+def test_find_all_matches_linear_scan(index, texts):
+    folded = [text.casefold() for text in texts]
+    for query in texts[:60] + ['A', '가나다라마', '']:
+        query = query.casefold()
+        expected = [i for i, text in enumerate(folded)
+                    if (query in text and len(text) <= 6) or (text in query and len(text) >= 2)]
+        assert index.find_all(query, min_length=2, max_length=6) == expected
+
+
+@pytest.mark.parametrize('ranges', RANGES)
+@pytest.mark.parametrize('per_length', [None, 1, 3])
+def test_containing_by_length(index, texts, ranges, per_length):
+    folded = [text.casefold() for text in texts]
+    lengths = [len(text) for text in folded]
+    for query in [text for text in folded if text][:40] + ['a', '나다']:
+        matched = [i for i, text in enumerate(folded) if query in text and len(text) <= 7 and _in_ranges(i, ranges)]
+        found = list(index.containing_by_length(query.upper(), max_length=7, per_length=per_length, ranges=ranges))
+        assert found == _by_length(matched, lengths, per_length)
+
+
+@pytest.mark.parametrize('ranges', RANGES)
+@pytest.mark.parametrize('per_length', [None, 1, 3])
+def test_contained_by_length(index, texts, ranges, per_length):
+    folded = [text.casefold() for text in texts]
+    lengths = [len(text) for text in folded]
+    for query in [text for text in folded if len(text) > 3][:40] + ['가나다aab 가나다']:
+        matched = [i for i, text in enumerate(folded) if text and text in query and len(text) >= 2
+                   and _in_ranges(i, ranges)]
+        found = list(index.contained_by_length(query.upper(), min_length=2, per_length=per_length, ranges=ranges))
+        assert found == _by_length(matched, lengths, per_length, longest_first=True)
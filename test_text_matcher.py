@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""텍스트 매칭 엔진 시험 (정규화, 매칭 단계별 후보가 전체 비교와 같음, 짧은 텍스트 포함 제한)
+
+    python -m pytest -q test_text_matcher.py
+"""
+import math
+import random
+import unicodedata
+
+import pytest
+
+from text_index import ngrams
+from text_matcher import MATCH_TYPES, TextMatcher, get_matcher, normalize_text
+
+_EPSILON = 1e-9
+# 전각 문자, 분해형 한글, 공백이 섞이도록 고른 조각
+PIECES = ['가', '나', '다', '가나', 'ａ', 'A', 'b', ' ', 'AB', unicodedata.normalize('NFD', '가'), '로그인']
+
+
+def _random_texts(seed, count):
+    rng = random.Random(seed)
+    return [''.join(rng.choice(PIECES) for _ in range(rng.randint(1, 5))) for _ in range(count)]
+
+
+def _partial_lengths(matcher, length):
+    if not matcher.short_coverage:
+        return 1, None
+    max_length = math.floor(length / matcher.short_coverage) if length <= matcher.short_length else None
+    return max(1, min(matcher.short_length + 1, math.ceil(length * matcher.short_coverage))), max_length
+
+
+def _dice(a, b):
+    a, b = set(ngrams(a)), set(ngrams(b))
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+def _linear_candidates(matcher, texts, query, limit):
+    """모든 디자인 텍스트를 단계별 규칙으로 비교해 candidates()와 같은 방식으로 순위 매김"""
+    normalized = [matcher.normalize(text) for text in texts]
+    folded, target = query.casefold(), matcher.normalize(query)
+    tiers = [[(index, 1.0) for index, text in enumerate(texts) if text.casefold() == folded]]
+    if target:
+        min_length, max_length = _partial_lengths(matcher, len(target))
+        tiers.append([(index, 1.0) for index, text in enumerate(normalized) if text == target])
+        tiers.append([(index, round(min(len(text), len(target)) / max(len(text), len(target)), 3))
+                      for index, text in enumerate(normalized)
+                      if (target in text and (max_length is None or len(text) <= max_length))
+                      or (text and text in target and len(text) >= min_length)])
+        if matcher.fuzzy_threshold is not None and len(target) >= matcher.fuzzy_min_length:
+            tiers.append([(index, round(_dice(target, text), 3)) for index, text in enumerate(normalized)
+                          if len(text) >= matcher.fuzzy_min_length
+                          and _dice(target, text) >= matcher.fuzzy_threshold - _EPSILON])
+    ranked, seen = [], set()
+    for match_type, scored in zip(MATCH_TYPES, tiers):
+        tier = sorted(((index, match_type, score) for index, score in scored if index not in seen),
+                      key=lambda candidate: (-candidate[2], candidate[0]))[:limit]
+        seen.update(index for index, _, _ in tier)
+        ranked.extend(tier)
+        if len(ranked) >= limit:
+            break
+    return ranked[:limit]
+
+
+def test_normalize_text():
+    assert normalize_text('ＡＢＣ １２３') == 'abc123'
+    assert normalize_text(unicodedata.normalize('NFD', '한글 검수')) == '한글검수'
+    assert normalize_text('A  B', ignore_whitespace=False) == 'a  b'
+    assert get_matcher('exact').normalize('Ａ B') == 'ａ b'
+
+
+def test_matcher_settings():
+    with pytest.raises(ValueError):
+        get_matcher('unknown')
+    with pytest.raises(ValueError):
+        TextMatcher(fuzzy_threshold=0)
+    assert get_matcher('normalized').signature != get_matcher('fuzzy').signature
+
+
+def test_match_tiers():
+    texts = ['로그인', 'ＬＯＧＩＮ 버튼', '로 그 인', '로그인 하기', '로그아웃 하기', '회원 로그인']
+    index = get_matcher('fuzzy', 0.5).index(texts)
+
+    assert index.candidates('로그인') == [(0, 'exact', 1.0), (2, 'normalized', 1.0),
+                                          (3, 'partial', 0.6), (5, 'partial', 0.6)]
+    assert index.candidates('login버튼')[0] == (1, 'normalized', 1.0)
+    assert index.candidates('로그인하가') == [(0, 'partial', 0.6), (2, 'partial', 0.6),
+                                            (3, 'fuzzy', 0.75), (5, 'fuzzy', 0.5)]
+    assert index.find_first('없는 문구') is None
+    # 유사도 단계는 fuzzy_threshold가 있을 때만
+    assert get_matcher('normalized').index(texts).candidates('로그인하가') == [(0, 'partial', 0.6), (2, 'partial', 0.6)]
+
+
+def test_short_text_needs_coverage():
+    """짧은 텍스트는 상대 텍스트 길이의 일정 비율 이상일 때만 포함 관계로 인정"""
+    texts = ['생성형AI캠페인', '생성하기', '생성']
+    normalized = get_matcher('normalized').index(texts)
+    exact = get_matcher('exact').index(texts)
+
+    assert [index for index, _, _ in normalized.candidates('생성')] == [2, 1]
+    assert [index for index, _, _ in exact.candidates('생성')] == [2, 1, 0]
+    assert normalized.find_all('생성') == [1, 2]
+
+
+@pytest.mark.parametrize('preset', ['exact', 'normalized', 'fuzzy'])
+@pytest.mark.parametrize('limit', [1, 3, 64])
+def test_candidates_match_linear_scan(preset, limit):
+    matcher = get_matcher(preset, 0.5)
+    texts = _random_texts(1, 300)
+    index = matcher.index(texts)
+    for query in _random_texts(2, 80) + texts[:20]:
+        assert index.candidates(query, limit) == _linear_candidates(matcher, texts, query, limit), query
+
+
+@pytest.mark.parametrize('preset', ['exact', 'normalized', 'fuzzy'])
+def test_find_all_is_every_tier(preset):
+    matcher = get_matcher(preset, 0.5)
+    texts = _random_texts(3, 200)
+    index = matcher.index(texts)
+    for query in _random_texts(4, 50):
+        expected = sorted(index for index, _, _ in _linear_candidates(matcher, texts, query, len(texts)))
+        assert index.find_all(query) == expected
+
+
+def test_best_match_wins_over_document_order():
+    """문서 앞쪽의 포함 관계보다 뒤쪽의 완전 일치를 고르고, 나머지는 대안으로 남김"""
+    texts = ['로그인 하기', '회원 로그인', '로그인']
+    index = get_matcher('normalized').index(texts)
+
+    assert index.resolve(['로그인'], top_k=3) == [[(2, 'exact', 1.0), (0, 'partial', 0.6), (1, 'partial', 0.6)]]
+    assert index.resolve(['로그인', '없는 문구'], top_k=1) == [[(2, 'exact', 1.0)], []]
+
+
+def test_same_frame_is_preferred():
+    """단계와 점수가 같으면 같은 항목의 필요 텍스트가 가장 많이 모인 프레임의 후보를 우선"""
+    texts = ['확인', '취소', '결제 화면', '확인', '취소']
+    groups = ['장바구니', '장바구니', '결제', '결제', '결제']
+    index = get_matcher('normalized').index(texts, groups)
+
+    assert index.resolve(['확인', '취소']) == [[(0, 'exact', 1.0)], [(1, 'exact', 1.0)]]
+    assert index.resolve(['결제 화면', '확인', '취소']) == [[(2, 'exact', 1.0)], [(3, 'exact', 1.0)],
+                                                            [(4, 'exact', 1.0)]]
+    # 더 좋은 단계의 후보는 프레임과 관계없이 먼저
+    assert index.resolve(['결제 화면', '확인!'], top_k=2)[1] == [(3, 'partial', 0.667), (0, 'partial', 0.667)]
+
+
+@pytest.mark.parametrize('preset', ['exact', 'normalized', 'fuzzy'])
+def test_resolve_shared_matches_resolve(preset):
+    rng = random.Random(5)
+    texts = _random_texts(5, 300)
+    index = get_matcher(preset, 0.5).index(texts, [f"프레임 {rng.randrange(6)}" for _ in texts])
+    queries = _random_texts(6, 40)
+    query_sets = [rng.sample(range(len(queries)), rng.randint(1, 4)) for _ in range(60)]
+
+    shared = index.resolve_shared(queries, query_sets, top_k=3)
+
+    assert shared == [index.resolve([queries[query_id] for query_id in query_ids], top_k=3)
+                      for query_ids in query_sets]
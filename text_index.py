@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""디자인 텍스트 매칭용 색인
+
+설계서 텍스트마다 디자인 텍스트 전체를 선형으로 비교하지 않도록,
+디자인 하나당 한 번 만들어서 모든 설계서 항목의 조회에 재사용합니다.
+"""
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+# 조회를 제한할 텍스트 인덱스 구간들 [start, end) (오름차순, 겹치지 않음)
+Ranges = Sequence[Tuple[int, int]]
+
+
+def ngrams(text: str) -> List[str]:
+    """조회/색인에 쓰는 n-gram (한 글자면 글자 자체, 그 외에는 2-gram)"""
+    if len(text) < 2:
+        return [text] if text else []
+    return [text[i:i + 2] for i in range(len(text) - 1)]
+
+
+def within_ranges(indices: Sequence[int], ranges: Optional[Ranges], lo: int = 0, hi: Optional[int] = None) -> Iterator[int]:
+    """오름차순 indices[lo:hi] 중 ranges 안의 인덱스 (ranges가 None이면 전부)"""
+    if hi is None:
+        hi = len(indices)
+    if ranges is None:
+        yield from indices[lo:hi]
+        return
+    for start, end in ranges:
+        first = bisect_left(indices, start, lo, hi)
+        yield from indices[first:bisect_left(indices, end, first, hi)]
+
+
+class TextIndex:
+    """디자인 텍스트 역색인
+
+    - 정확히 일치: casefold한 텍스트 → 첫 번째 인덱스 해시맵
+    - 조회 텍스트를 포함하는 디자인 텍스트: 1/2-gram 역색인 (인덱스 오름차순 포스팅)
+    - 조회 텍스트에 포함되는 디자인 텍스트: 디자인에 존재하는 길이의 부분 문자열만 해시 조회
+
+    포함 관계 조회에는 찾을 디자인 텍스트의 길이 범위(min_length/max_length)를,
+    순서 있는 조회에는 찾을 인덱스 구간(ranges, 서브트리의 연속 구간 등)을 줄 수 있습니다.
+    """
+
+    def __init__(self, texts: Sequence[str]):
+        self.texts: List[str] = list(texts)
+        self.folded: List[str] = [text.casefold() for text in self.texts]
+
+        # casefold한 텍스트 → 같은 텍스트의 인덱스들 (오름차순)
+        self._exact: Dict[str, List[int]] = {}
+        self._postings: Dict[str, List[int]] = {}
+        for index, text in enumerate(self.folded):
+            same = self._exact.get(text)
+            if same is None:
+                self._exact[text] = [index]
+            else:
+                same.append(index)
+            grams = set(ngrams(text))
+            if len(text) >= 2:
+                grams.update(text)
+            for gram in grams:
+                posting = self._postings.get(gram)
+                if posting is None:
+                    self._postings[gram] = [index]
+                else:
+                    posting.append(index)
+        self._lengths: List[int] = sorted({len(text) for text in self._exact})
+        # n-gram → (텍스트 길이 순으로 정렬한 포스팅, 그 길이들), 길이 순 조회에서 처음 쓸 때 만듦
+        self._length_postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        # 인덱스 구간 → 구간 안 텍스트 (범위 지정 조회에서 처음 쓸 때 만듦)
+        self._scopes: Dict[Ranges, _ScopeTexts] = {}
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def equal(self, query: str, limit: Optional[int] = None, ranges: Optional[Ranges] = None) -> List[int]:
+        """casefold 기준으로 query와 같은 텍스트 인덱스 (오름차순, 최대 limit개)"""
+        same = self._exact.get(query.casefold(), [])
+        if ranges is None:
+            return same[:limit]
+        return list(islice(within_ranges(same, ranges), limit))
+
+    def find_all(self, query: str, min_length: int = 0, max_length: Optional[int] = None) -> List[int]:
+        """query와 같거나 포함 관계인 모든 텍스트의 인덱스 (오름차순)
+
+        max_length는 query를 포함하는 텍스트에, min_length는 query에 포함되는 텍스트에 적용됩니다.
+        """
+        folded = query.casefold()
+        found = set(self._all_containing(folded, max_length))
+        found.update(self._all_contained_in(folded, min_length))
+        return sorted(found)
+
+    def containing_by_length(self, query: str, max_length: Optional[int] = None,
+                             per_length: Optional[int] = None, ranges: Optional[Ranges] = None) -> Iterator[int]:
+        """query를 포함하는 텍스트 인덱스를 짧은 텍스트부터 (같은 길이는 인덱스 순으로 최대 per_length개)
+
+        포함 비율은 포함하는 텍스트가 짧을수록 높으므로 앞에서 몇 개만 읽어도 가장 비슷한 후보가 나옵니다.
+        """
+        return self._iter_containing_by_length(query.casefold(), max_length, per_length, ranges)
+
+    def contained_by_length(self, query: str, min_length: int = 0,
+                            per_length: Optional[int] = None, ranges: Optional[Ranges] = None) -> Iterator[int]:
+        """query 안에 포함되는 텍스트 인덱스를 긴 텍스트부터 (같은 길이는 인덱스 순으로 최대 per_length개)"""
+        return self._iter_contained_by_length(query.casefold(), min_length, per_length, ranges)
+
+    def _shortest_posting(self, folded: str) -> Optional[List[int]]:
+        shortest = None
+        for gram in ngrams(folded):
+            posting = self._postings.get(gram)
+            if posting is None:
+                return None
+            if shortest is None or len(posting) < len(shortest):
+                shortest = posting
+        return shortest
+
+    def _all_containing(self, folded: str, max_length: Optional[int] = None) -> List[int]:
+        texts = self.folded
+        if not folded:
+            indices = range(len(texts))
+        else:
+            indices = self._shortest_posting(folded)
+            if indices is None:
+                return []
+            if len(folded) <= 2 and max_length is None:
+                return indices
+        return [index for index in indices
+                if (max_length is None or len(texts[index]) <= max_length) and folded in texts[index]]
+
+    def _length_sorted_posting(self, folded: str) -> Optional[Tuple[List[int], List[int]]]:
+        """folded의 n-gram 중 가장 짧은 포스팅을 (길이, 인덱스) 순으로 정렬한 것과 길이 목록"""
+        grams = ngrams(folded)
+        postings = [self._postings.get(gram) for gram in grams]
+        if any(posting is None for posting in postings):
+            return None
+        gram = min(zip(grams, postings), key=lambda item: len(item[1]))[0]
+        cached = self._length_postings.get(gram)
+        if cached is None:
+            texts = self.folded
+            # 정렬이 안정적이므로 같은 길이 안에서는 인덱스 오름차순 유지
+            posting = sorted(self._postings[gram], key=lambda index: len(texts[index]))
+            cached = self._length_postings[gram] = (posting, [len(texts[index]) for index in posting])
+        return cached
+
+    def _iter_containing_by_length(self, folded: str, max_length: Optional[int] = None,
+                                   per_length: Optional[int] = None,
+                                   ranges: Optional[Ranges] = None) -> Iterator[int]:
+        texts = self.folded
+        posting = self._shortest_posting(folded) if folded else range(len(texts))
+        if posting is None:
+            return
+        if ranges is not None and sum(end - start for start, end in ranges) < len(posting):
+            # 구간이 포스팅보다 작으면 구간 안의 텍스트를 직접 훑음
+            scope = self._scope_texts(ranges)
+            ordered, lengths = scope.ordered, scope.lengths
+            ranges = None
+        elif not folded:
+            ordered = sorted(posting, key=lambda index: len(texts[index]))
+            lengths = [len(texts[index]) for index in ordered]
+        else:
+            ordered, lengths = self._length_sorted_posting(folded)
+        position = bisect_left(lengths, len(folded))
+        end = len(ordered) if max_length is None else bisect_right(lengths, max_length)
+        while position < end:
+            length_end = bisect_right(lengths, lengths[position], position, end)
+            count = 0
+            # 같은 길이 안에서는 인덱스 오름차순
+            if ranges is None:
+                block = ordered[position:length_end]
+            else:
+                block = within_ranges(ordered, ranges, position, length_end)
+            for index in block:
+                if folded in texts[index]:
+                    yield index
+                    count += 1
+                    if count == per_length:
+                        break
+            position = length_end
+
+    def _scope_texts(self, ranges: Ranges) -> '_ScopeTexts':
+        scope = self._scopes.get(ranges)
+        if scope is None:
+            scope = self._scopes[ranges] = _ScopeTexts(self.folded, ranges)
+        return scope
+
+    def _iter_contained_by_length(self, folded: str, min_length: int = 0,
+                                  per_length: Optional[int] = None,
+                                  ranges: Optional[Ranges] = None) -> Iterator[int]:
+        exact = self._exact
+        # 구간이 있으면 구간 안에 있는 텍스트와 그 길이만 시도
+        if ranges is None:
+            present, lengths = exact, self._lengths
+        else:
+            scope = self._scope_texts(ranges)
+            present, lengths = scope.texts, scope.distinct_lengths
+        for length in reversed(self._length_range(min_length, len(folded), lengths)):
+            # 서로 다른 부분 문자열의 인덱스 목록은 겹치지 않고 각각 오름차순
+            same = [within_ranges(exact[part], ranges) for part in dict.fromkeys(folded[start:start + length]
+                                                                           for start in range(len(folded) - length + 1))
+                    if part in present]
+            yield from islice(merge(*same), per_length)
+
+    def _length_range(self, min_length: int, max_length: int, lengths: Optional[List[int]] = None) -> List[int]:
+        """색인에 있는 (또는 lengths의) 텍스트 길이 중 [min_length, max_length] 범위"""
+        if lengths is None:
+            lengths = self._lengths
+        return lengths[bisect_left(lengths, min_length):bisect_right(lengths, max_length)]
+
+    def _all_contained_in(self, folded: str, min_length: int = 0) -> List[int]:
+        """folded에 포함되는 텍스트 인덱스 (정렬 안 됨)"""
+        exact = self._exact
+        found = []
+        for length in self._length_range(min_length, len(folded)):
+            for start in range(len(folded) - length + 1):
+                same = exact.get(folded[start:start + length])
+                if same is not None:
+                    found.extend(same)
+        return found
+
+
+class _ScopeTexts:
+    """인덱스 구간 안의 텍스트 (길이 순 인덱스, 서로 다른 길이, 텍스트 집합)"""
+    __slots__ = ('ordered', 'lengths', 'distinct_lengths', 'texts')
+
+    def __init__(self, folded: Sequence[str], ranges: Ranges):
+        # 정렬이 안정적이므로 같은 길이 안에서는 인덱스 오름차순 유지
+        self.ordered: List[int] = sorted((index for start, end in ranges for index in range(start, end)),
+                                         key=lambda index: len(folded[index]))
+        self.lengths: List[int] = [len(folded[index]) for index in self.ordered]
+        self.distinct_lengths: List[int] = sorted(set(self.lengths))
+        self.texts: Set[str] = {folded[index] for index in self.ordered}
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""설계서 텍스트와 디자인 텍스트 매칭 엔진
+
+후보는 아래 단계 순으로 순위를 매깁니다 (같은 단계에서는 점수, 프레임 근접성, 문서 순서).
+1. exact: casefold 기준 완전 일치
+2. normalized: 유니코드 정규화(NFKC, 전각 문자/NFD 통일) + 공백 무시 후 일치
+3. partial: 정규화한 텍스트끼리 포함 관계 (짧은 텍스트는 긴 쪽의 일정 비율 이상일 때만)
+4. fuzzy: 2-gram Dice 유사도가 기준 이상 (n-gram 역색인 + 길이/prefix 필터로 후보만 비교)
+"""
+import math
+import re
+import unicodedata
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from text_index import Ranges, TextIndex, ngrams, within_ranges
+
+MATCH_TYPES = ('exact', 'normalized', 'partial', 'fuzzy')
+_TYPE_RANK = {match_type: rank for rank, match_type in enumerate(MATCH_TYPES)}
+
+# 매칭 단계마다 순위를 매길 최대 후보 수 (점수가 높은 순, 같은 점수는 문서 순서로 앞에서부터)
+# 흔한 짧은 텍스트는 일치/포함 후보가 수천 개일 수 있어 조회 비용을 제한합니다.
+CANDIDATE_LIMIT = 64
+
+_WHITESPACE = re.compile(r'\s+')
+_EPSILON = 1e-9
+
+
+def normalize_text(text: str, ignore_whitespace: bool = True) -> str:
+    """NFKC 정규화 + casefold (+ 공백 제거)"""
+    text = unicodedata.normalize('NFKC', text).casefold()
+    if ignore_whitespace:
+        text = _WHITESPACE.sub('', text)
+    return text
+
+
+class TextMatcher:
+    """매칭 규칙 설정 (index()로 디자인 텍스트 색인을 만들어 조회)
+
+    unicode_normalize: NFKC 정규화 사용 여부 (False면 casefold만)
+    ignore_whitespace: 공백을 무시하고 비교
+    short_length, short_coverage: 길이가 short_length 이하인 텍스트는 상대 텍스트 길이의
+        short_coverage 이상일 때만 포함 관계로 인정 ("생성"이 "생성형AI캠페인"에 매칭되는 것 방지)
+    fuzzy_threshold: 2-gram Dice 유사도 기준 (None이면 유사도 매칭 안 함)
+    fuzzy_min_length: 이보다 짧은 텍스트는 유사도 매칭 안 함
+    """
+
+    def __init__(self, unicode_normalize: bool = True, ignore_whitespace: bool = True,
+                 short_length: int = 2, short_coverage: float = 0.5,
+                 fuzzy_threshold: Optional[float] = None, fuzzy_min_length: int = 3):
+        if fuzzy_threshold is not None and not 0 < fuzzy_threshold <= 1:
+            raise ValueError("fuzzy_threshold는 0보다 크고 1 이하여야 합니다.")
+        self.unicode_normalize = unicode_normalize
+        self.ignore_whitespace = ignore_whitespace
+        self.short_length = short_length
+        self.short_coverage = short_coverage
+        self.fuzzy_threshold = fuzzy_threshold
+        self.fuzzy_min_length = fuzzy_min_length
+
+    @property
+    def signature(self) -> str:
+        """매칭 결과에 영향을 주는 설정 (스냅샷 호환성 확인용)"""
+        return (f"nfkc={int(self.unicode_normalize)},ws={int(self.ignore_whitespace)},"
+                f"short={self.short_length}/{self.short_coverage},"
+                f"fuzzy={self.fuzzy_threshold}/{self.fuzzy_min_length}")
+
+    def normalize(self, text: str) -> str:
+        if self.unicode_normalize:
+            return normalize_text(text, self.ignore_whitespace)
+        text = text.casefold()
+        return _WHITESPACE.sub('', text) if self.ignore_whitespace else text
+
+    def index(self, texts: Sequence[str], groups: Optional[Sequence[str]] = None) -> 'MatchIndex':
+        return MatchIndex(self, texts, groups)
+
+
+# 이름으로 고르는 매칭 설정
+MATCHER_PRESETS = ('exact', 'normalized', 'fuzzy')
+DEFAULT_FUZZY_THRESHOLD = 0.7
+
+
+def get_matcher(name: str = 'normalized', fuzzy_threshold: float = DEFAULT_FUZZY_THRESHOLD) -> TextMatcher:
+    """exact: 이전 방식 (casefold 일치/포함만), normalized: 정규화 + 공백 무시, fuzzy: normalized + 유사도"""
+    if name == 'exact':
+        return TextMatcher(unicode_normalize=False, ignore_whitespace=False, short_coverage=0)
+    if name == 'normalized':
+        return TextMatcher()
+    if name == 'fuzzy':
+        return TextMatcher(fuzzy_threshold=fuzzy_threshold)
+    raise ValueError(f"알 수 없는 매칭 방식입니다: {name}")
+
+
+class MatchIndex:
+    """디자인 텍스트 색인 (디자인 하나당 한 번 만들어 모든 설계서 항목 조회에 재사용)
+
+    groups는 텍스트별 그룹 키(프레임 등)로, resolve()에서 같은 그룹의 후보를 우선할 때 씁니다.
+    조회마다 scope(텍스트 인덱스 구간 [start, end)들의 튜플)를 주면 그 안의 텍스트만 후보로 삼습니다.
+    """
+
+    def __init__(self, matcher: TextMatcher, texts: Sequence[str], groups: Optional[Sequence[str]] = None):
+        self.matcher = matcher
+        self.texts: List[str] = list(texts)
+        self.groups: Optional[List[str]] = list(groups) if groups is not None else None
+        self._raw = TextIndex(self.texts)
+        self.normalized: List[str] = [matcher.normalize(text) for text in self.texts]
+        if self.normalized == self._raw.folded:
+            self._normalized = self._raw
+        else:
+            self._normalized = TextIndex(self.normalized)
+        # 유사도 매칭용 색인 (fuzzy_threshold가 있을 때만)
+        self._fuzzy: Optional[_FuzzyIndex] = None
+        # (정규화한 조회 텍스트, 인덱스 구간) → (인덱스, 점수)
+        self._fuzzy_cache: Dict[Tuple[str, Optional[Ranges]], List[Tuple[int, float]]] = {}
+        self._candidate_cache: Dict[Tuple[str, int, Optional[Ranges]], List[Tuple[int, str, float]]] = {}
+        if matcher.fuzzy_threshold is not None:
+            self._fuzzy = _FuzzyIndex(self.normalized, matcher.fuzzy_min_length)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def find_first(self, query: str) -> Optional[Tuple[int, str, float]]:
+        """순위가 가장 높은 디자인 텍스트를 (인덱스, 매칭 종류, 점수)로 반환"""
+        candidates = self.candidates(query, 1)
+        return candidates[0] if candidates else None
+
+    def candidates(self, query: str, limit: int = CANDIDATE_LIMIT, normalized: Optional[str] = None,
+                   scope: Optional[Ranges] = None) -> List[Tuple[int, str, float]]:
+        """query와 매칭되는 디자인 텍스트를 순위대로 (매칭 단계 → 점수 → 문서 순서)
+
+        단계마다 점수가 높은 후보부터 최대 limit개까지만 모으고 (같은 점수는 문서 순서),
+        앞 단계에서 limit개가 차면 다음 단계는 건너뜁니다. 같은 조회는 캐시합니다.
+        normalized는 미리 계산해 둔 query의 정규화 결과입니다 (없으면 여기서 계산).
+        """
+        key = (query, limit, scope)
+        cached = self._candidate_cache.get(key)
+        if cached is not None:
+            return cached
+
+        ranked: List[Tuple[int, str, float]] = []
+        seen: Set[int] = set()
+
+        def add(scored, match_type):
+            tier = sorted(((index, match_type, score) for index, score in scored if index not in seen),
+                          key=lambda candidate: (-candidate[2], candidate[0]))[:limit]
+            seen.update(index for index, _, _ in tier)
+            ranked.extend(tier)
+            return len(ranked) >= limit
+
+        if normalized is None:
+            normalized = self.matcher.normalize(query)
+        texts = self.normalized
+        exact = self._raw.equal(query, limit, scope)
+        if not add(((index, 1.0) for index in exact), 'exact') and normalized:
+            same = self._normalized.equal(normalized, limit + len(exact), scope)
+            if not add(((index, 1.0) for index in same), 'normalized'):
+                # 앞 단계 후보와 겹칠 수 있으므로 그만큼 더 모음
+                partial = self._partial_scores(normalized, limit + len(seen), scope)
+                if not add(partial.items(), 'partial') and self._fuzzy is not None:
+                    add(self._fuzzy_scores(normalized, scope), 'fuzzy')
+
+        ranked = ranked[:limit]
+        self._candidate_cache[key] = ranked
+        return ranked
+
+    def resolve(self, queries: Sequence[str], top_k: int = 1,
+                scope: Optional[Ranges] = None) -> List[List[Tuple[int, str, float]]]:
+        """설계서 항목 하나의 필요 텍스트들을 한 번에 순위 매겨 텍스트별 상위 top_k개 반환
+
+        매칭 단계와 점수가 같은 후보끼리는 같은 항목의 필요 텍스트들이 가장 많이 모인
+        그룹(프레임)에 있는 후보를 우선하고, 그다음은 문서 순서입니다.
+        """
+        return self.rank([self.candidates(query, scope=scope) for query in queries], top_k)
+
+    def rank(self, all_candidates: Sequence[List[Tuple[int, str, float]]],
+             top_k: int = 1) -> List[List[Tuple[int, str, float]]]:
+        """필요 텍스트별 candidates() 결과로 resolve()와 같은 순위 매김 (조회를 미리 해 둔 경우)"""
+        anchor = self._anchor(self._best_groups(candidates) for candidates in all_candidates)
+        return [self._order(candidates, anchor, top_k) for candidates in all_candidates]
+
+    def resolve_shared(self, queries: Sequence[str], query_sets: Sequence[Sequence[int]], top_k: int = 1,
+                       normalized: Optional[Sequence[str]] = None,
+                       scope: Optional[Ranges] = None) -> List[List[List[Tuple[int, str, float]]]]:
+        """여러 항목의 resolve()를 한 번에 (항목끼리 겹치는 필요 텍스트는 한 번만 조회)
+
+        query_sets는 항목별 필요 텍스트의 queries 인덱스 목록이고, normalized는 queries의 정규화 결과입니다.
+        텍스트별 조회와 최선 후보 그룹은 한 번만, 그룹 우선 정렬은 (텍스트, 기준 그룹)마다 한 번만 계산합니다.
+        """
+        candidates: Dict[int, List[Tuple[int, str, float]]] = {}
+        best_groups: Dict[int, Tuple[str, ...]] = {}
+        ordered: Dict[Tuple[int, Optional[str]], List[Tuple[int, str, float]]] = {}
+        resolved = []
+        for query_ids in query_sets:
+            for query_id in query_ids:
+                if query_id not in candidates:
+                    found = candidates[query_id] = self.candidates(
+                        queries[query_id], normalized=None if normalized is None else normalized[query_id],
+                        scope=scope)
+                    best_groups[query_id] = self._best_groups(found)
+            anchor = self._anchor(best_groups[query_id] for query_id in query_ids)
+            ranked = []
+            for query_id in query_ids:
+                key = (query_id, anchor)
+                result = ordered.get(key)
+                if result is None:
+                    result = ordered[key] = self._order(candidates[query_id], anchor, top_k)
+                ranked.append(result)
+            resolved.append(ranked)
+        return resolved
+
+    def _best_groups(self, candidates: List[Tuple[int, str, float]]) -> Tuple[str, ...]:
+        """가장 좋은 (매칭 단계, 점수) 후보들의 그룹 (candidates 앞쪽에 모여 있음)"""
+        groups = self.groups
+        if groups is None or not candidates:
+            return ()
+        best = candidates[0][1:]
+        found: Dict[str, None] = {}
+        for index, match_type, score in candidates:
+            if (match_type, score) != best:
+                break
+            found[groups[index]] = None
+        return tuple(found)
+
+    @staticmethod
+    def _anchor(best_groups) -> Optional[str]:
+        """필요 텍스트마다 최선 후보 그룹에 한 표씩 주어 가장 많이 받은 그룹"""
+        votes: Dict[str, int] = {}
+        for groups in best_groups:
+            for group in groups:
+                votes[group] = votes.get(group, 0) + 1
+        return max(votes, key=votes.get) if votes else None
+
+    def _order(self, candidates: List[Tuple[int, str, float]], anchor: Optional[str],
+               top_k: int) -> List[Tuple[int, str, float]]:
+        if anchor is not None and len(candidates) > 1:
+            groups = self.groups
+            candidates = sorted(candidates, key=lambda candidate: (
+                _TYPE_RANK[candidate[1]], -candidate[2], groups[candidate[0]] != anchor, candidate[0]))
+        return candidates[:top_k]
+
+    def find_all(self, query: str) -> List[int]:
+        """어느 단계로든 query와 매칭되는 모든 텍스트의 인덱스 (오름차순)
+
+        매칭 관계가 대칭이므로 설계서 텍스트 색인에 디자인 텍스트로 조회하는 데도 쓸 수 있습니다.
+        """
+        found: Set[int] = set(self._raw.equal(query))
+        normalized = self.matcher.normalize(query)
+        if normalized:
+            min_length, max_length = self._partial_lengths(normalized)
+            found.update(self._normalized.find_all(normalized, min_length, max_length))
+            if self._fuzzy is not None:
+                found.update(index for index, _ in self._fuzzy_scores(normalized))
+        return sorted(found)
+
+    @staticmethod
+    def _coverage(a: str, b: str) -> float:
+        return min(len(a), len(b)) / max(len(a), len(b), 1)
+
+    def _partial_scores(self, normalized: str, limit: int, scope: Optional[Ranges] = None) -> Dict[int, float]:
+        """포함 관계 후보 → 점수 (포함하는 쪽/포함되는 쪽 각각 점수가 높은 순으로 limit개 이상)
+
+        점수(포함 비율)는 텍스트 길이로만 정해지므로 길이 순으로 길이마다 문서 순서로 limit개까지 읽다가,
+        limit개를 모은 뒤 점수가 바뀌면 멈춥니다 (반올림해 같은 점수가 된 길이들까지는 모음).
+        """
+        texts = self.normalized
+        min_length, max_length = self._partial_lengths(normalized)
+        scores: Dict[int, float] = {}
+        for found in (self._normalized.containing_by_length(normalized, max_length, limit, scope),
+                      self._normalized.contained_by_length(normalized, min_length, limit, scope)):
+            count = 0
+            last = None
+            for index in found:
+                score = round(self._coverage(normalized, texts[index]), 3)
+                if count >= limit and score != last:
+                    break
+                scores.setdefault(index, score)
+                count += 1
+                last = score
+        return scores
+
+    def _partial_lengths(self, normalized: str) -> Tuple[int, Optional[int]]:
+        """포함 관계로 인정할 상대 텍스트 길이 (query에 포함될 최소 길이, query를 포함할 최대 길이)"""
+        matcher = self.matcher
+        length = len(normalized)
+        if not matcher.short_coverage:
+            return 1, None
+        # query가 짧으면 상대(포함하는 쪽)가 너무 길면 안 됨
+        max_length = None
+        if length <= matcher.short_length:
+            max_length = math.floor(length / matcher.short_coverage)
+        # 상대(포함되는 쪽)가 짧으면 query 길이의 일정 비율 이상이어야 함
+        min_length = max(1, min(matcher.short_length + 1, math.ceil(length * matcher.short_coverage)))
+        return min_length, max_length
+
+    def _fuzzy_scores(self, normalized: str, scope: Optional[Ranges] = None) -> List[Tuple[int, float]]:
+        """Dice 유사도가 기준 이상인 (인덱스, 점수), 같은 조회는 캐시"""
+        key = (normalized, scope)
+        scores = self._fuzzy_cache.get(key)
+        if scores is None:
+            scores = []
+            if len(normalized) >= self.matcher.fuzzy_min_length:
+                for unique_id, score in self._fuzzy.scores(normalized, self.matcher.fuzzy_threshold, scope):
+                    scores.extend((index, score) for index in within_ranges(self._fuzzy.indices[unique_id], scope))
+            self._fuzzy_cache[key] = scores
+        return scores
+
+
+class _FuzzyIndex:
+    """유사도 매칭용 2-gram 역색인
+
+    같은 정규화 텍스트는 한 번만 색인하고, 포스팅은 2-gram 수 순으로 정렬해
+    길이 필터 범위만 잘라 씁니다. 전체 비교 대신 후보만 모읍니다.
+    - 길이 필터: 유사도 t 이상이려면 상대 2-gram 수 h가 [t·g/(2-t), (2-t)·g/t] 범위
+    - prefix 필터: 최소 o개가 겹쳐야 하면 가장 드문 (g - o + 1)개 2-gram 중 하나는 반드시 포함
+    """
+
+    def __init__(self, normalized: Sequence[str], min_length: int):
+        self.keys: List[str] = []
+        self.indices: List[List[int]] = []
+        self.counts: List[int] = []
+        # 텍스트 인덱스 → 고유 텍스트 ID (색인하지 않은 짧은 텍스트는 -1)
+        self.unique_ids: List[int] = [-1] * len(normalized)
+        # 인덱스 구간 → 구간 안 고유 텍스트 ID들 (범위 지정 조회용)
+        self._scope_ids: Dict[Ranges, Set[int]] = {}
+        unique_ids: Dict[str, int] = {}
+        postings: Dict[str, List[int]] = {}
+        for index, text in enumerate(normalized):
+            if len(text) < min_length:
+                continue
+            unique_id = unique_ids.get(text)
+            if unique_id is not None:
+                self.indices[unique_id].append(index)
+                self.unique_ids[index] = unique_id
+                continue
+            unique_id = unique_ids[text] = self.unique_ids[index] = len(self.keys)
+            self.keys.append(text)
+            self.indices.append([index])
+            grams = set(ngrams(text))
+            self.counts.append(len(grams))
+            for gram in grams:
+                posting = postings.get(gram)
+                if posting is None:
+                    postings[gram] = [unique_id]
+                else:
+                    posting.append(unique_id)
+
+        counts = self.counts
+        self._postings: Dict[str, List[int]] = {}
+        self._posting_counts: Dict[str, List[int]] = {}
+        for gram, posting in postings.items():
+            posting.sort(key=counts.__getitem__)
+            self._postings[gram] = posting
+            self._posting_counts[gram] = [counts[unique_id] for unique_id in posting]
+
+    def scores(self, text: str, threshold: float, scope: Optional[Ranges] = None) -> List[Tuple[int, float]]:
+        """(고유 텍스트 ID, 점수) 목록 (scope가 있으면 그 구간에 인덱스가 하나라도 있는 텍스트만)"""
+        grams = set(ngrams(text))
+        gram_count = len(grams)
+        # 부동소수점 오차로 경계값이 빠지지 않도록 여유를 둠
+        min_count = math.ceil(threshold * gram_count / (2 - threshold) - _EPSILON)
+        max_count = math.floor((2 - threshold) * gram_count / threshold + _EPSILON)
+        min_overlap = math.ceil(threshold * (gram_count + min_count) / 2 - _EPSILON)
+
+        ranges = []
+        for gram in grams:
+            posting_counts = self._posting_counts.get(gram)
+            if posting_counts is None:
+                ranges.append((gram, 0, 0))
+                continue
+            ranges.append((gram, bisect_left(posting_counts, min_count), bisect_right(posting_counts, max_count)))
+        ranges.sort(key=lambda item: item[2] - item[1])
+
+        candidates: Set[int] = set()
+        for gram, low, high in ranges[:gram_count - min_overlap + 1]:
+            if high > low:
+                candidates.update(self._postings[gram][low:high])
+
+        if scope is not None:
+            candidates &= self._scope_unique_ids(scope)
+
+        keys, counts = self.keys, self.counts
+        scores = []
+        for unique_id in candidates:
+            score = 2 * len(grams.intersection(ngrams(keys[unique_id]))) / (gram_count + counts[unique_id])
+            if score >= threshold - _EPSILON:
+                scores.append((unique_id, round(score, 3)))
+        return scores
+
+    def _scope_unique_ids(self, scope: Ranges) -> Set[int]:
+        found = self._scope_ids.get(scope)
+        if found is None:
+            unique_ids = self.unique_ids
+            found = self._scope_ids[scope] = {unique_ids[index] for start, end in scope for index in range(start, end)}
+        return found
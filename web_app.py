@@ -1,16 +1,49 @@
 #!/usr/bin/env python3
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, Response, render_template, request, jsonify, send_file
+from werkzeug.exceptions import HTTPException
+import asyncio
 import json
 import re
-import requests
 import os
+from urllib.parse import urlparse, parse_qs
 from datetime import datetime
+from check_metrics import CheckMetrics, MetricsRegistry
 from design_checker import DesignChecker
-import tempfile
-import zipfile
-import io
+from extraction_cache import ExtractionCache
+from figma_api import get_figma_json, get_figma_file_meta
+from job_queue import JobQueue
+from report_writer import iter_html_report, iter_report_data
+from contextlib import nullcontext
 
 app = Flask(__name__)
+# 요청 본문 크기 제한 (넘으면 413)
+app.config['MAX_CONTENT_LENGTH'] = int(os.environ.get('MAX_REQUEST_MB', '16')) * 1024 * 1024
+
+# /analyze가 결과를 기다리는 최대 시간 (초과하면 504와 함께 작업 ID를 반환해 /jobs로 이어서 조회)
+ANALYSIS_TIMEOUT = float(os.environ.get('ANALYSIS_TIMEOUT', '300'))
+
+# async 뷰는 flask[async](asgiref)가 있을 때만 등록
+try:
+    import asgiref  # noqa: F401
+    ASYNC_VIEWS = True
+except ImportError:
+    ASYNC_VIEWS = False
+
+# 파일 버전별 추출 결과 캐시 (같은 버전을 다시 분석할 때 다운로드와 추출 생략)
+extraction_cache = ExtractionCache(
+    os.environ.get('FIGMA_CACHE_DIR', '.figma_cache'),
+    max_bytes=int(os.environ.get('FIGMA_CACHE_MAX_MB', '512')) * 1024 * 1024
+)
+
+# 컴파일된 설계서 저장 위치 (워커 프로세스들이 설계서를 한 번만 컴파일하도록 공유)
+SPEC_CACHE_DIR = os.environ.get('SPEC_CACHE_DIR', os.path.join(extraction_cache.cache_dir, 'specs'))
+
+# 분석 작업 큐 (/analyze, /jobs: 동시에 실행하는 분석 수를 ANALYSIS_WORKERS로 제한)
+# 작업 상태와 아래 측정값은 프로세스 메모리에 있으므로 serve.py는 기본으로 프로세스 하나로 실행
+job_queue = JobQueue(workers=int(os.environ.get('ANALYSIS_WORKERS', '2')))
+
+# 분석 단계별 측정값 누적 (/metrics)
+metrics_registry = MetricsRegistry()
 
 def extract_figma_file_key(url):
     """피그마 URL에서 파일 키를 추출"""
@@ -21,72 +54,115 @@ def extract_figma_file_key(url):
         return match.group(1)
     return None
 
-def get_figma_json(file_key, access_token):
-    """피그마 API를 사용해서 JSON 데이터 가져오기"""
-    url = f"https://api.figma.com/v1/files/{file_key}"
-    headers = {
-        "X-Figma-Token": access_token
-    }
-    
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"피그마 API 요청 실패: {str(e)}")
-
-def save_json_to_file(data, filename):
-    """JSON 데이터를 파일로 저장"""
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+def extract_figma_node_ids(url):
+    """피그마 URL의 node-id 파라미터를 API 노드 ID 목록으로 변환 (1-2 → 1:2)"""
+    query = parse_qs(urlparse(url).query)
+    return [node_id.replace('-', ':') for value in query.get('node-id', []) for node_id in value.split(',') if node_id]
 
 @app.route('/')
 def index():
     return render_template('index.html')
 
-@app.route('/analyze', methods=['POST'])
-def analyze():
+def parse_analysis_request(form):
+    """분석 요청 폼 검증 후 (파일 키, 노드 ID 목록, 토큰) 반환, 오류면 (None, 오류 메시지)"""
+    figma_url = form.get('figma_url')
+    access_token = form.get('access_token')
+    
+    if not figma_url or not access_token:
+        return None, '피그마 URL과 액세스 토큰을 모두 입력해주세요.'
+    
+    # 파일 키 추출
+    file_key = extract_figma_file_key(figma_url)
+    if not file_key:
+        return None, '올바른 피그마 URL을 입력해주세요.'
+    
+    # URL에 node-id가 있으면 해당 노드 하위만 받음
+    return (file_key, extract_figma_node_ids(figma_url), access_token), None
+
+def run_analysis(file_key, node_ids, access_token, file_meta, progress=None):
+    """다운로드 → 추출 → 비교 → 결과 생성까지 분석 파이프라인 실행
+
+    progress(stage, **details)는 단계가 바뀔 때마다 호출됩니다.
+    단계별 측정값은 결과의 'metrics'에 담고 metrics_registry에도 누적합니다 (실패해도 누적).
+    """
+    metrics = CheckMetrics()
     try:
-        figma_url = request.form.get('figma_url')
-        access_token = request.form.get('access_token')
-        
-        if not figma_url or not access_token:
-            return jsonify({'error': '피그마 URL과 액세스 토큰을 모두 입력해주세요.'}), 400
-        
-        # 파일 키 추출
-        file_key = extract_figma_file_key(figma_url)
-        if not file_key:
-            return jsonify({'error': '올바른 피그마 URL을 입력해주세요.'}), 400
-        
-        # 피그마 JSON 가져오기
-        figma_data = get_figma_json(file_key, access_token)
-        
-        # 임시 파일로 저장
-        temp_file = f"temp_figma_{file_key}.json"
-        save_json_to_file(figma_data, temp_file)
-        
-        # 디자인 검수 실행
-        checker = DesignChecker()
-        design_elements = checker.extract_design_elements(temp_file)
+        result = _run_analysis(file_key, node_ids, access_token, file_meta, progress, metrics)
+    except Exception:
+        metrics_registry.observe(metrics, failed=True)
+        raise
+    metrics_registry.observe(metrics)
+    result['metrics'] = metrics.to_dict()
+    return result
+
+def _run_analysis(file_key, node_ids, access_token, file_meta, progress, metrics):
+    progress = progress or (lambda stage, **details: None)
+    cache_key = f"{file_key}?ids={','.join(node_ids)}" if node_ids else file_key
+    
+    # 같은 버전의 추출 결과가 캐시에 있으면 다운로드와 추출 생략
+    # (다른 워커가 같은 버전을 추출 중이면 기다렸다가 그 결과를 mmap으로 공유)
+    checker = DesignChecker(spec_cache_dir=SPEC_CACHE_DIR)
+    version = ExtractionCache.version_key(file_meta)
+    with extraction_cache.lock(cache_key, version) if version else nullcontext():
+        design_elements = extraction_cache.get(cache_key, version) if version else None
         
-        # 명세서 로드 (기본 명세서 사용)
-        spec_file = "specification.json"
-        if os.path.exists(spec_file):
-            spec_elements = checker.load_specification_from_file(spec_file)
-            checker.match_design_with_spec()
-            report = checker.generate_report()
+        if design_elements is None:
+            # 피그마 JSON 가져오기 (확인한 버전으로 고정, 벡터 기하 정보 제외)
+            progress('download')
+            with metrics.stage('download') as stage:
+                download_stats = {'bytes': 0}
+                figma_data = get_figma_json(file_key, access_token, ids=node_ids or None,
+                                            version=file_meta.get('version'), stats=download_stats)
+                stage.bytes_read = download_stats['bytes']
+            
+            # 디자인 검수 실행 (받은 문서를 디스크에 쓰지 않고 바로 추출)
+            progress('extract')
+            with metrics.stage('extract') as stage:
+                stats = {'nodes': 0}
+                design_elements = checker.extract_design_elements(figma_data, stats=stats)
+                stage.nodes = stats['nodes']
+                stage.items = len(design_elements)
+                
+                version = version or ExtractionCache.version_key(figma_data)
+                if version:
+                    # 저장한 파일을 mmap으로 열어 사용 (추출한 목록은 여기서 해제)
+                    design_elements = extraction_cache.put(cache_key, version, design_elements) or design_elements
         else:
-            # 기본 명세서가 없으면 디자인 요소만 분석
-            report = {
-                'total_elements': len(design_elements),
-                'text_elements': [elem.text_content for elem in design_elements if elem.text_content.strip()],
-                'timestamp': datetime.now().strftime('%Y년 %m월 %d일 %H:%M:%S')
-            }
-        
-        # 임시 파일 삭제
-        os.remove(temp_file)
-        
-        return jsonify({
+            progress('extract', cached=True)
+    
+    # 명세서 로드 (기본 명세서 사용)
+    spec_file = "specification.json"
+    progress('compare', text_elements=len(design_elements))
+    if os.path.exists(spec_file):
+        checker.design_elements = design_elements
+        with metrics.stage('spec') as stage:
+            checker.spec_elements = checker.load_compiled_specification(spec_file)
+            stage.items = len(checker.spec_elements)
+            stage.bytes_read = os.path.getsize(spec_file)
+        with metrics.stage('compare') as stage:
+            matches, issues = checker.compare_elements()
+            stage.items = len(checker.spec_elements)
+        report = {
+            'total_elements': len(design_elements),
+            'spec_items': len(matches) + len(issues),
+            'complete': sum(1 for m in matches if m['status'] == 'complete'),
+            'partial': sum(1 for m in matches if m['status'] == 'partial'),
+            'missing': len(issues),
+            'matches': matches,
+            'issues': issues,
+            'timestamp': datetime.now().strftime('%Y년 %m월 %d일 %H:%M:%S')
+        }
+    else:
+        # 기본 명세서가 없으면 디자인 요소만 분석
+        report = {
+            'total_elements': len(design_elements),
+            'text_elements': [elem.text_content for elem in design_elements if elem.text_content.strip()],
+            'timestamp': datetime.now().strftime('%Y년 %m월 %d일 %H:%M:%S')
+        }
+    
+    progress('render')
+    with metrics.stage('render') as stage:
+        result = {
             'success': True,
             'report': report,
             'design_elements': [
@@ -97,11 +173,135 @@ def analyze():
                     'path': elem.path
                 } for elem in design_elements
             ]
-        })
+        }
+        stage.items = len(result['design_elements'])
+    return result
+
+def submit_analysis(file_key, node_ids, access_token, file_meta):
+    """분석 작업 등록 (같은 파일 버전의 진행 중 작업은 공유)"""
+    version = ExtractionCache.version_key(file_meta) or datetime.now().isoformat()
+    job_key = f"{file_key}?ids={','.join(node_ids)}@{version}"
+    return job_queue.submit(job_key, lambda job: run_analysis(
+        file_key, node_ids, access_token, file_meta, progress=job.set_stage))
+
+def analysis_response(job):
+    """기다린 작업의 결과 응답 (아직 안 끝났으면 504와 작업 상태)"""
+    if not job.done:
+        data = job.to_dict(include_result=False)
+        data['error'] = f'{ANALYSIS_TIMEOUT:g}초 안에 분석이 끝나지 않았습니다. /jobs/{job.id}에서 결과를 확인해주세요.'
+        return jsonify(data), 504
+    if job.status == 'error':
+        return jsonify({'error': job.error}), 500
+    return jsonify(job.result)
+
+@app.route('/analyze', methods=['POST'])
+def analyze():
+    try:
+        parsed, error = parse_analysis_request(request.form)
+        if error:
+            return jsonify({'error': error}), 400
+        
+        file_key, node_ids, access_token = parsed
+        
+        # 문서 없이 버전만 먼저 확인
+        file_meta = get_figma_file_meta(file_key, access_token)
+        # 분석은 작업 큐 워커에서 실행하고 요청은 제한 시간까지만 기다림
+        job = submit_analysis(file_key, node_ids, access_token, file_meta)
+        job.wait(ANALYSIS_TIMEOUT)
+        return analysis_response(job)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+async def analyze_async():
+    """/analyze의 async 버전 (피그마 요청과 분석 대기를 이벤트 루프 밖 스레드에서 처리)"""
+    try:
+        parsed, error = parse_analysis_request(request.form)
+        if error:
+            return jsonify({'error': error}), 400
+        
+        file_key, node_ids, access_token = parsed
+        file_meta = await asyncio.to_thread(get_figma_file_meta, file_key, access_token)
+        job = submit_analysis(file_key, node_ids, access_token, file_meta)
+        await asyncio.to_thread(job.wait, ANALYSIS_TIMEOUT)
+        return analysis_response(job)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+if ASYNC_VIEWS:
+    app.add_url_rule('/analyze/async', view_func=analyze_async, methods=['POST'])
+
+@app.route('/jobs', methods=['POST'])
+def submit_job():
+    """분석 작업을 등록하고 작업 ID를 바로 반환 (같은 파일 버전의 진행 중 작업은 공유)"""
+    try:
+        parsed, error = parse_analysis_request(request.form)
+        if error:
+            return jsonify({'error': error}), 400
+        
+        file_key, node_ids, access_token = parsed
+        file_meta = get_figma_file_meta(file_key, access_token)
+        job = submit_analysis(file_key, node_ids, access_token, file_meta)
+        return jsonify(job.to_dict(include_result=False)), 202
         
+    except HTTPException:
+        raise
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """작업 상태 조회 (완료되면 분석 결과 포함)"""
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'error': '작업을 찾을 수 없습니다.'}), 404
+    return jsonify(job.to_dict())
+
+@app.route('/jobs/<job_id>/report', methods=['GET'])
+def job_report(job_id):
+    """완료된 작업의 검수 보고서를 조각 단위로 스트리밍 (?format=data이면 NDJSON)"""
+    job = job_queue.get(job_id)
+    if job is None or job.status != 'done':
+        return jsonify({'error': '완료된 작업을 찾을 수 없습니다.'}), 404
+    
+    report = job.result['report']
+    if 'matches' not in report:
+        return jsonify({'error': '설계서 검수 결과가 없는 작업입니다.'}), 404
+    if request.args.get('format') == 'data':
+        return Response(iter_report_data(report['matches'], report['issues']), mimetype='application/x-ndjson')
+    return Response(iter_html_report(report['matches'], report['issues']), mimetype='text/html')
+
+@app.route('/jobs/<job_id>/events', methods=['GET'])
+def job_events(job_id):
+    """작업 진행 상황을 Server-Sent Events로 전송"""
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'error': '작업을 찾을 수 없습니다.'}), 404
+    
+    def stream():
+        for event in job.iter_events():
+            if event is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+    
+    return Response(stream(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
+
+@app.errorhandler(413)
+def request_too_large(e):
+    limit_mb = app.config['MAX_CONTENT_LENGTH'] // (1024 * 1024)
+    return jsonify({'error': f'요청 본문이 너무 큽니다 (최대 {limit_mb}MB).'}), 413
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """분석 단계별 측정값 (Prometheus 텍스트 형식)"""
+    return Response(metrics_registry.render_prometheus(), mimetype='text/plain; version=0.0.4')
+
 @app.route('/download_report', methods=['POST'])
 def download_report():
     try:
@@ -115,6 +315,8 @@ def download_report():
         
         return send_file(filename, as_attachment=True)
         
+    except HTTPException:
+        raise
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -170,4 +372,5 @@ def generate_report_html(report_data):
     )
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # 개발용 서버 (운영 환경에서는 serve.py 사용)
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=5000, threaded=True)